@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""On-disk cache of resolved font paths and pre-rendered surfaces.
+
+Looking a font up by name (pygame.font.SysFont) scans every installed font
+on each launch, and the dice faces and board layer are drawn shape by
+shape. The cache stores the font path found on the first launch and the
+raw pixels of generated surfaces, so later launches open the font file
+directly and load each surface with one read.
+
+Surfaces are stored under a key hashed from everything that affects how
+they look (sizes, colors, layout, font, the drawing code itself), so any
+change simply misses the cache and the surface is drawn and stored again.
+The MAX_SURFACE_VERSIONS most recently used versions of each surface are
+kept, so switching between a few window sizes keeps hitting the cache;
+older ones are deleted.
+
+The cache lives in $SNAKE_LADDER_CACHE, else $XDG_CACHE_HOME/snake_and_ladder,
+else ~/.cache/snake_and_ladder. Errors reading or writing it are ignored;
+the cache is only ever a shortcut.
+"""
+import functools
+import glob
+import hashlib
+import json
+import os
+import struct
+
+import pygame
+
+SURFACE_HEADER = struct.Struct('<4sHH')  # magic, width, height
+SURFACE_MAGIC = b'SLRW'
+FONT_INDEX = 'fonts.json'
+MAX_SURFACE_VERSIONS = 8
+
+def default_cache_dir():
+    if os.environ.get('SNAKE_LADDER_CACHE'):
+        return os.environ['SNAKE_LADDER_CACHE']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'snake_and_ladder')
+
+def content_hash(*parts):
+    """Return a hex digest identifying the given inputs."""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:20]
+
+@functools.lru_cache(maxsize=None)
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:20]
+
+class AssetCache:
+    """Font paths and surfaces cached in a directory; directory=None disables it."""
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.fonts = None
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    def write(self, filename, data):
+        """Write a cache file atomically so a crash never leaves a partial entry."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp = self.path(f"{filename}.{os.getpid()}.tmp")
+            with open(temp, 'wb') as f:
+                f.write(data)
+            os.replace(temp, self.path(filename))
+        except OSError:
+            pass
+
+    def font_path(self, name):
+        """Return the file path of a system font (None for pygame's default font)."""
+        if self.directory is not None and self.fonts is None:
+            try:
+                with open(self.path(FONT_INDEX)) as f:
+                    self.fonts = json.load(f)
+            except (OSError, ValueError):
+                self.fonts = {}
+        if self.fonts is not None and name in self.fonts:
+            path = self.fonts[name]
+            if path is None or os.path.exists(path):
+                return path
+
+        # Scans the installed fonts; done once, then remembered
+        path = pygame.font.match_font(name)
+        if self.directory is not None:
+            self.fonts[name] = path
+            self.write(FONT_INDEX, json.dumps(self.fonts, indent=2).encode())
+        return path
+
+    def font(self, name, size):
+        """Return a pygame Font like pygame.font.SysFont(name, size), without the font scan."""
+        return pygame.font.Font(self.font_path(name), size)
+
+    def surface(self, name, key, draw):
+        """Return the cached surface for (name, key), calling draw() to create it on a miss."""
+        if self.directory is None:
+            return draw()
+        filename = f"{name}-{key}.raw"
+        try:
+            with open(self.path(filename), 'rb') as f:
+                data = f.read()
+            magic, width, height = SURFACE_HEADER.unpack_from(data)
+            if magic == SURFACE_MAGIC:
+                self.hits += 1
+                self.touch(filename)
+                surface = pygame.image.frombytes(data[SURFACE_HEADER.size:], (width, height), 'RGB')
+                return surface.convert() if pygame.display.get_surface() else surface
+        except (OSError, struct.error, ValueError):
+            pass
+
+        self.misses += 1
+        surface = draw()
+        width, height = surface.get_size()
+        self.write(filename, SURFACE_HEADER.pack(SURFACE_MAGIC, width, height) +
+                   pygame.image.tobytes(surface, 'RGB'))
+        self.prune(name)
+        return surface
+
+    def touch(self, filename):
+        """Mark a cache file as recently used, so prune() keeps it."""
+        try:
+            os.utime(self.path(filename))
+        except OSError:
+            pass
+
+    def prune(self, name, keep=MAX_SURFACE_VERSIONS):
+        """Delete all but the `keep` most recently used versions of a surface."""
+        versions = []
+        for path in glob.glob(self.path(f"{name}-*.raw")):
+            try:
+                versions.append((os.stat(path).st_mtime_ns, path))
+            except OSError:
+                pass
+        for _, stale in sorted(versions, reverse=True)[keep:]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
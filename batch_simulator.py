@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Vectorized batch simulator for Snake and Ladder.
+
+Advances many independent games at once as NumPy arrays using the same
+rules as SnakeAndLadderEngine: by default a 6 is needed to enter (landing
+on cell 1), overshooting the last cell means staying put, and a 6 gives an
+extra turn. Dice are drawn in pre-generated blocks of at most
+MAX_BLOCK_DICE values (fewer rolls per block while many games are
+active, but always one roll for each of them), and every move (entering, overshooting, snakes and ladders) is a
+single lookup into the rule variant's transition table, indexed by
+position and roll.
+"""
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+from board_config import BoardConfig
+from rules import CLASSIC_RULES, FORFEIT, SIDES, add_rules_argument, compile_rules
+from snake_ladder_engine import SnakeAndLadderEngine
+
+DICE_BLOCK_SIZE = 64
+MAX_BLOCK_DICE = 1 << 24  # Dice drawn per block at most (16 MB of int8), whatever the game count
+MAX_ROLLS = 100000
+
+# turns: number of dice rolls per game, winners: winning player per game (0 if unfinished),
+# positions: final cell of every seat, shape (games, players)
+BatchResult = namedtuple('BatchResult', ['turns', 'winners', 'positions'])
+
+def build_jump_array(snakes=None, ladders=None, board_size=100):
+    """Return a NumPy array mapping each cell 0..board_size to its final cell."""
+    engine = SnakeAndLadderEngine(snakes=snakes, ladders=ladders, board_size=board_size)
+    return np.asarray(engine.build_jump_table(), dtype=np.int32)
+
+def simulate_games(n_games, total_players=2, snakes=None, ladders=None,
+                   board_size=100, seed=None, block_size=DICE_BLOCK_SIZE,
+                   max_rolls=MAX_ROLLS, rules=CLASSIC_RULES, on_roll=None):
+    """Simulate n_games independent games and return a BatchResult.
+
+    If given, on_roll(games, seats, dice, sixes, start, landed, end) is
+    called after every round of rolls with one array entry per game that
+    rolled: the game indices, 0-based seats, roll totals, number of dice
+    showing a six, and the cells before the roll, landed on, and ended on
+    (like TurnResult). It lets a caller record per-turn data without the
+    simulator keeping any.
+    """
+    if not 1 <= total_players <= 4:
+        raise ValueError(f"total_players must be between 1 and 4, got {total_players}")
+
+    rng = np.random.default_rng(seed)
+    table = compile_rules(BoardConfig(snakes, ladders, board_size), rules)
+    end = np.asarray(table.end, dtype=np.int32)  # [position, roll] -> final cell
+    landed_table = np.asarray(table.landed, dtype=np.int32) if on_roll is not None else None
+    streak_table = np.asarray(table.streak, dtype=np.int8)  # [streak, roll] -> next streak
+    forfeits = rules.forfeit_after is not None
+
+    positions = np.zeros((n_games, total_players), dtype=np.int32)
+    current = np.zeros(n_games, dtype=np.int8)  # 0-based seat of the player to roll
+    streak = np.zeros(n_games, dtype=np.int8)  # extra-turn rolls so far this turn
+    turn_start = np.zeros(n_games, dtype=np.int32)
+    turns = np.zeros(n_games, dtype=np.int32)
+    winners = np.zeros(n_games, dtype=np.int8)
+
+    # Indices of unfinished games
+    active = np.arange(n_games)
+    rolls = 0
+    while active.size and rolls < max_rolls:
+        # Dice for the games active at the start of the block; cols maps each
+        # active game to its column so finished games can be dropped cheaply
+        block_rolls = max(1, min(block_size, MAX_BLOCK_DICE // active.size))
+        dice_block = rng.integers(1, SIDES + 1, size=(block_rolls, active.size), dtype=np.int8)
+        sixes_block = (dice_block == SIDES).astype(np.int8) if on_roll is not None else None
+        for _ in range(rules.dice - 1):
+            die = rng.integers(1, SIDES + 1, size=(block_rolls, active.size), dtype=np.int8)
+            dice_block += die
+            if on_roll is not None:
+                sixes_block += die == SIDES
+        cols = np.arange(active.size)
+
+        for k in range(block_rolls):
+            if not active.size or rolls >= max_rolls:
+                break
+            rolls += 1
+            dice = dice_block[k, cols]
+            seat = current[active]
+            current_pos = positions[active, seat]
+            game_streak = streak[active]
+
+            # Entering, overshooting, snakes and ladders in one lookup
+            new_pos = end[current_pos, dice]
+            next_streak = streak_table[game_streak, dice]
+            if forfeits:
+                # Too many extra turns in a row: back to where the turn started
+                first_roll = game_streak == 0
+                turn_start[active[first_roll]] = current_pos[first_roll]
+                forfeit = next_streak == FORFEIT
+                new_pos = np.where(forfeit, turn_start[active], new_pos)
+                next_streak = np.where(forfeit, 0, next_streak)
+            positions[active, seat] = new_pos
+            turns[active] += 1
+            if on_roll is not None:
+                landed = landed_table[current_pos, dice]
+                if forfeits:
+                    landed = np.where(forfeit, current_pos, landed)
+                on_roll(active, seat, dice, sixes_block[k, cols], current_pos, landed, new_pos)
+
+            # Check win condition
+            won = new_pos >= board_size
+            winners[active[won]] = seat[won] + 1
+
+            # The extra-turn roll (a 6) lets the same player roll again
+            streak[active] = next_streak
+            advance = (next_streak == 0) & ~won
+            current[active[advance]] = (seat[advance] + 1) % total_players
+
+            if won.any():
+                keep = ~won
+                active = active[keep]
+                cols = cols[keep]
+
+    return BatchResult(turns, winners, positions)
+
+def summarize(result, total_players):
+    """Return summary statistics for a BatchResult."""
+    finished = result.winners > 0
+    turns = result.turns[finished]
+    win_counts = np.bincount(result.winners[finished], minlength=total_players + 1)[1:]
+    return {
+        'games': int(result.turns.size),
+        'unfinished': int((~finished).sum()),
+        'mean_turns': float(turns.mean()) if turns.size else float('nan'),
+        'median_turns': float(np.median(turns)) if turns.size else float('nan'),
+        'win_rate': [float(c) / max(int(finished.sum()), 1) for c in win_counts],
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate many Snake and Ladder games with NumPy")
+    parser.add_argument('--games', type=int, default=1000000, help="number of games to simulate")
+    parser.add_argument('--players', type=int, default=2, choices=range(1, 5), help="players per game")
+    parser.add_argument('--seed', type=int, default=None, help="seed for the dice RNG")
+    parser.add_argument('--block-size', type=int, default=DICE_BLOCK_SIZE,
+                        help="dice rolls generated per game per block")
+    add_rules_argument(parser)
+    args = parser.parse_args(argv)
+
+    result = simulate_games(args.games, args.players, seed=args.seed, block_size=args.block_size,
+                            rules=args.rules)
+    stats = summarize(result, args.players)
+    print(f"Games: {stats['games']} (unfinished: {stats['unfinished']})")
+    print(f"Mean rolls per game: {stats['mean_turns']:.2f}")
+    print(f"Median rolls per game: {stats['median_turns']:.1f}")
+    for seat, rate in enumerate(stats['win_rate'], start=1):
+        print(f"Player {seat} win rate: {rate:.4f}")
+
+if __name__ == "__main__":
+    main()
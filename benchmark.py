@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Rendering and rules benchmarks for Snake and Ladder.
+
+Runs the GUI under SDL's dummy video driver, so no display is needed, and
+times each draw_* call, a full frame of the main loop (idle, while the
+dice rolls and while a token walks and climbs a ladder) and the rules engine in turns per second, for several board
+sizes and player counts. Results can be written as JSON and compared
+against a saved baseline; the comparison exits with status 1 if anything
+got slower than the threshold allows.
+
+Example:
+    python benchmark.py --output baseline.json
+    python benchmark.py --compare baseline.json --threshold 10
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+# Must be set before pygame creates a window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from board_config import BoardConfig
+from snake_ladder_engine import SnakeAndLadderEngine
+from snake_and_ladder_gui import DICE_ROLL_MS, SnakeAndLadderGUI, get_ticks
+
+RESULTS_VERSION = 1
+DEFAULT_GRID_SIZES = (10, 30, 100)
+DEFAULT_PLAYERS = (2, 4)
+DEFAULT_REPEAT = 20
+DEFAULT_NUMBER = 50
+DEFAULT_RULE_TURNS = 100000
+DEFAULT_THRESHOLD = 10.0
+
+def time_calls(func, repeat, number, setup=None):
+    """Return per-call times in microseconds: one sample per batch of `number` calls."""
+    func()  # Warm caches so samples measure the steady state
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number * 1e6)
+    return samples
+
+def timing_result(name, grid_size, players, samples):
+    samples = sorted(samples)
+    return {
+        'name': name, 'grid_size': grid_size, 'players': players,
+        'unit': 'us', 'higher_is_better': False,
+        'value': statistics.median(samples),
+        'min': samples[0],
+        'mean': statistics.fmean(samples),
+        'p95': samples[min(len(samples) - 1, int(0.95 * len(samples)))],
+    }
+
+def make_gui(grid_size, players):
+    """Return a GUI in the middle of a game with every token on screen."""
+    gui = SnakeAndLadderGUI(board=BoardConfig(board_size=grid_size * grid_size), seed=0)
+    gui.select_player_count(players)
+    gui.show_menu = False
+    gui.reset_game()
+    for player in range(1, players + 1):
+        gui.engine.player_positions[player] = 1 + 7 * (player - 1)
+    gui.sync_from_engine()
+    return gui
+
+def bench_rendering(grid_size, players, repeat, number):
+    gui = make_gui(grid_size, players)
+    results = []
+
+    def cold_board():
+        gui.board_surface = None
+        gui.grid_surface = None
+        gui.draw_board()
+
+    calls = [
+        ('draw_board', gui.draw_board),
+        ('draw_board_cold', cold_board),
+        ('draw_players', gui.draw_players),
+        ('draw_dice', gui.draw_dice),
+        ('draw_player_info', gui.draw_player_info),
+        ('draw_game_message', gui.draw_game_message),
+        ('draw_menu', gui.draw_menu),
+        ('draw_widgets', lambda: gui.widgets.draw(gui.screen)),
+    ]
+    for name, func in calls:
+        # Rebuilding the board layer is much slower; fewer calls keep the run short
+        count = max(1, number // 10) if name == 'draw_board_cold' else number
+        results.append(timing_result(name, grid_size, players, time_calls(func, repeat, count)))
+
+    def frame():
+        gui.process_frame(pygame.event.get())
+
+    results.append(timing_result('frame_idle', grid_size, players,
+                                 time_calls(frame, repeat, number)))
+
+    def start_rolling():
+        gui.dice_rolling = True
+        gui.roll_start_time = get_ticks()
+
+    start_rolling()
+    results.append(timing_result('frame_rolling', grid_size, players,
+                                 time_calls(frame, repeat, number, setup=start_rolling)))
+    gui.dice_rolling = False
+    
+    # Walk from cell 1 onto the first ladder and climb it
+    landed = min(gui.ladders) if gui.ladders else 6
+    
+    def start_moving():
+        gui.engine.player_positions[1] = gui.ladders.get(landed, landed)
+        gui.start_move_animation(1, 1, landed, gui.ladders.get(landed, landed), get_ticks() - DICE_ROLL_MS)
+    
+    start_moving()
+    results.append(timing_result('frame_moving', grid_size, players,
+                                 time_calls(frame, repeat, number, setup=start_moving)))
+    gui.animation_in_progress = False
+    return results
+
+def bench_rules(grid_size, players, turns):
+    """Return the rules engine's rate of resolved turns per second."""
+    engine = SnakeAndLadderEngine(total_players=players, board=BoardConfig(board_size=grid_size * grid_size),
+                                  seed=0)
+    started = time.perf_counter()
+    for _ in range(turns):
+        if engine.game_over:
+            engine.reset(players)
+        engine.take_turn()
+    elapsed = time.perf_counter() - started
+    return {'name': 'rules', 'grid_size': grid_size, 'players': players,
+            'unit': 'turns/s', 'higher_is_better': True, 'value': turns / elapsed}
+
+def run_benchmarks(grid_sizes=DEFAULT_GRID_SIZES, player_counts=DEFAULT_PLAYERS,
+                   repeat=DEFAULT_REPEAT, number=DEFAULT_NUMBER, rule_turns=DEFAULT_RULE_TURNS):
+    """Run every benchmark and return the results document."""
+    results = []
+    for grid_size in grid_sizes:
+        for players in player_counts:
+            results.extend(bench_rendering(grid_size, players, repeat, number))
+            results.append(bench_rules(grid_size, players, rule_turns))
+    return {
+        'version': RESULTS_VERSION,
+        'environment': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+            'platform': platform.platform(),
+            'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+        },
+        'settings': {'repeat': repeat, 'number': number, 'rule_turns': rule_turns},
+        'results': results,
+    }
+
+def result_key(result):
+    return (result['name'], result['grid_size'], result['players'])
+
+def format_value(result):
+    if result['unit'] == 'turns/s':
+        return f"{result['value']:,.0f} turns/s"
+    return f"{result['value']:.1f} us"
+
+def print_results(document):
+    print(f"{'benchmark':<20} {'grid':>5} {'players':>7} {'median':>18}")
+    for result in document['results']:
+        print(f"{result['name']:<20} {result['grid_size']:>5} {result['players']:>7} "
+              f"{format_value(result):>18}")
+
+def compare(document, baseline, threshold):
+    """Print the change from the baseline; return the results that regressed by more than threshold %."""
+    old_results = {result_key(result): result for result in baseline['results']}
+    regressions = []
+    print(f"{'benchmark':<20} {'grid':>5} {'players':>7} {'baseline':>18} {'current':>18} {'change':>8}")
+    for result in document['results']:
+        old = old_results.get(result_key(result))
+        if old is None or not old['value']:
+            continue
+        change = (result['value'] - old['value']) / old['value'] * 100
+        worse = -change if result['higher_is_better'] else change
+        flag = ""
+        if worse > threshold:
+            regressions.append(result)
+            flag = "  REGRESSION"
+        print(f"{result['name']:<20} {result['grid_size']:>5} {result['players']:>7} "
+              f"{format_value(old):>18} {format_value(result):>18} {change:>+7.1f}%{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark rendering and rules throughput")
+    parser.add_argument('--grid-sizes', type=int, nargs='+', default=list(DEFAULT_GRID_SIZES),
+                        help="cells per board side to benchmark")
+    parser.add_argument('--players', type=int, nargs='+', default=list(DEFAULT_PLAYERS),
+                        choices=range(1, 5), help="player counts to benchmark")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="timing samples per benchmark")
+    parser.add_argument('--number', type=int, default=DEFAULT_NUMBER, help="calls per timing sample")
+    parser.add_argument('--rule-turns', type=int, default=DEFAULT_RULE_TURNS,
+                        help="turns to resolve for the rules benchmark")
+    parser.add_argument('--output', default=None, help="write the results to this JSON file")
+    parser.add_argument('--compare', default=None, metavar='BASELINE',
+                        help="compare against a results file saved with --output")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="percent slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    document = run_benchmarks(args.grid_sizes, args.players, args.repeat, args.number, args.rule_turns)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+
+    if args.compare is None:
+        print_results(document)
+        return
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    if baseline.get('version') != RESULTS_VERSION:
+        raise SystemExit(f"{args.compare} is not a version {RESULTS_VERSION} results file")
+    regressions = compare(document, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:g}%")
+        sys.exit(1)
+    print("No regressions")
+
+if __name__ == "__main__":
+    main()
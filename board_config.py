@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Board layouts loaded from JSON or TOML files and compiled into a jump table.
+
+A board file names the board size and its snakes (head: tail) and ladders
+(bottom: top):
+
+    {
+        "name": "classic",
+        "board_size": 100,
+        "snakes": {"17": 7, "54": 34},
+        "ladders": {"1": 38, "4": 14}
+    }
+
+or the same keys in TOML. Layouts are validated (endpoints in range,
+snakes go down and ladders go up, no cell is both a snake head and a
+ladder bottom, no jump cycles) and compiled into a flat list mapping every
+cell 0..board_size to its final cell after all chained jumps, so every
+consumer resolves snakes and ladders with one index lookup.
+
+Example:
+    python board_config.py boards/classic.json
+"""
+import argparse
+import json
+import os
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+DEFAULT_BOARD_SIZE = 100
+
+# Snakes (head: tail)
+DEFAULT_SNAKES = {
+    17: 7,
+    54: 34,
+    62: 19,
+    64: 60,
+    87: 36,
+    93: 73,
+    95: 75,
+    98: 79
+}
+
+# Ladders (bottom: top)
+DEFAULT_LADDERS = {
+    1: 38,
+    4: 14,
+    9: 31,
+    21: 42,
+    28: 84,
+    51: 67,
+    72: 91,
+    80: 99
+}
+
+class BoardConfigError(ValueError):
+    """Raised when a board layout is invalid or cannot be loaded."""
+
+def compile_jump_table(snakes, ladders, board_size):
+    """Return a list mapping each cell 0..board_size to its final cell after chained jumps."""
+    jumps = dict(snakes)
+    jumps.update(ladders)
+    table = list(range(board_size + 1))
+    for start in jumps:
+        cell = start
+        seen = {cell}
+        while cell in jumps:
+            cell = jumps[cell]
+            if cell in seen:
+                raise BoardConfigError(f"snakes and ladders starting at {start} form a cycle")
+            seen.add(cell)
+        table[start] = cell
+    return table
+
+class BoardConfig:
+    """A validated board layout with its compiled jump table."""
+
+    def __init__(self, snakes=None, ladders=None, board_size=DEFAULT_BOARD_SIZE, name=None):
+        self.name = name
+        self.board_size = board_size
+        self.snakes = dict(DEFAULT_SNAKES if snakes is None else snakes)
+        self.ladders = dict(DEFAULT_LADDERS if ladders is None else ladders)
+        self.validate()
+        self.jump_table = compile_jump_table(self.snakes, self.ladders, board_size)
+
+    def validate(self):
+        """Raise BoardConfigError if the layout is not playable."""
+        if not isinstance(self.board_size, int) or self.board_size < 2:
+            raise BoardConfigError(f"board_size must be an integer of at least 2, got {self.board_size!r}")
+        last = self.board_size
+        for head, tail in self.snakes.items():
+            if not 1 <= tail < head < last:
+                raise BoardConfigError(f"snake {head}->{tail} must go down and stay within 1..{last - 1}")
+        for bottom, top in self.ladders.items():
+            if not 1 <= bottom < top <= last:
+                raise BoardConfigError(f"ladder {bottom}->{top} must go up and stay within 1..{last}")
+        overlap = sorted(set(self.snakes) & set(self.ladders))
+        if overlap:
+            raise BoardConfigError(f"cells {overlap} are both a snake head and a ladder bottom")
+
+    def fingerprint(self):
+        """Return a hashable key identifying the layout."""
+        return (self.board_size, tuple(sorted(self.snakes.items())), tuple(sorted(self.ladders.items())))
+
+    def __eq__(self, other):
+        if not isinstance(other, BoardConfig):
+            return NotImplemented
+        return self.fingerprint() == other.fingerprint()
+
+    def to_dict(self):
+        data = {'board_size': self.board_size,
+                'snakes': {str(k): v for k, v in sorted(self.snakes.items())},
+                'ladders': {str(k): v for k, v in sorted(self.ladders.items())}}
+        if self.name:
+            data = {'name': self.name, **data}
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a board from parsed JSON/TOML data."""
+        if not isinstance(data, dict):
+            raise BoardConfigError("a board definition must be a table/object")
+        try:
+            snakes = _parse_jumps(data.get('snakes', {}))
+            ladders = _parse_jumps(data.get('ladders', {}))
+        except (TypeError, ValueError) as e:
+            raise BoardConfigError(f"snakes and ladders must map cell numbers to cell numbers: {e}")
+        return cls(snakes, ladders, data.get('board_size', DEFAULT_BOARD_SIZE), data.get('name'))
+
+    @classmethod
+    def load(cls, path):
+        """Load and validate a board from a .json or .toml file."""
+        ext = os.path.splitext(path)[1].lower()
+        try:
+            if ext == '.toml':
+                if tomllib is None:
+                    raise BoardConfigError("reading TOML boards needs Python 3.11+ or the tomli package")
+                with open(path, 'rb') as f:
+                    data = tomllib.load(f)
+            else:
+                with open(path) as f:
+                    data = json.load(f)
+        except OSError as e:
+            raise BoardConfigError(f"cannot read {path}: {e}")
+        except ValueError as e:  # JSONDecodeError and TOMLDecodeError
+            raise BoardConfigError(f"cannot parse {path}: {e}")
+        board = cls.from_dict(data)
+        if board.name is None:
+            board.name = os.path.splitext(os.path.basename(path))[0]
+        return board
+
+    def save(self, path):
+        """Write the board as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=4)
+            f.write("\n")
+
+def _parse_jumps(jumps):
+    """Accept {"start": end} mappings or [[start, end], ...] lists."""
+    items = jumps.items() if isinstance(jumps, dict) else jumps
+    return {int(start): int(end) for start, end in items}
+
+class BoardWatcher:
+    """Reloads a board file when its modification time changes."""
+
+    def __init__(self, path):
+        self.path = path
+        self.mtime = self._mtime()
+
+    def _mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self):
+        """Return a new BoardConfig if the file changed since the last poll, else None.
+
+        Raises BoardConfigError if the changed file is invalid.
+        """
+        mtime = self._mtime()
+        if mtime is None or mtime == self.mtime:
+            return None
+        self.mtime = mtime
+        return BoardConfig.load(self.path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate a board file and show its jump table")
+    parser.add_argument('board', help="board .json or .toml file")
+    args = parser.parse_args(argv)
+
+    try:
+        board = BoardConfig.load(args.board)
+    except BoardConfigError as e:
+        raise SystemExit(f"Invalid board: {e}")
+    print(f"{board.name}: {board.board_size} cells, {len(board.snakes)} snakes, {len(board.ladders)} ladders")
+    for cell, final in enumerate(board.jump_table):
+        if cell != final:
+            print(f"{cell} -> {final}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Search snake and ladder placements for target game metrics.
+
+Starting from a board layout, simulated annealing moves one snake or
+ladder endpoint at a time and keeps layouts that get closer to the
+targets: an expected number of turns per player within a tolerance of a
+target (e.g. 30 +/- 2) and a low variance of the win rate across seats.
+
+Every candidate is scored exactly with a markov_analysis.TurnChain, not
+by simulation, and built from the chain of the layout it was derived
+from: only the turns that roll from a cell whose moves changed are
+followed again, and the fundamental matrix is updated for the changed
+rows rather than inverted again. The chains of the last
+CHAIN_CACHE_SIZE layouts are kept for that; for each layout seen only
+its cost and metrics are kept, so stepping back to it (annealing often
+does) costs a dictionary lookup.
+
+metrics['expected_turns'] counts turns, a run of extra-turn rolls being
+one turn; metrics['expected_rolls'] counts rolls, like
+markov_analysis.expected_rolls and MarkovAnalysis.expected_rolls.
+
+Example:
+    python board_optimizer.py --target-turns 30 --tolerance 2 --players 4 --output boards/tuned.json
+"""
+import argparse
+import math
+import random
+from collections import OrderedDict
+
+import numpy as np
+
+from board_config import BoardConfig, BoardConfigError
+import markov_analysis
+from rules import CLASSIC_RULES, RulesError, add_rules_argument, compile_rules
+
+DEFAULT_ITERATIONS = 3000
+DEFAULT_FAIRNESS_WEIGHT = 10000.0
+MAX_ENDPOINT_STEP = 6
+CHAIN_CACHE_SIZE = 8
+
+class LayoutEvaluator:
+    """Scores layouts against the targets, memoized per board fingerprint."""
+
+    def __init__(self, target_turns, tolerance, total_players, fairness_weight=DEFAULT_FAIRNESS_WEIGHT,
+                 rules=CLASSIC_RULES):
+        self.rules = rules
+        self.target_turns = target_turns
+        self.tolerance = tolerance
+        self.total_players = total_players
+        self.fairness_weight = fairness_weight
+        self.scores = {}  # fingerprint -> (cost, metrics)
+        self.chains = OrderedDict()  # fingerprint -> TurnChain, most recently used last
+        self.hits = 0
+        self.misses = 0
+        self.rows_built = 0
+        self.rows_reused = 0
+
+    def chain(self, board, parent=None):
+        """Return the TurnChain of a board, derived from the parent layout's chain if it is kept."""
+        key = board.fingerprint()
+        chain = self.chains.get(key)
+        if chain is None:
+            parent_chain = self.chains.get(parent.fingerprint()) if parent is not None else None
+            chain = markov_analysis.TurnChain(compile_rules(board, self.rules), parent_chain)
+            self.rows_built += chain.rebuilt_rows
+            self.rows_reused += chain.size - chain.rebuilt_rows
+            self.chains[key] = chain
+            if len(self.chains) > CHAIN_CACHE_SIZE:
+                self.chains.popitem(last=False)
+        self.chains.move_to_end(key)
+        return chain
+
+    def metrics(self, board, parent=None):
+        """Return the exact metrics of a board; parent is the layout it was derived from, if any."""
+        if board.board_size > markov_analysis.DENSE_MAX_CELLS:
+            p = markov_analysis.turns_to_finish(board.snakes, board.ladders, board.board_size, self.rules)
+            expected_turns = float(np.dot(np.arange(len(p)), p))
+            expected_rolls = markov_analysis.expected_rolls(board.snakes, board.ladders, board.board_size,
+                                                            self.rules)
+        else:
+            chain = self.chain(board, parent)
+            p = chain.turns_to_finish()
+            expected_turns = chain.expected_turns()
+            expected_rolls = chain.expected_rolls()
+        rates = markov_analysis.win_rates(p, self.total_players)
+        return {
+            'expected_turns': expected_turns,
+            'expected_rolls': expected_rolls,
+            'seat_win_rates': rates,
+            'seat_win_rate_variance': float(np.var(rates)),
+        }
+
+    def score(self, board, parent=None):
+        """Return (cost, metrics); lower cost is better."""
+        key = board.fingerprint()
+        cached = self.scores.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        metrics = self.metrics(board, parent)
+        deviation = abs(metrics['expected_turns'] - self.target_turns)
+        # Outside the tolerance band costs a lot; inside it, a gentle pull to the target
+        cost = max(0.0, deviation - self.tolerance) ** 2 + 0.01 * deviation ** 2
+        cost += self.fairness_weight * metrics['seat_win_rate_variance']
+        self.scores[key] = (cost, metrics)
+        return cost, metrics
+
+def neighbour(board, rng, rules=CLASSIC_RULES):
+    """Return a valid layout that differs from board by one moved endpoint.
+
+    Raises ValueError if the board has no snakes or ladders to move.
+    """
+    if not board.snakes and not board.ladders:
+        raise ValueError("the board has no snakes or ladders to move")
+    while True:
+        snakes = dict(board.snakes)
+        ladders = dict(board.ladders)
+        jumps = snakes if (rng.random() < 0.5 and snakes) or not ladders else ladders
+        start = rng.choice(list(jumps))
+        end = jumps.pop(start)
+        step = rng.choice([d for d in range(-MAX_ENDPOINT_STEP, MAX_ENDPOINT_STEP + 1) if d])
+        if rng.random() < 0.5:
+            start += step
+        else:
+            end += step
+        if start in snakes or start in ladders:
+            continue  # Would replace another snake or ladder
+        jumps[start] = end
+        try:
+            candidate = BoardConfig(snakes, ladders, board.board_size, board.name)
+            compile_rules(candidate, rules)
+            return candidate
+        except (BoardConfigError, RulesError):
+            continue  # Out of range, overlapping, cyclic or unfinishable; try another move
+
+def anneal(board, evaluator, iterations=DEFAULT_ITERATIONS, seed=None,
+           start_temperature=1.0, end_temperature=0.001, progress=None):
+    """Run simulated annealing from board and return (best_board, best_cost, best_metrics)."""
+    rng = random.Random(seed)
+    current = board
+    current_cost, _ = evaluator.score(current)
+    best, best_cost = current, current_cost
+    cooling = (end_temperature / start_temperature) ** (1 / max(iterations - 1, 1))
+    temperature = start_temperature
+
+    for i in range(iterations):
+        candidate = neighbour(current, rng, evaluator.rules)
+        cost, _ = evaluator.score(candidate, current)
+        if cost <= current_cost or rng.random() < math.exp((current_cost - cost) / temperature):
+            current, current_cost = candidate, cost
+            if cost < best_cost:
+                best, best_cost = candidate, cost
+        temperature *= cooling
+        if progress is not None and (i + 1) % progress == 0:
+            print(f"iteration {i + 1}: best cost {best_cost:.5f}, current {current_cost:.5f}")
+
+    return best, best_cost, evaluator.score(best)[1]
+
+def print_metrics(label, metrics):
+    rates = ", ".join(f"{r:.4f}" for r in metrics['seat_win_rates'])
+    print(f"{label}: {metrics['expected_turns']:.2f} turns ({metrics['expected_rolls']:.2f} rolls) "
+          f"per player, seat win rates {rates}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search board layouts for target game metrics")
+    parser.add_argument('--board', default=None, help="starting board file (default: the classic board)")
+    parser.add_argument('--target-turns', type=float, default=30.0,
+                        help="target expected turns for one player to finish")
+    parser.add_argument('--tolerance', type=float, default=2.0, help="acceptable +/- around the target")
+    parser.add_argument('--players', type=int, default=2, choices=range(1, 5),
+                        help="players per game for the seat fairness metric")
+    parser.add_argument('--fairness-weight', type=float, default=DEFAULT_FAIRNESS_WEIGHT,
+                        help="weight of the seat win-rate variance in the cost")
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help="annealing steps")
+    parser.add_argument('--seed', type=int, default=None, help="seed for the search")
+    parser.add_argument('--output', default=None, help="write the best board to this JSON file")
+    add_rules_argument(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        board = BoardConfig.load(args.board) if args.board else BoardConfig(name='optimized')
+        compile_rules(board, args.rules)
+    except (BoardConfigError, RulesError) as e:
+        parser.error(str(e))
+    if not board.snakes and not board.ladders:
+        parser.error(f"{args.board} has no snakes or ladders to move")
+    evaluator = LayoutEvaluator(args.target_turns, args.tolerance, args.players, args.fairness_weight,
+                                args.rules)
+    print_metrics("Start", evaluator.score(board)[1])
+
+    best, cost, metrics = anneal(board, evaluator, args.iterations, args.seed,
+                                 progress=max(args.iterations // 10, 1))
+    print_metrics("Best", metrics)
+    print(f"Cost {cost:.5f}; {evaluator.misses} layouts evaluated, {evaluator.hits} cache hits, "
+          f"{evaluator.rows_reused} of {evaluator.rows_reused + evaluator.rows_built} chain rows reused")
+    print(f"Snakes: {dict(sorted(best.snakes.items()))}")
+    print(f"Ladders: {dict(sorted(best.ladders.items()))}")
+    if args.output:
+        best.save(args.output)
+        print(f"Saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
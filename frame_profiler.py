@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Per-phase frame timing for the GUI main loop, with an on-screen overlay.
+
+The loop marks the end of each phase (event handling, the dice and token
+animations, each draw_* call, display flip) with lap(); a frame's phase
+durations are kept in a rolling window, from which the overlay shows
+per-phase averages, p95 and rolling histograms plus frame-time and FPS
+graphs. The window can be dumped to CSV for offline analysis.
+
+Timing costs one perf_counter() call per phase, and nothing at all while
+the profiler is disabled.
+"""
+import bisect
+import csv
+import time
+from collections import deque
+
+import pygame
+
+DEFAULT_WINDOW = 600  # Frames kept (10 seconds at 60 FPS)
+HISTOGRAM_EDGES_MS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33)
+OVERLAY_REFRESH_MS = 250
+OVERLAY_WIDTH = 360
+OVERLAY_COLUMNS = (0, 150, 200, 250, 300)
+GRAPH_HEIGHT = 50
+OVERLAY_FONT = 'Courier New, monospace'
+OVERLAY_FONT_SIZE = 13
+TARGET_FRAME_MS = 1000 / 60
+
+OVERLAY_BACKGROUND = (0, 0, 0, 190)
+OVERLAY_TEXT = (230, 230, 230)
+FRAME_GRAPH_COLOR = (255, 200, 0)
+FPS_GRAPH_COLOR = (0, 200, 255)
+TARGET_LINE_COLOR = (200, 60, 60)
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(pct / 100 * len(sorted_values)))]
+
+def histogram(values, edges=HISTOGRAM_EDGES_MS):
+    """Count values into buckets: <= edges[0], ..., > edges[-1]."""
+    counts = [0] * (len(edges) + 1)
+    for value in values:
+        counts[bisect.bisect_left(edges, value)] += 1
+    return counts
+
+class FrameProfiler:
+    """Rolling per-phase timings of the main loop."""
+
+    def __init__(self, window=DEFAULT_WINDOW, recording=False, load_font=None):
+        self.recording = recording  # Time frames even while the overlay is hidden
+        self.enabled = recording
+        self.visible = False
+        # Opens a font by (name, size); the GUI passes its AssetCache so no font scan is needed
+        self.load_font = load_font or pygame.font.SysFont
+        self.font = None
+        self.frames = deque(maxlen=window)  # (start time, frame interval ms, {phase: ms})
+        self.phase_order = []
+        self.frame_start = None
+        self.last_lap = None
+        self.phases = None
+        self.overlay_text = None
+        self.overlay_time = 0
+
+    def toggle_overlay(self):
+        """Show or hide the overlay; timing runs while it is shown."""
+        self.visible = not self.visible
+        self.enabled = self.visible or self.recording
+
+    def start_frame(self):
+        if not self.enabled:
+            self.phases = None
+            return
+        now = time.perf_counter()
+        if self.phases is not None:
+            self.end_frame(now)
+        self.frame_start = self.last_lap = now
+        self.phases = {}
+
+    def lap(self, phase):
+        """Charge the time since the previous lap to a phase."""
+        if self.phases is None:
+            return
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self.last_lap) * 1000
+        self.last_lap = now
+
+    def end_frame(self, now):
+        # The frame interval runs from one frame start to the next, so it
+        # includes waiting for events and frame pacing, unlike the phases
+        self.phase_order.extend(p for p in self.phases if p not in self.phase_order)
+        self.frames.append((self.frame_start, (now - self.frame_start) * 1000, self.phases))
+        self.phases = None
+
+    def phase_samples(self, phase):
+        return [phases[phase] for _, _, phases in self.frames if phase in phases]
+
+    def frame_times(self):
+        return [interval for _, interval, _ in self.frames]
+
+    def summary(self):
+        """Return [(phase, mean ms, p95 ms, max ms, histogram)] for the current window."""
+        rows = []
+        for phase in self.phase_order:
+            samples = sorted(self.phase_samples(phase))
+            if samples:
+                rows.append((phase, sum(samples) / len(samples), percentile(samples, 95),
+                             samples[-1], histogram(samples)))
+        return rows
+
+    def dump(self, path):
+        """Write every frame in the window to a CSV file, one column per phase."""
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'time', 'frame_ms'] + self.phase_order)
+            for index, (start, interval, phases) in enumerate(self.frames):
+                writer.writerow([index, f"{start:.6f}", f"{interval:.4f}"] +
+                                [f"{phases[p]:.4f}" if p in phases else '' for p in self.phase_order])
+        return len(self.frames)
+
+    def draw_overlay(self, surface):
+        """Draw the phase table and the frame-time and FPS graphs in the top-left corner."""
+        if self.font is None:
+            self.font = self.load_font(OVERLAY_FONT, OVERLAY_FONT_SIZE)
+        # Text is re-rendered a few times a second; the graphs every frame
+        now = time.perf_counter() * 1000
+        if self.overlay_text is None or now - self.overlay_time >= OVERLAY_REFRESH_MS:
+            self.overlay_text = self.render_text(self.font)
+            self.overlay_time = now
+        line_height = self.font.get_linesize()
+        height = len(self.overlay_text) * line_height + 2 * GRAPH_HEIGHT + 30
+
+        panel = pygame.Surface((OVERLAY_WIDTH, height), pygame.SRCALPHA)
+        panel.fill(OVERLAY_BACKGROUND)
+        y = 5
+        for row in self.overlay_text:
+            for x, cell in zip(OVERLAY_COLUMNS, row):
+                panel.blit(cell, (5 + x, y))
+            y += line_height
+
+        frame_times = self.frame_times()[-(OVERLAY_WIDTH - 10):]
+        scale = max(2 * TARGET_FRAME_MS, max(frame_times, default=0))
+        self.draw_graph(panel, pygame.Rect(5, y + 10, OVERLAY_WIDTH - 10, GRAPH_HEIGHT),
+                        frame_times, scale, FRAME_GRAPH_COLOR, TARGET_FRAME_MS)
+        fps = [1000 / t for t in frame_times if t > 0]
+        self.draw_graph(panel, pygame.Rect(5, y + 20 + GRAPH_HEIGHT, OVERLAY_WIDTH - 10, GRAPH_HEIGHT),
+                        fps, max(120, max(fps, default=0)), FPS_GRAPH_COLOR, 60)
+        surface.blit(panel, (0, 0))
+        return pygame.Rect(0, 0, OVERLAY_WIDTH, height)
+
+    def render_text(self, font):
+        """Return rows of rendered cells, one cell per column of OVERLAY_COLUMNS."""
+        frame_times = sorted(self.frame_times())
+        mean = sum(frame_times) / len(frame_times) if frame_times else 0.0
+        rows = [[f"frame {mean:.2f} ms avg, p95 {percentile(frame_times, 95):.2f} ms, "
+                 f"{1000 / mean if mean else 0:.0f} FPS"],
+                ["phase (ms)", "avg", "p95", "max", "histogram"]]
+        for phase, mean, p95, peak, counts in self.summary():
+            rows.append([phase, f"{mean:.3f}", f"{p95:.3f}", f"{peak:.2f}", self.sparkline(counts)])
+        return [[font.render(cell, True, OVERLAY_TEXT) for cell in row] for row in rows]
+
+    @staticmethod
+    def sparkline(counts):
+        """Render a histogram as a short row of characters, denser for fuller buckets."""
+        blocks = " .:-=+*#"
+        peak = max(counts) or 1
+        return "".join(blocks[round(c / peak * (len(blocks) - 1))] for c in counts)
+
+    @staticmethod
+    def draw_graph(surface, rect, values, scale, color, reference):
+        pygame.draw.rect(surface, (40, 40, 40), rect, 1)
+        ref_y = rect.bottom - min(1, reference / scale) * rect.height
+        pygame.draw.line(surface, TARGET_LINE_COLOR, (rect.left, ref_y), (rect.right - 1, ref_y))
+        if len(values) > 1:
+            points = [(rect.left + i, rect.bottom - min(1, v / scale) * (rect.height - 1))
+                      for i, v in enumerate(values)]
+            pygame.draw.lines(surface, color, False, points)
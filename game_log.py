@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Recorded game logs with seeded dice and fast-forward replay.
+
+Every game is written to a compact append-only log: a fixed header with
+the player count, board size, a hash of the board layout and the dice
+seed, then one byte per roll (the dice total). Every
+CHECKPOINT_INTERVAL rolls a checkpoint record holding the full GameState
+is appended, so seeking to roll N restores the nearest earlier
+checkpoint and replays at most CHECKPOINT_INTERVAL - 1 rolls instead of
+the whole game.
+
+Logs can be replayed headless at full speed here, or with animations in
+the GUI (python snake_and_ladder_gui.py --replay LOG).
+
+Example:
+    python game_log.py info game.sllog
+    python game_log.py replay game.sllog --turn 40
+    python game_log.py replay game.sllog --board boards/classic.json
+"""
+import argparse
+import bisect
+import hashlib
+import os
+import struct
+import time
+
+from board_config import BoardConfig
+from game_state import GameState, RECORD
+from rules import CLASSIC_RULES, add_rules_argument, rules_spec
+from snake_ladder_engine import SnakeAndLadderEngine
+
+HEADER = struct.Struct('<5sBBxHQQ')  # magic, version, players, board size, seed, board hash
+MAGIC = b'SLLOG'
+VERSION = 1
+CHECKPOINT_TAG = 0xFF
+CHECKPOINT = struct.Struct('<I')  # roll number, followed by a GameState record
+CHECKPOINT_INTERVAL = 32
+
+def board_hash(snakes, ladders, board_size, rules=None):
+    """Return a 64-bit hash of a board layout and rule variant, used to check a log matches them."""
+    layout = repr((board_size, sorted(snakes.items()), sorted(ladders.items())))
+    if rules is not None and rules != CLASSIC_RULES:
+        # Classic games keep the hash they had before rule variants existed
+        layout += rules_spec(rules)
+    return int.from_bytes(hashlib.sha1(layout.encode()).digest()[:8], 'little')
+
+class GameLogWriter:
+    """Appends the rolls of one game, plus periodic checkpoints, to a log file."""
+
+    def __init__(self, path, engine, checkpoint_interval=CHECKPOINT_INTERVAL):
+        if engine.seed is None:
+            raise ValueError("the engine must be seeded to record a reproducible game")
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, engine.total_players, engine.board_size,
+                                    engine.seed, board_hash(engine.snakes, engine.ladders,
+                                                            engine.board_size, engine.rules)))
+        self.file.flush()
+
+    def record_turn(self, dice_value, engine):
+        """Append one roll; call after engine.take_turn()."""
+        record = bytes((dice_value,))
+        if engine.turn_count % self.checkpoint_interval == 0:
+            record += bytes((CHECKPOINT_TAG,)) + CHECKPOINT.pack(engine.turn_count)
+            record += GameState.from_engine(engine).pack()
+        self.file.write(record)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+class GameLog:
+    """A recorded game loaded for replay."""
+
+    def __init__(self, total_players, board_size, seed, layout_hash, dice, checkpoints):
+        self.total_players = total_players
+        self.board_size = board_size
+        self.seed = seed
+        self.layout_hash = layout_hash
+        self.dice = dice  # bytes, one dice value per roll
+        self.checkpoints = checkpoints  # sorted [(roll number, GameState)]
+        self.checkpoint_turns = [turn for turn, _ in checkpoints]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, players, board_size, seed, layout_hash = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} game log")
+
+        dice = bytearray()
+        checkpoints = []
+        offset = HEADER.size
+        record_size = 1 + CHECKPOINT.size + RECORD.size
+        while offset < len(data):
+            tag = data[offset]
+            if tag == CHECKPOINT_TAG:
+                if offset + record_size > len(data):
+                    break  # Truncated by an interrupted write
+                turn, = CHECKPOINT.unpack_from(data, offset + 1)
+                state = GameState.unpack_from(data, offset + 1 + CHECKPOINT.size)
+                checkpoints.append((turn, state))
+                offset += record_size
+            elif 1 <= tag < CHECKPOINT_TAG:
+                dice.append(tag)
+                offset += 1
+            else:
+                raise ValueError(f"{path}: corrupt record at byte {offset}")
+        return cls(players, board_size, seed, layout_hash, bytes(dice), checkpoints)
+
+    def __len__(self):
+        return len(self.dice)
+
+    def new_engine(self, snakes=None, ladders=None, rules=None):
+        """Return a fresh engine for this log, checking the board layout and rules match."""
+        engine = SnakeAndLadderEngine(total_players=self.total_players, snakes=snakes,
+                                      ladders=ladders, board_size=self.board_size, seed=self.seed,
+                                      rules=rules)
+        if board_hash(engine.snakes, engine.ladders, engine.board_size, engine.rules) != self.layout_hash:
+            raise ValueError("the log was recorded on a different board layout or rules")
+        return engine
+
+    def seek(self, engine, turn):
+        """Put the engine in the state after `turn` rolls, starting from the nearest checkpoint."""
+        turn = max(0, min(turn, len(self.dice)))
+        index = bisect.bisect_right(self.checkpoint_turns, turn) - 1
+        if index >= 0:
+            start, state = self.checkpoints[index]
+            state.apply_to_engine(engine)
+        else:
+            start = 0
+            engine.reset(self.total_players)
+        for dice_value in self.dice[start:turn]:
+            engine.take_turn(dice_value)
+        return engine
+
+    def replay(self, engine=None):
+        """Replay the whole game headless and return the engine in its final state."""
+        engine = engine or self.new_engine()
+        return self.seek(engine, len(self.dice))
+
+def new_log_path(directory, seed):
+    """Return a unique log file path for a new game."""
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"game-{time.strftime('%Y%m%d-%H%M%S')}-{seed:016x}.sllog")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and replay recorded Snake and Ladder games")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    info_parser = subparsers.add_parser('info', help="show a log's header")
+    info_parser.add_argument('log')
+    replay_parser = subparsers.add_parser('replay', help="replay a log headless")
+    replay_parser.add_argument('log')
+    replay_parser.add_argument('--turn', type=int, default=None,
+                               help="stop after this many rolls (default: the whole game)")
+    replay_parser.add_argument('--board', default=None,
+                               help="board file the game was played on (default: the classic board)")
+    add_rules_argument(replay_parser)
+    args = parser.parse_args(argv)
+
+    log = GameLog.load(args.log)
+    if args.command == 'info':
+        print(f"Players: {log.total_players}, board size: {log.board_size}")
+        print(f"Seed: {log.seed}, board hash: {log.layout_hash:016x}")
+        print(f"Rolls: {len(log)}, checkpoints: {len(log.checkpoints)}")
+        return
+
+    try:
+        board = BoardConfig.load(args.board) if args.board else BoardConfig()
+        engine = log.new_engine(board.snakes, board.ladders, args.rules)
+    except ValueError as e:  # Including BoardConfigError and RulesError
+        raise SystemExit(f"{args.log}: {e}")
+    started = time.perf_counter()
+    log.seek(engine, len(log) if args.turn is None else args.turn)
+    elapsed = time.perf_counter() - started
+    print(f"After {engine.turn_count} rolls: positions {engine.player_positions}, "
+          f"player {engine.current_player} to roll")
+    if engine.game_over:
+        print(f"Player {engine.winner} wins")
+    print(f"Replayed in {elapsed * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Headless asyncio server hosting many Snake and Ladder sessions.
+
+One process hosts any number of independent games over a line-based TCP
+protocol. Each request is one line; each reply is one line:
+
+    NEW <players> [seed]   -> OK <session_id>
+    JOIN <session_id>      -> OK <session_id>
+    ROLL                   -> TURN <player> <dice> <start> <landed> <end> <extra_turn> <winner>
+    STATE                  -> STATE <current_player> <winner> <pos1> ... <posN>
+    STATS                  -> STATS key=value ...
+    QUIT                   -> BYE
+
+winner is 0 while the game is running. Errors are reported as
+"ERR <message>". Sessions idle for longer than the timeout are evicted.
+
+Session state is a __slots__ record with positions in an array, and all
+sessions share one SnakeAndLadderEngine (and its transition table
+compiled from the board and rule variant) that plays each roll, so
+thousands of sessions fit in a few megabytes.
+
+Example:
+    python game_server.py --port 8765
+    python load_client.py --port 8765 --connections 500 --games 20
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from array import array
+
+from rules import add_rules_argument
+from snake_ladder_engine import SnakeAndLadderEngine
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+SESSION_TIMEOUT = 300.0
+EVICTION_INTERVAL = 10.0
+# Upper bounds (in microseconds) of the request latency histogram buckets
+LATENCY_BUCKETS_US = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 50000, 100000)
+
+class ProtocolError(Exception):
+    """Raised for malformed or invalid requests; reported to the client as ERR."""
+
+class Session:
+    """Compact state of one game."""
+
+    __slots__ = ('session_id', 'positions', 'current_player', 'winner',
+                 'turn_count', 'streak', 'turn_start', 'rng', 'last_active')
+
+    def __init__(self, session_id, total_players, rng, now):
+        self.session_id = session_id
+        self.positions = array('H', bytes(2 * total_players))
+        self.current_player = 0  # 0-based seat
+        self.winner = 0  # 1-based player, 0 while running
+        self.turn_count = 0
+        self.streak = 0
+        self.turn_start = 0
+        self.rng = rng
+        self.last_active = now
+
+class ServerStats:
+    """Throughput and latency counters."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.connections = 0
+        self.sessions_created = 0
+        self.sessions_evicted = 0
+        self.latency_total_us = 0.0
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS_US) + 1)
+
+    def record(self, latency_us):
+        self.requests += 1
+        self.latency_total_us += latency_us
+        for i, bound in enumerate(LATENCY_BUCKETS_US):
+            if latency_us <= bound:
+                self.latency_counts[i] += 1
+                return
+        self.latency_counts[-1] += 1
+
+    def latency_percentile(self, pct):
+        """Return the upper bound of the bucket holding the given percentile."""
+        target = pct / 100 * self.requests
+        seen = 0
+        for i, count in enumerate(self.latency_counts):
+            seen += count
+            if count and seen >= target:
+                return LATENCY_BUCKETS_US[i] if i < len(LATENCY_BUCKETS_US) else float('inf')
+        return 0
+
+    def snapshot(self, active_sessions):
+        elapsed = time.monotonic() - self.started
+        return {
+            'uptime_s': round(elapsed, 1),
+            'requests': self.requests,
+            'errors': self.errors,
+            'requests_per_s': round(self.requests / elapsed, 1) if elapsed else 0.0,
+            'mean_latency_us': round(self.latency_total_us / self.requests, 1) if self.requests else 0.0,
+            'p50_latency_us': self.latency_percentile(50),
+            'p99_latency_us': self.latency_percentile(99),
+            'connections': self.connections,
+            'sessions_active': active_sessions,
+            'sessions_created': self.sessions_created,
+            'sessions_evicted': self.sessions_evicted,
+        }
+
+class GameServer:
+    """Hosts independent game sessions over a line-based TCP protocol."""
+
+    def __init__(self, snakes=None, ladders=None, board_size=100,
+                 session_timeout=SESSION_TIMEOUT, seed=None, rules=None):
+        # One engine plays every session's rolls; sessions only hold their own state
+        self.engine = SnakeAndLadderEngine(snakes=snakes, ladders=ladders, board_size=board_size, rules=rules)
+        self.board_size = board_size
+        self.session_timeout = session_timeout
+        # Sessions without their own seed share one RNG instead of carrying one each
+        self.rng = random.Random(seed)
+        self.sessions = {}
+        self.session_ids = itertools.count(1)
+        self.stats = ServerStats()
+
+    def new_session(self, total_players, seed=None):
+        if not 1 <= total_players <= 4:
+            raise ProtocolError("players must be between 1 and 4")
+        rng = self.rng if seed is None else random.Random(seed)
+        session = Session(next(self.session_ids), total_players, rng, time.monotonic())
+        self.sessions[session.session_id] = session
+        self.stats.sessions_created += 1
+        return session
+
+    def roll(self, session):
+        """Play one dice roll in a session and return the reply line."""
+        if session.winner:
+            raise ProtocolError("game is over")
+        # Play the roll on the shared engine so the server follows exactly the engine's rules
+        engine = self.engine
+        engine.rng = session.rng
+        engine.total_players = len(session.positions)
+        engine.player_positions = dict(enumerate(session.positions, 1))
+        engine.current_player = session.current_player + 1
+        engine.turn_count = session.turn_count
+        engine.streak = session.streak
+        engine.turn_start = session.turn_start
+        engine.game_over = False
+        engine.winner = None
+        turn = engine.take_turn()
+
+        session.positions[turn.player - 1] = turn.end
+        session.current_player = engine.current_player - 1
+        session.winner = turn.winner or 0
+        session.turn_count = engine.turn_count
+        session.streak = engine.streak
+        session.turn_start = engine.turn_start
+        return (f"TURN {turn.player} {turn.dice_value} {turn.start} {turn.landed} {turn.end} "
+                f"{int(turn.extra_turn)} {session.winner}")
+
+    def handle_request(self, line, connection):
+        """Process one request line. Returns (reply, keep_open)."""
+        parts = line.split()
+        if not parts:
+            raise ProtocolError("empty request")
+        command, args = parts[0].upper(), parts[1:]
+
+        if command == 'NEW':
+            if not 1 <= len(args) <= 2:
+                raise ProtocolError("usage: NEW <players> [seed]")
+            try:
+                numbers = [int(arg) for arg in args]
+            except ValueError:
+                raise ProtocolError("players and seed must be integers")
+            session = self.new_session(*numbers)
+            connection['session'] = session
+            return f"OK {session.session_id}", True
+
+        if command == 'JOIN':
+            if len(args) != 1 or not args[0].isdigit():
+                raise ProtocolError("usage: JOIN <session_id>")
+            session = self.sessions.get(int(args[0]))
+            if session is None:
+                raise ProtocolError("unknown session")
+            connection['session'] = session
+            return f"OK {session.session_id}", True
+
+        if command == 'STATS':
+            stats = self.stats.snapshot(len(self.sessions))
+            return "STATS " + " ".join(f"{key}={value}" for key, value in stats.items()), True
+
+        if command == 'QUIT':
+            return "BYE", False
+
+        session = connection.get('session')
+        if session is None or session.session_id not in self.sessions:
+            connection['session'] = None
+            raise ProtocolError("no active session")
+        session.last_active = time.monotonic()
+
+        if command == 'ROLL':
+            return self.roll(session), True
+        if command == 'STATE':
+            positions = " ".join(str(p) for p in session.positions)
+            return f"STATE {session.current_player + 1} {session.winner} {positions}", True
+        raise ProtocolError(f"unknown command {command}")
+
+    async def handle_connection(self, reader, writer):
+        self.stats.connections += 1
+        connection = {'session': None}
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Longer than the stream limit: no request is that long, so give up on the client
+                    self.stats.errors += 1
+                    writer.write(b"ERR request line too long\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                started = time.perf_counter()
+                try:
+                    reply, keep_open = self.handle_request(line.decode('ascii', 'replace'), connection)
+                except ProtocolError as e:
+                    self.stats.errors += 1
+                    reply, keep_open = f"ERR {e}", True
+                writer.write(reply.encode('ascii', 'replace') + b"\n")
+                self.stats.record((time.perf_counter() - started) * 1e6)
+                if not keep_open:
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.stats.connections -= 1
+            writer.close()
+
+    def evict_idle(self, now=None):
+        """Drop sessions that have been idle longer than the timeout."""
+        now = time.monotonic() if now is None else now
+        expired = [sid for sid, session in self.sessions.items()
+                   if now - session.last_active > self.session_timeout]
+        for sid in expired:
+            del self.sessions[sid]
+        self.stats.sessions_evicted += len(expired)
+        return len(expired)
+
+    async def evict_loop(self, interval=EVICTION_INTERVAL):
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        evictor = asyncio.ensure_future(self.evict_loop())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            evictor.cancel()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host many Snake and Ladder sessions over TCP")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument('--session-timeout', type=float, default=SESSION_TIMEOUT,
+                        help="seconds of inactivity before a session is evicted")
+    parser.add_argument('--seed', type=int, default=None, help="seed for the shared dice RNG")
+    add_rules_argument(parser)
+    args = parser.parse_args(argv)
+
+    server = GameServer(session_timeout=args.session_timeout, seed=args.seed, rules=args.rules)
+    print(f"Serving on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
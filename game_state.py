@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Compact fixed-layout game state records and memory-mapped snapshot files.
+
+A GameState packs everything needed to suspend and resume a game (player
+positions, turn, dice, winner and the GUI animation fields) into a 24-byte
+record. A SnapshotArchive stores many records back to back after a 16-byte
+header, so millions of games fit in one file and any single game is read
+back in O(1) by index through a memory map, without parsing the rest.
+
+Record layout (little endian):
+    4 x uint16  positions of players 1-4 (unused seats are 0)
+    uint8       total_players
+    uint8       current_player
+    uint8       dice_value
+    uint8       flags (bit 0 game_over, bit 1 animation_in_progress, bit 2 dice_rolling,
+                bits 3-5 extra-turn streak)
+    uint8       winner (0 if none)
+    uint8       animation_player
+    uint16      animation_from
+    uint16      animation_to
+    uint32      turn_count
+    uint16      turn_start (cell the current player started the turn on)
+"""
+import mmap
+import os
+import struct
+
+RECORD = struct.Struct('<4H6B2HIH')
+HEADER = struct.Struct('<6sHH6x')  # magic, version, record size, padding
+MAGIC = b'SLSNAP'
+VERSION = 1
+MAX_PLAYERS = 4
+
+FLAG_GAME_OVER = 1
+FLAG_ANIMATING = 2
+FLAG_DICE_ROLLING = 4
+STREAK_SHIFT = 3
+STREAK_MASK = 0x38
+
+class GameState:
+    """Fixed-layout record of one game."""
+
+    __slots__ = ('positions', 'total_players', 'current_player', 'dice_value',
+                 'game_over', 'winner', 'turn_count', 'animation_in_progress',
+                 'dice_rolling', 'animation_player', 'animation_from', 'animation_to',
+                 'streak', 'turn_start')
+
+    def __init__(self, positions=(0, 0), current_player=1, dice_value=1,
+                 game_over=False, winner=None, turn_count=0,
+                 animation_in_progress=False, dice_rolling=False,
+                 animation_player=0, animation_from=0, animation_to=0,
+                 streak=0, turn_start=0):
+        if not 1 <= len(positions) <= MAX_PLAYERS:
+            raise ValueError(f"a game has 1 to {MAX_PLAYERS} players, got {len(positions)}")
+        self.positions = tuple(positions)
+        self.total_players = len(positions)
+        self.current_player = current_player
+        self.dice_value = dice_value
+        self.game_over = game_over
+        self.winner = winner
+        self.turn_count = turn_count
+        self.animation_in_progress = animation_in_progress
+        self.dice_rolling = dice_rolling
+        self.animation_player = animation_player
+        self.animation_from = animation_from
+        self.animation_to = animation_to
+        self.streak = streak
+        self.turn_start = turn_start
+
+    def __eq__(self, other):
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self.pack() == other.pack()
+
+    def __repr__(self):
+        return (f"GameState(positions={self.positions}, current_player={self.current_player}, "
+                f"dice_value={self.dice_value}, winner={self.winner}, turn_count={self.turn_count})")
+
+    def pack(self):
+        """Return the state as a RECORD.size-byte record."""
+        positions = self.positions + (0,) * (MAX_PLAYERS - self.total_players)
+        flags = ((FLAG_GAME_OVER if self.game_over else 0) |
+                 (FLAG_ANIMATING if self.animation_in_progress else 0) |
+                 (FLAG_DICE_ROLLING if self.dice_rolling else 0) |
+                 (self.streak << STREAK_SHIFT))
+        return RECORD.pack(*positions, self.total_players, self.current_player,
+                           self.dice_value, flags, self.winner or 0, self.animation_player,
+                           self.animation_from, self.animation_to, self.turn_count,
+                           self.turn_start)
+
+    def pack_into(self, buffer, offset):
+        buffer[offset:offset + RECORD.size] = self.pack()
+
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        """Read a state from a record at the given offset of a buffer."""
+        fields = RECORD.unpack_from(buffer, offset)
+        positions = fields[:MAX_PLAYERS]
+        (total_players, current_player, dice_value, flags, winner, animation_player,
+         animation_from, animation_to, turn_count, turn_start) = fields[MAX_PLAYERS:]
+        return cls(positions[:total_players], current_player, dice_value,
+                   bool(flags & FLAG_GAME_OVER), winner or None, turn_count,
+                   bool(flags & FLAG_ANIMATING), bool(flags & FLAG_DICE_ROLLING),
+                   animation_player, animation_from, animation_to,
+                   (flags & STREAK_MASK) >> STREAK_SHIFT, turn_start)
+
+    @classmethod
+    def from_engine(cls, engine):
+        """Capture the state of a SnakeAndLadderEngine."""
+        positions = [engine.player_positions[i+1] for i in range(engine.total_players)]
+        return cls(positions, engine.current_player, engine.dice_value,
+                   engine.game_over, engine.winner, engine.turn_count,
+                   streak=engine.streak, turn_start=engine.turn_start)
+
+    def apply_to_engine(self, engine):
+        """Restore this state into a SnakeAndLadderEngine."""
+        engine.reset(self.total_players)
+        engine.player_positions = {i+1: pos for i, pos in enumerate(self.positions)}
+        engine.current_player = self.current_player
+        engine.dice_value = self.dice_value
+        engine.game_over = self.game_over
+        engine.winner = self.winner
+        engine.turn_count = self.turn_count
+        engine.streak = self.streak
+        engine.turn_start = self.turn_start
+
+class SnapshotArchive:
+    """File of fixed-size GameState records with O(1) access by index."""
+
+    def __init__(self, path):
+        self.path = path
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'r+b' if not new_file else 'w+b')
+        if new_file:
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            self.file.flush()
+        else:
+            magic, version, record_size = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+                self.file.close()
+                raise ValueError(f"{path} is not a version {VERSION} snapshot archive")
+        self.map = None
+
+    def __len__(self):
+        return (os.fstat(self.file.fileno()).st_size - HEADER.size) // RECORD.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _mapped(self):
+        """Return a memory map covering the whole file, remapping if it grew."""
+        size = os.fstat(self.file.fileno()).st_size
+        if self.map is None or len(self.map) != size:
+            if self.map is not None:
+                self.map.close()
+            self.map = mmap.mmap(self.file.fileno(), size)
+        return self.map
+
+    def offset(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snapshot index out of range")
+        return HEADER.size + index * RECORD.size
+
+    def append(self, state):
+        """Append a state and return its index."""
+        return self.extend([state])
+
+    def extend(self, states):
+        """Append many states; returns the index of the first one."""
+        first = len(self)
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(b''.join(state.pack() for state in states))
+        self.file.flush()
+        return first
+
+    def __getitem__(self, index):
+        return GameState.unpack_from(self._mapped(), self.offset(index))
+
+    def __setitem__(self, index, state):
+        """Overwrite a stored state in place."""
+        state.pack_into(self._mapped(), self.offset(index))
+
+    def flush(self):
+        if self.map is not None:
+            self.map.flush()
+        self.file.flush()
+
+    def close(self):
+        if self.map is not None:
+            self.map.flush()
+            self.map.close()
+            self.map = None
+        self.file.close()
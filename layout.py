@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Window layout: maps the GUI's design coordinates onto any window size.
+
+The GUI is laid out on a fixed 800x600 design canvas (board at 50,50,
+panels at x=600). A Layout scales that canvas uniformly to fit the
+window, centered, so every position and size is computed in real pixels
+and drawn at the window's native resolution instead of stretching an
+800x600 surface. HiDPI windows simply report more pixels and get a
+larger scale.
+
+A Layout is immutable; the GUI makes a new one when the window size
+changes and re-renders its cached layers then, never per frame.
+"""
+import pygame
+
+DESIGN_SIZE = (800, 600)
+MIN_WINDOW_SIZE = (400, 300)
+
+class Layout:
+    """Uniform scale and offset from design coordinates to window pixels."""
+
+    def __init__(self, window_size, design_size=DESIGN_SIZE):
+        self.window_size = tuple(window_size)
+        self.design_size = design_size
+        width, height = self.window_size
+        self.scale = min(width / design_size[0], height / design_size[1])
+        # Letterbox the canvas in the middle of the window
+        self.origin = ((width - design_size[0] * self.scale) / 2,
+                       (height - design_size[1] * self.scale) / 2)
+
+    def __eq__(self, other):
+        return isinstance(other, Layout) and (self.window_size, self.design_size) == \
+            (other.window_size, other.design_size)
+
+    def __hash__(self):
+        return hash((self.window_size, self.design_size))
+
+    def scaled(self, length):
+        """Return a design length in pixels (at least 1)."""
+        return max(1, round(length * self.scale))
+
+    def point(self, x, y):
+        """Return the window pixel for a design point."""
+        return (round(self.origin[0] + x * self.scale), round(self.origin[1] + y * self.scale))
+
+    def rect(self, x, y, width, height):
+        """Return the window Rect for a design rectangle."""
+        left, top = self.point(x, y)
+        right, bottom = self.point(x + width, y + height)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+def parse_window_size(text):
+    """Parse WIDTHxHEIGHT for --window-size."""
+    try:
+        width, height = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"expected WIDTHxHEIGHT, got {text!r}")
+    if width < MIN_WINDOW_SIZE[0] or height < MIN_WINDOW_SIZE[1]:
+        raise ValueError(f"the window must be at least {MIN_WINDOW_SIZE[0]}x{MIN_WINDOW_SIZE[1]}")
+    return width, height
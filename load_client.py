@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Load generator for game_server.py.
+
+Opens many concurrent connections, each of which plays complete games
+(NEW, then ROLL until someone wins), and reports request throughput and
+client-side round-trip latency percentiles. Run it on the same machine as
+the server to benchmark it without any other setup.
+
+Example:
+    python load_client.py --connections 500 --games 20 --players 2
+"""
+import argparse
+import asyncio
+import time
+
+from game_server import DEFAULT_HOST, DEFAULT_PORT
+
+async def request(reader, writer, line, latencies):
+    started = time.perf_counter()
+    writer.write(line.encode('ascii') + b"\n")
+    await writer.drain()
+    reply = (await reader.readline()).decode('ascii').strip()
+    latencies.append(time.perf_counter() - started)
+    if reply.startswith('ERR'):
+        raise RuntimeError(f"{line!r} failed: {reply}")
+    return reply
+
+async def play_games(host, port, games, players, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(games):
+            await request(reader, writer, f"NEW {players}", latencies)
+            while True:
+                reply = await request(reader, writer, "ROLL", latencies)
+                # TURN <player> <dice> <start> <landed> <end> <extra_turn> <winner>
+                if reply.split()[-1] != '0':
+                    break
+        await request(reader, writer, "QUIT", latencies)
+    finally:
+        writer.close()
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(pct / 100 * len(sorted_values)))
+    return sorted_values[index]
+
+async def run_load(host, port, connections, games, players):
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(play_games(host, port, games, players, latencies)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+
+    reader, writer = await asyncio.open_connection(host, port)
+    server_stats = await request(reader, writer, "STATS", [])
+    writer.close()
+    return elapsed, sorted(latencies), server_stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark game_server.py with concurrent clients")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="server address")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="server port")
+    parser.add_argument('--connections', type=int, default=100, help="concurrent connections")
+    parser.add_argument('--games', type=int, default=10, help="games per connection")
+    parser.add_argument('--players', type=int, default=2, choices=range(1, 5), help="players per game")
+    args = parser.parse_args(argv)
+
+    elapsed, latencies, server_stats = asyncio.run(
+        run_load(args.host, args.port, args.connections, args.games, args.players))
+    print(f"Requests: {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} req/s)")
+    print(f"Games: {args.connections * args.games} ({args.connections * args.games / elapsed:.0f} games/s)")
+    print(f"Round-trip latency: p50 {percentile(latencies, 50) * 1000:.2f} ms, "
+          f"p99 {percentile(latencies, 99) * 1000:.2f} ms, max {latencies[-1] * 1000:.2f} ms")
+    print(f"Server: {server_stats}")
+
+if __name__ == "__main__":
+    main()
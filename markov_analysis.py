@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""Exact Markov-chain analysis of a Snake and Ladder board.
+
+A single player's progress is an absorbing Markov chain over cells
+0..board_size, with one step per dice roll taken from the rule variant's
+transition table (by default a 6 is needed to enter at cell 1,
+overshooting the last cell means staying put, and snakes/ladders are
+followed to their final cell). From the chain we compute the expected
+number of rolls to finish, the full distribution of rolls to finish, the
+probability of resting on each cell and the probability of hitting each
+snake and ladder at least once, all without sampling.
+
+A second chain takes one step per turn, a run of extra-turn rolls
+included, and gives the distribution of turns to finish and the exact win
+rate of each seat. Only this one models rules that forfeit a turn after
+repeated extra turns, since then a roll's outcome depends on the turn so
+far and not only on the cell. TurnChain holds that chain densely and can
+be derived from a neighbouring layout's chain, for local search.
+
+Results are memoized per BoardConfig fingerprint, the same key the
+compiled transition tables are cached by. SciPy sparse matrices are
+used for boards of SPARSE_THRESHOLD cells or more when SciPy is
+installed; otherwise dense NumPy linear algebra is used, which needs
+O(n^2) memory and O(n^3) time, so without SciPy boards of more than
+DENSE_MAX_CELLS cells are refused with a ValueError.
+"""
+import argparse
+import functools
+from collections import defaultdict, namedtuple
+
+import numpy as np
+
+try:
+    import scipy.sparse
+    import scipy.sparse.linalg
+except ImportError:  # SciPy is optional; dense NumPy is fine for small boards
+    scipy = None
+
+from board_config import BoardConfig
+from rules import CLASSIC_RULES, FORFEIT, add_rules_argument, compile_rules, rules_spec
+from snake_ladder_engine import SnakeAndLadderEngine
+
+SPARSE_THRESHOLD = 400
+DISTRIBUTION_TOLERANCE = 1e-12
+MAX_DISTRIBUTION_TURNS = 100000
+STREAK_TOLERANCE = 1e-16
+# Linear systems (dense matrices on small boards) kept per layout; results are cached separately
+CHAIN_CACHE_SIZE = 16
+# Largest board solved with dense matrices (32 MB each); larger boards need SciPy
+DENSE_MAX_CELLS = 2000
+
+# expected_rolls: mean rolls to finish from off the board
+# roll_distribution: array where index k is the probability of finishing on roll k
+# visit_probability: array where index c is the probability of resting on cell c at least once
+# snake_hits / ladder_hits: {start cell: probability of taking it at least once}
+MarkovAnalysis = namedtuple('MarkovAnalysis', [
+    'fingerprint', 'expected_rolls', 'roll_distribution', 'visit_probability',
+    'snake_hits', 'ladder_hits'
+])
+
+def build_transitions(snakes, ladders, board_size=100, rules=CLASSIC_RULES):
+    """Return the single-roll transitions of the chain.
+
+    Each transition is (source, destination, probability, jump_starts) where
+    jump_starts are the snake heads and ladder bottoms taken along the way.
+    """
+    if rules.forfeit_after is not None:
+        raise ValueError(f"per-roll analysis cannot model the {rules_spec(rules)} rules; "
+                         "use turns_to_finish() or seat_win_rates()")
+    engine = SnakeAndLadderEngine(snakes=snakes, ladders=ladders, board_size=board_size, rules=rules)
+    table = engine.table
+    transitions = []
+    for cell in range(board_size):
+        for roll in table.rolls:
+            landed = table.landed[cell][roll]
+            end, hops = engine.resolve_jumps(landed)
+            chain = [landed] + hops
+            transitions.append((cell, min(end, board_size), table.roll_probabilities[roll],
+                                tuple(chain[:-1])))
+    return transitions
+
+def turn_outcomes(table, start, tolerance=STREAK_TOLERANCE):
+    """Follow one turn started on `start` and return (outcomes, rolls, cells).
+
+    outcomes maps each cell the turn can end on to its probability, rolls
+    is the expected number of rolls in the turn and cells lists the cells
+    rolled from, i.e. the rows of the transition table the turn depends on.
+    """
+    n = table.board_size
+    probabilities = table.roll_probabilities
+    outcomes = defaultdict(float)
+    rolls = 0.0
+    cells = []
+    cell, streak, mass = start, 0, 1.0
+    while mass > tolerance:
+        rolls += mass
+        cells.append(cell)
+        extra_turn = None
+        for roll in table.rolls:
+            p = mass * probabilities[roll]
+            end = table.end[cell][roll]
+            following = table.streak[streak][roll]
+            if following == FORFEIT:
+                outcomes[start] += p
+            elif following and end < n:
+                extra_turn = (end, following, p)
+            else:
+                outcomes[min(end, n)] += p
+        if extra_turn is None:
+            break
+        cell, streak, mass = extra_turn
+    return outcomes, rolls, cells
+
+def build_turn_transitions(table, tolerance=STREAK_TOLERANCE):
+    """Return (transitions, rolls_per_turn) of the chain with one step per turn.
+
+    From each cell a turn is followed roll by roll while extra turns keep
+    it going (up to a forfeit, or until the remaining probability is below
+    tolerance). rolls_per_turn[c] is the expected number of rolls in a turn
+    started on cell c.
+    """
+    n = table.board_size
+    transitions = []
+    rolls_per_turn = np.zeros(n)
+    for start in range(n):
+        outcomes, rolls_per_turn[start], _ = turn_outcomes(table, start, tolerance)
+        transitions.extend((start, dst, p, ()) for dst, p in outcomes.items())
+    return transitions, rolls_per_turn
+
+class _LinearSystem:
+    """Transient matrix Q of the chain with dense or sparse solvers."""
+
+    def __init__(self, transitions, board_size):
+        self.size = board_size
+        self.sparse = scipy is not None and board_size >= SPARSE_THRESHOLD
+        if not self.sparse and board_size > DENSE_MAX_CELLS:
+            raise ValueError(f"analysing boards of more than {DENSE_MAX_CELLS} cells needs SciPy "
+                             f"(pip install scipy); this board has {board_size}")
+        rows, cols, probs = [], [], []
+        for src, dst, prob, _ in transitions:
+            if dst < board_size:
+                rows.append(src)
+                cols.append(dst)
+                probs.append(prob)
+        self.rows = np.asarray(rows)
+        self.cols = np.asarray(cols)
+        self.probs = np.asarray(probs)
+        self.q = self.matrix(self.rows, self.cols, self.probs)
+        self.a = self.identity() - self.q
+        self.lu = scipy.sparse.linalg.splu(self.a.tocsc()) if self.sparse else None
+        self.inverse = None  # Dense N = (I - Q)^-1, computed on first use and reused
+
+    def matrix(self, rows, cols, probs):
+        n = self.size
+        if self.sparse:
+            return scipy.sparse.csr_matrix((probs, (rows, cols)), shape=(n, n))
+        q = np.zeros((n, n))
+        np.add.at(q, (rows, cols), probs)
+        return q
+
+    def identity(self):
+        if self.sparse:
+            return scipy.sparse.identity(self.size, format='csr')
+        return np.eye(self.size)
+
+    def solve(self, b, transpose=False):
+        """Solve (I - Q) x = b, or (I - Q)^T x = b."""
+        if self.sparse:
+            return self.lu.solve(b, trans='T' if transpose else 'N')
+        n = self.dense_inverse()
+        return (n.T if transpose else n) @ b
+
+    def dense_inverse(self):
+        if self.inverse is None:
+            self.inverse = np.linalg.inv(self.a)
+        return self.inverse
+
+    def solve_modified(self, removed_rows, removed_cols, removed_probs, b):
+        """Solve (I - Q') x = b where Q' is Q without the given transitions."""
+        a = self.a + self.matrix(removed_rows, removed_cols, removed_probs)
+        if self.sparse:
+            return scipy.sparse.linalg.spsolve(a.tocsc(), b)
+        return np.linalg.solve(a, b)
+
+    def fundamental_diagonal(self):
+        """Return the diagonal of N = (I - Q)^-1."""
+        if not self.sparse:
+            return np.diag(self.dense_inverse()).copy()
+        n = self.size
+        diag = np.empty(n)
+        chunk = 256
+        for start in range(0, n, chunk):
+            stop = min(start + chunk, n)
+            rhs = np.zeros((n, stop - start))
+            rhs[np.arange(start, stop), np.arange(stop - start)] = 1.0
+            cols = self.lu.solve(rhs)
+            diag[start:stop] = cols[np.arange(start, stop), np.arange(stop - start)]
+        return diag
+
+def roll_distribution(system, tolerance=DISTRIBUTION_TOLERANCE, max_turns=MAX_DISTRIBUTION_TURNS):
+    """Return the probability of finishing on each roll, starting off the board."""
+    state = np.zeros(system.size)
+    state[0] = 1.0
+    q_t = system.q.T
+    remaining = 1.0
+    distribution = [0.0]
+    while remaining > tolerance and len(distribution) <= max_turns:
+        state = q_t @ state
+        still_playing = float(state.sum())
+        distribution.append(remaining - still_playing)
+        remaining = still_playing
+    return np.asarray(distribution)
+
+def hit_probability(system, transitions, start_cell):
+    """Return the probability of taking the snake or ladder at start_cell at least once."""
+    b = np.zeros(system.size)
+    rows, cols, probs = [], [], []
+    for src, dst, prob, jump_starts in transitions:
+        if start_cell in jump_starts:
+            b[src] += prob
+            # Hitting it ends the question, so drop the onward transition
+            if dst < system.size:
+                rows.append(src)
+                cols.append(dst)
+                probs.append(prob)
+    if not b.any():
+        return 0.0
+    h = system.solve_modified(np.asarray(rows, dtype=int), np.asarray(cols, dtype=int),
+                              np.asarray(probs), b)
+    return float(h[0])
+
+def absorption_vector(transitions, board_size):
+    """Return the probability of finishing in one step from each transient cell."""
+    absorb = np.zeros(board_size)
+    for src, dst, prob, _ in transitions:
+        if dst >= board_size:
+            absorb[src] += prob
+    return absorb
+
+def finish_distribution(q, absorb, tolerance=DISTRIBUTION_TOLERANCE, max_turns=MAX_DISTRIBUTION_TURNS):
+    """Return the probability of finishing on each step of a chain, starting on cell 0."""
+    q_t = q.T
+    state = np.zeros(q.shape[0])
+    state[0] = 1.0
+    distribution = [0.0]
+    remaining = 1.0
+    while remaining > tolerance and len(distribution) <= max_turns:
+        distribution.append(float(state @ absorb))
+        state = q_t @ state
+        remaining = float(state.sum())
+    return np.asarray(distribution)
+
+def win_rates(p, total_players):
+    """Return each seat's probability of winning, given each player's distribution of turns to finish.
+
+    Players finish independently after T turns; seat i wins if every
+    earlier seat needs more than T turns and every later seat at least T.
+    """
+    # survival[t] = P(T >= t)
+    survival = np.concatenate([[1.0], 1.0 - np.cumsum(p)])[:len(p) + 1]
+    survival = np.clip(survival, 0.0, 1.0)
+    turns = np.arange(1, len(p))
+    rates = []
+    for seat in range(1, total_players + 1):
+        rates.append(float(np.sum(p[turns] * survival[turns + 1] ** (seat - 1)
+                                  * survival[turns] ** (total_players - seat))))
+    return rates
+
+class TurnChain:
+    """Dense per-turn chain of one layout, for searches that move one snake or ladder at a time.
+
+    Given the chain of a neighbouring layout (same size and rules), only the
+    turns that roll from a cell whose moves changed are followed again, and
+    the fundamental matrix N = (I - Q)^-1 is updated for the changed rows of
+    Q with the Woodbury identity instead of being inverted again. Every
+    REFRESH_INTERVAL updates N is inverted afresh so rounding cannot build up.
+    """
+
+    REFRESH_INTERVAL = 50
+
+    def __init__(self, table, parent=None, tolerance=STREAK_TOLERANCE):
+        n = self.size = table.board_size
+        if n > DENSE_MAX_CELLS:
+            raise ValueError(f"a dense turn chain of {n} cells is too large; the limit is {DENSE_MAX_CELLS}")
+        self.table = table
+        if parent is not None and (parent.size != n or parent.table.rules != table.rules):
+            parent = None
+        if parent is None:
+            rows = range(n)
+            self.q = np.zeros((n, n))
+            self.absorb = np.zeros(n)
+            self.rolls_per_turn = np.zeros(n)
+            self.cells = [()] * n
+        else:
+            changed = {cell for cell in range(n) if table.end[cell] != parent.table.end[cell]}
+            rows = [start for start in range(n) if not changed.isdisjoint(parent.cells[start])]
+            self.q = parent.q.copy()
+            self.absorb = parent.absorb.copy()
+            self.rolls_per_turn = parent.rolls_per_turn.copy()
+            self.cells = list(parent.cells)
+        self.rebuilt_rows = len(rows)
+
+        for start in rows:
+            outcomes, self.rolls_per_turn[start], cells = turn_outcomes(table, start, tolerance)
+            self.cells[start] = frozenset(cells)
+            self.q[start] = 0.0
+            self.absorb[start] = 0.0
+            for dst, p in outcomes.items():
+                if dst < n:
+                    self.q[start, dst] += p
+                else:
+                    self.absorb[start] += p
+
+        self.fundamental = None
+        if parent is not None and parent.updates < self.REFRESH_INTERVAL and len(rows) < n // 2:
+            self.fundamental = self.updated_fundamental(parent, np.asarray(rows, dtype=int))
+            self.updates = parent.updates + 1
+        if self.fundamental is None:
+            self.fundamental = np.linalg.inv(np.eye(n) - self.q)
+            self.updates = 0
+
+    def updated_fundamental(self, parent, rows):
+        """Return N for this chain from the parent's N, or None if the update is ill-conditioned.
+
+        Q = Q_parent + E D with D the k changed rows, so by Woodbury
+        N = N_p + N_p E (I - D N_p E)^-1 D N_p, costing O(n^2 k) instead of O(n^3).
+        """
+        if not rows.size:
+            return parent.fundamental
+        delta = self.q[rows] - parent.q[rows]
+        delta_n = delta @ parent.fundamental
+        try:
+            correction = np.linalg.solve(np.eye(rows.size) - delta_n[:, rows], delta_n)
+        except np.linalg.LinAlgError:
+            return None
+        return parent.fundamental + parent.fundamental[:, rows] @ correction
+
+    def expected_turns(self):
+        """Return the expected number of turns for one player to finish."""
+        return float(self.fundamental[0].sum())
+
+    def expected_rolls(self):
+        """Return the expected number of rolls for one player to finish."""
+        # Expected turns started on each cell, times the rolls such a turn takes
+        return float(self.fundamental[0] @ self.rolls_per_turn)
+
+    def turns_to_finish(self, tolerance=DISTRIBUTION_TOLERANCE, max_turns=MAX_DISTRIBUTION_TURNS):
+        """Return an array where index k is the probability of finishing on turn k."""
+        return finish_distribution(self.q, self.absorb, tolerance, max_turns)
+
+@functools.lru_cache(maxsize=CHAIN_CACHE_SIZE)
+def _chain(fingerprint, rules=CLASSIC_RULES):
+    """Return the (transitions, linear system) of a layout; shared by all metrics."""
+    board_size, snakes, ladders = fingerprint
+    transitions = build_transitions(dict(snakes), dict(ladders), board_size, rules)
+    return transitions, _LinearSystem(transitions, board_size)
+
+@functools.lru_cache(maxsize=CHAIN_CACHE_SIZE)
+def _turn_chain(fingerprint, rules=CLASSIC_RULES):
+    """Return the (linear system, absorption vector, rolls per turn) of the per-turn chain."""
+    board_size, snakes, ladders = fingerprint
+    table = compile_rules(BoardConfig(dict(snakes), dict(ladders), board_size), rules)
+    transitions, rolls_per_turn = build_turn_transitions(table)
+    return (_LinearSystem(transitions, board_size), absorption_vector(transitions, board_size),
+            rolls_per_turn)
+
+@functools.lru_cache(maxsize=1024)
+def _turns_to_finish(fingerprint, rules=CLASSIC_RULES, tolerance=DISTRIBUTION_TOLERANCE,
+                     max_turns=MAX_DISTRIBUTION_TURNS):
+    """Return the distribution of turns (not rolls) to finish."""
+    system, absorb, _ = _turn_chain(fingerprint, rules)
+    return finish_distribution(system.q, absorb, tolerance, max_turns)
+
+def expected_rolls(snakes, ladders, board_size=100, rules=CLASSIC_RULES):
+    """Return the expected number of rolls for one player to finish."""
+    fingerprint = BoardConfig(snakes, ladders, board_size).fingerprint()
+    system, _, rolls_per_turn = _turn_chain(fingerprint, rules)
+    # Expected turns started on each cell, times the rolls such a turn takes
+    turns_started = system.solve(np.eye(1, board_size, 0).ravel(), transpose=True)
+    return float(turns_started @ rolls_per_turn)
+
+def turns_to_finish(snakes, ladders, board_size=100, rules=CLASSIC_RULES):
+    """Return an array where index k is the probability of one player finishing on turn k."""
+    return _turns_to_finish(BoardConfig(snakes, ladders, board_size).fingerprint(), rules)
+
+def seat_win_rates(snakes, ladders, board_size=100, total_players=2, rules=CLASSIC_RULES):
+    """Return the exact probability of each seat winning a game of total_players."""
+    return win_rates(turns_to_finish(snakes, ladders, board_size, rules), total_players)
+
+@functools.lru_cache(maxsize=1024)
+def _analyze(fingerprint, rules=CLASSIC_RULES):
+    board_size, snakes, ladders = fingerprint
+    snakes = dict(snakes)
+    ladders = dict(ladders)
+    transitions, system = _chain(fingerprint, rules)
+
+    # Expected rolls to finish: (I - Q) t = 1
+    expected = system.solve(np.ones(board_size))
+
+    # Row 0 of the fundamental matrix gives expected visits from the start
+    visits = system.solve(np.eye(1, board_size, 0).ravel(), transpose=True)
+    visit_probability = np.ones(board_size + 1)
+    visit_probability[:board_size] = visits / system.fundamental_diagonal()
+    visit_probability[0] = 1.0
+
+    return MarkovAnalysis(
+        fingerprint=fingerprint,
+        expected_rolls=float(expected[0]),
+        roll_distribution=roll_distribution(system),
+        visit_probability=visit_probability,
+        snake_hits={head: hit_probability(system, transitions, head) for head in sorted(snakes)},
+        ladder_hits={bottom: hit_probability(system, transitions, bottom) for bottom in sorted(ladders)},
+    )
+
+def analyze_board(snakes, ladders, board_size=100, rules=CLASSIC_RULES):
+    """Return the MarkovAnalysis for a board layout, memoized per fingerprint and rules.
+
+    Raises ValueError for rules that forfeit a turn after repeated extra turns.
+    """
+    return _analyze(BoardConfig(snakes, ladders, board_size).fingerprint(), rules)
+
+def clear_cache():
+    """Forget all memoized analyses."""
+    _analyze.cache_clear()
+    _chain.cache_clear()
+    _turn_chain.cache_clear()
+    _turns_to_finish.cache_clear()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exact Markov-chain analysis of the default board")
+    parser.add_argument('--quantiles', type=float, nargs='*', default=[0.5, 0.9, 0.99],
+                        help="quantiles of the number of rolls to report")
+    add_rules_argument(parser)
+    args = parser.parse_args(argv)
+
+    engine = SnakeAndLadderEngine()
+    rules = args.rules
+    print(f"Expected rolls to finish: {expected_rolls(engine.snakes, engine.ladders, engine.board_size, rules):.3f}")
+    if rules.forfeit_after is None:
+        result = analyze_board(engine.snakes, engine.ladders, engine.board_size, rules)
+        cdf = np.cumsum(result.roll_distribution)
+        for q in args.quantiles:
+            print(f"{q:.0%} of games finish within {int(np.searchsorted(cdf, q))} rolls")
+        for head, prob in result.snake_hits.items():
+            print(f"Snake {head}->{engine.snakes[head]}: hit in {prob:.2%} of games")
+        for bottom, prob in result.ladder_hits.items():
+            print(f"Ladder {bottom}->{engine.ladders[bottom]}: climbed in {prob:.2%} of games")
+    for players in range(2, 5):
+        rates = seat_win_rates(engine.snakes, engine.ladders, engine.board_size, players, rules)
+        print(f"{players} players, win rate by seat: " + ", ".join(f"{r:.4f}" for r in rates))
+
+if __name__ == "__main__":
+    main()
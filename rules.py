@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Rule variants compiled into per-cell, per-roll transition tables.
+
+A RuleSet describes a variant of the rules:
+
+    dice             number of six-sided dice rolled and summed
+    entry_roll       roll needed to enter the board at cell 1 (None: move in from 0 by the roll)
+    extra_turn_roll  roll that gives another roll in the same turn (None: never)
+    forfeit_after    that many extra-turn rolls in a row forfeit the turn: the player goes
+                     back to where the turn started (None: never; at most 8)
+    bounce           overshooting the last cell bounces back by the excess instead of
+                     staying put
+
+and compile_rules() turns a RuleSet and a board into a TransitionTable:
+for every cell and roll the cell landed on and the final cell after
+snakes and ladders, and for every streak of extra turns and roll the next
+streak. The engine, the GUI, the game server, the simulators and the
+Markov analysis all play from the same tables, so a variant costs nothing
+per move: no rule is checked, only looked up.
+
+Variants are written as comma-separated options, e.g. "bounce,three-sixes"
+or "no-entry,dice=2"; see parse_rules().
+"""
+import argparse
+import functools
+from collections import namedtuple
+
+from board_config import BoardConfig
+
+SIDES = 6
+MAX_DICE = 3
+FORFEIT = -1  # Streak table value: the roll forfeits the turn
+# Streaks reach forfeit_after - 1 and are saved in 3 bits of a GameState record
+MAX_FORFEIT_AFTER = 8
+
+RuleSet = namedtuple('RuleSet', ['dice', 'entry_roll', 'extra_turn_roll', 'forfeit_after', 'bounce'])
+
+CLASSIC_RULES = RuleSet(dice=1, entry_roll=6, extra_turn_roll=6, forfeit_after=None, bounce=False)
+
+class RulesError(ValueError):
+    """Raised when a rule variant is invalid or cannot be parsed."""
+
+def parse_rules(spec):
+    """Return the RuleSet for a comma-separated list of options applied to the classic rules.
+
+    Options: classic, bounce, no-entry, entry=N, no-extra-turn, extra=N,
+    three-sixes, forfeit=N, dice=N.
+    """
+    rules = CLASSIC_RULES._asdict()
+    for option in filter(None, (part.strip().lower() for part in (spec or '').split(','))):
+        name, _, value = option.partition('=')
+        try:
+            number = int(value) if value else None
+        except ValueError:
+            raise RulesError(f"{name} needs a number, got {value!r}")
+        if option == 'classic':
+            continue
+        elif option == 'bounce':
+            rules['bounce'] = True
+        elif option == 'no-entry':
+            rules['entry_roll'] = None
+        elif option == 'no-extra-turn':
+            rules['extra_turn_roll'] = None
+        elif option == 'three-sixes':
+            rules['forfeit_after'] = 3
+        elif name in ('entry', 'extra', 'forfeit', 'dice') and number is not None:
+            field = {'entry': 'entry_roll', 'extra': 'extra_turn_roll',
+                     'forfeit': 'forfeit_after', 'dice': 'dice'}[name]
+            rules[field] = number
+        else:
+            raise RulesError(f"unknown rule option {option!r}")
+    rules = RuleSet(**rules)
+    validate_rules(rules)
+    return rules
+
+def validate_rules(rules):
+    """Raise RulesError if the variant cannot be played."""
+    if not 1 <= rules.dice <= MAX_DICE:
+        raise RulesError(f"dice must be between 1 and {MAX_DICE}, got {rules.dice}")
+    max_roll = rules.dice * SIDES
+    for field in ('entry_roll', 'extra_turn_roll'):
+        value = getattr(rules, field)
+        if value is not None and not rules.dice <= value <= max_roll:
+            raise RulesError(f"{field} must be a possible roll ({rules.dice}-{max_roll}), got {value}")
+    if rules.forfeit_after is not None:
+        if rules.extra_turn_roll is None:
+            raise RulesError("forfeiting after repeated extra turns needs an extra-turn roll")
+        if not 1 <= rules.forfeit_after <= MAX_FORFEIT_AFTER:
+            raise RulesError(f"forfeit_after must be between 1 and {MAX_FORFEIT_AFTER}, "
+                             f"got {rules.forfeit_after}")
+
+def rules_spec(rules):
+    """Return the option string that parse_rules() turns back into these rules."""
+    if rules == CLASSIC_RULES:
+        return 'classic'
+    options = []
+    if rules.dice != CLASSIC_RULES.dice:
+        options.append(f"dice={rules.dice}")
+    if rules.entry_roll is None:
+        options.append('no-entry')
+    elif rules.entry_roll != CLASSIC_RULES.entry_roll:
+        options.append(f"entry={rules.entry_roll}")
+    if rules.extra_turn_roll is None:
+        options.append('no-extra-turn')
+    elif rules.extra_turn_roll != CLASSIC_RULES.extra_turn_roll:
+        options.append(f"extra={rules.extra_turn_roll}")
+    if rules.forfeit_after is not None:
+        options.append(f"forfeit={rules.forfeit_after}")
+    if rules.bounce:
+        options.append('bounce')
+    return ','.join(options)
+
+def roll_probabilities(dice):
+    """Return a list where index r is the probability of rolling a total of r."""
+    probabilities = [1.0]
+    for _ in range(dice):
+        summed = [0.0] * (len(probabilities) + SIDES)
+        for total, p in enumerate(probabilities):
+            for face in range(1, SIDES + 1):
+                summed[total + face] += p / SIDES
+        probabilities = summed
+    return probabilities
+
+def landing_cell(rules, cell, roll, board_size):
+    """Return the cell a roll from `cell` lands on, before snakes and ladders."""
+    if cell == 0 and rules.entry_roll is not None:
+        return 1 if roll == rules.entry_roll else 0
+    target = cell + roll
+    if target <= board_size:
+        return target
+    if rules.bounce:
+        return max(2 * board_size - target, 0)
+    return cell
+
+def streak_table(rules):
+    """Return rows[streak][roll] -> streak after the roll (0 ends the turn, FORFEIT forfeits it)."""
+    max_roll = rules.dice * SIDES
+    if rules.extra_turn_roll is None:
+        return [[0] * (max_roll + 1)]
+    # Without a forfeit only "extra turn pending or not" matters
+    states = rules.forfeit_after or 2
+    rows = []
+    for streak in range(states):
+        if rules.forfeit_after is None:
+            following = 1
+        elif streak + 1 >= rules.forfeit_after:
+            following = FORFEIT
+        else:
+            following = streak + 1
+        rows.append([following if roll == rules.extra_turn_roll else 0 for roll in range(max_roll + 1)])
+    return rows
+
+def _roll_one(rng):
+    return rng.randint(1, SIDES)
+
+def _roll_many(dice, rng):
+    return sum(rng.randint(1, SIDES) for _ in range(dice))
+
+class TransitionTable:
+    """A rule variant compiled against one board.
+
+    landed[cell][roll] and end[cell][roll] (cells 0..board_size, rolls
+    0..max_roll) are the cell moved to and the final cell after jumps;
+    streak[streak][roll] is the next streak of extra turns.
+    """
+
+    def __init__(self, board, rules=CLASSIC_RULES):
+        validate_rules(rules)
+        self.rules = rules
+        self.board_size = n = board.board_size
+        self.max_roll = rules.dice * SIDES
+        self.roll_probabilities = roll_probabilities(rules.dice)
+        self.rolls = [roll for roll, p in enumerate(self.roll_probabilities) if p]
+        jump = board.jump_table
+        self.landed = [[landing_cell(rules, cell, roll, n) for roll in range(self.max_roll + 1)]
+                       for cell in range(n + 1)]
+        self.end = [[jump[landed] for landed in row] for row in self.landed]
+        self.streak = streak_table(rules)
+        # Keep the classic single-die roll identical so seeded games replay unchanged
+        self.roll = _roll_one if rules.dice == 1 else functools.partial(_roll_many, rules.dice)
+        stuck = self.unfinishable_cells()
+        if stuck:
+            raise RulesError(f"with the {rules_spec(rules)} rules the game can never finish from "
+                             f"cell {stuck[0]} (e.g. overshooting with several dice; try bounce)")
+
+    def unfinishable_cells(self):
+        """Return the cells a player can reach but never finish from."""
+        n = self.board_size
+        reachable = {0}
+        frontier = [0]
+        preceding = {}
+        while frontier:
+            cell = frontier.pop()
+            for roll in self.rolls:
+                end = self.end[cell][roll]
+                preceding.setdefault(end, set()).add(cell)
+                if end not in reachable:
+                    reachable.add(end)
+                    if end != n:
+                        frontier.append(end)
+        finishing = {n}
+        frontier = [n]
+        while frontier:
+            for cell in preceding.get(frontier.pop(), ()):
+                if cell not in finishing:
+                    finishing.add(cell)
+                    frontier.append(cell)
+        return sorted(reachable - finishing)
+
+@functools.lru_cache(maxsize=64)
+def _compile(fingerprint, rules):
+    board_size, snakes, ladders = fingerprint
+    return TransitionTable(BoardConfig(dict(snakes), dict(ladders), board_size), rules)
+
+def compile_rules(board, rules=None):
+    """Return the TransitionTable for a BoardConfig, shared by everything playing that board."""
+    return _compile(board.fingerprint(), rules or CLASSIC_RULES)
+
+def rules_argument(spec):
+    """argparse type for --rules: parse a variant and check it can finish on the default board."""
+    try:
+        rules = parse_rules(spec)
+        compile_rules(BoardConfig(), rules)
+    except RulesError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return rules
+
+def add_rules_argument(parser):
+    """Add the --rules option shared by the command-line tools."""
+    parser.add_argument('--rules', type=rules_argument, default=CLASSIC_RULES, metavar='OPTIONS',
+                        help="rule variant, e.g. 'bounce,three-sixes' or 'no-entry,dice=2' "
+                             "(options: bounce, no-entry, entry=N, no-extra-turn, extra=N, "
+                             "three-sixes, forfeit=N, dice=N)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show how a rule variant compiles on the default board")
+    add_rules_argument(parser)
+    args = parser.parse_args(argv)
+
+    table = compile_rules(BoardConfig(), args.rules)
+    print(f"Rules: {rules_spec(args.rules)} ({args.rules})")
+    print("Roll probabilities: " + ", ".join(f"{roll}: {table.roll_probabilities[roll]:.4f}"
+                                              for roll in table.rolls))
+    for cell in (0, table.board_size - 3):
+        print(f"From cell {cell}: " + ", ".join(f"{roll}->{table.end[cell][roll]}" for roll in table.rolls))
+    print(f"Streak table: {table.streak}")
+
+if __name__ == "__main__":
+    main()
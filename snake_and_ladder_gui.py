@@ -1,22 +1,52 @@
 #!/usr/bin/env python3
+import time
+LAUNCH_TIME = time.perf_counter()  # Taken before the pygame import, which dominates startup
+
+import argparse
 import pygame
 import random
 import sys
 import os
 import math
+from collections import OrderedDict
+from snake_ladder_engine import SnakeAndLadderEngine
+from board_config import BoardConfig, BoardConfigError, BoardWatcher
+from game_state import GameState
+from game_log import GameLog, GameLogWriter, new_log_path
+from frame_profiler import FrameProfiler
+from asset_cache import AssetCache, content_hash, default_cache_dir, file_hash
+from rules import add_rules_argument
+from token_path import build_path, quadratic_bezier
+from layout import Layout, parse_window_size
+from widgets import Button, WidgetLayer, DISABLED, HIDDEN, LOOKUP_CELL_SIZE, NORMAL, SELECTED
 
-# Initialize pygame
-pygame.init()
-
-# Constants
+# Constants; positions and sizes are in design pixels on an 800x600 canvas
+# that the Layout scales to the window
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 BOARD_SIZE = 500
+BOARD_POS = (50, 50)
+DICE_POS = (600, 150)
+INFO_POS = (600, 300)
+MESSAGE_POS = (600, 450)
+INFO_LINE_HEIGHT = 30
+INFO_PADDING = 5  # The current player's highlight reaches this far outside INFO_POS
+MESSAGE_HEIGHT = 40
 GRID_SIZE = 10
 CELL_SIZE = BOARD_SIZE // GRID_SIZE
 DICE_SIZE = 80
 BUTTON_WIDTH = 150
 BUTTON_HEIGHT = 50
+TEXT_CACHE_SIZE = 256
+TOKEN_PATH_CACHE_SIZE = 512
+DICE_ROLL_MS = 1000  # The token starts moving once the dice has settled
+TOKEN_SPRITE_SIZE = 24
+MAX_ZOOM = 4.0
+SCROLL_STEP = CELL_SIZE
+ZOOM_STEP = 1.25
+FRAME_CAP = 60
+BOARD_RELOAD_EVENT = pygame.USEREVENT + 1
+BOARD_POLL_MS = 1000
 
 # Colors
 WHITE = (255, 255, 255)
@@ -36,18 +66,348 @@ LADDER_COLOR = (150, 100, 50)
 # Player colors
 PLAYER_COLORS = [RED, BLUE, GREEN, YELLOW]
 
+def init_pygame():
+    """Initialize only the pygame subsystems the GUI uses (not audio or joysticks)."""
+    # Render at the monitor's real resolution on HiDPI Windows displays instead
+    # of letting the system upscale the window
+    os.environ.setdefault('SDL_WINDOWS_DPI_AWARENESS', 'permonitorv2')
+    pygame.display.init()
+    pygame.font.init()
+
+def get_ticks():
+    """Milliseconds since launch; like get_ticks() without the SDL timer subsystem."""
+    return int((time.perf_counter() - LAUNCH_TIME) * 1000)
+
+def elapsed_ms():
+    return (time.perf_counter() - LAUNCH_TIME) * 1000
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces."""
+    
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def render(self, font, text, color, antialias=True):
+        """Return a rendered surface for the text, rendering it only on a cache miss."""
+        key = (font, text, color, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+    
+    def stats(self):
+        """Return the hit/miss/eviction counters and current size."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.surfaces),
+        }
+    
+    def clear(self):
+        """Drop all cached surfaces and reset the counters."""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+class TokenSprite(pygame.sprite.DirtySprite):
+    """Dirty sprite for one player's token."""
+    
+    def __init__(self, gui, player):
+        super().__init__()
+        self.gui = gui
+        self.player = player
+        size = gui.layout.scaled(TOKEN_SPRITE_SIZE)
+        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+        half = size // 2
+        gui.draw_token(self.image, player, (half, half))
+        self.rect = self.image.get_rect()
+        self.center = None
+        self.visible = 0
+        self.dirty = 0
+    
+    def update(self):
+        center = self.gui.get_token_position(self.player)
+        if center == self.center:
+            return
+        self.center = center
+        if center is None:
+            self.visible = 0
+        else:
+            self.visible = 1
+            self.rect.center = center
+        self.dirty = 1
+
+class PanelSprite(pygame.sprite.DirtySprite):
+    """Dirty sprite that re-renders a HUD panel only when its state changes."""
+    
+    def __init__(self, rect, draw_func, state_func):
+        super().__init__()
+        self.rect = pygame.Rect(rect)
+        self.image = pygame.Surface(self.rect.size)
+        self.draw_func = draw_func
+        self.state_func = state_func
+        self.state = None
+    
+    def update(self):
+        state = self.state_func()
+        if state == self.state:
+            return
+        self.state = state
+        self.image.fill(WHITE)
+        self.draw_func(self.image)
+        self.dirty = 1
+
+class DirtyRectRenderer:
+    """Redraws only the screen regions whose sprites changed since the last frame."""
+    
+    def __init__(self, gui):
+        self.gui = gui
+        self.background = pygame.Surface(gui.screen.get_size())
+        self.board_cache_key = None
+        self.needs_full_redraw = True
+        # Start in dirty-rect mode and never fall back to full-screen updates
+        self.group = pygame.sprite.LayeredDirty(_use_update=True)
+        self.group.set_timing_threshold(float('inf'))
+        
+        # Info panel and dice sit below the tokens
+        info_x, info_y = INFO_POS[0] - INFO_PADDING, INFO_POS[1] - INFO_PADDING
+        info_height = INFO_LINE_HEIGHT * (len(PLAYER_COLORS) + 1) + INFO_PADDING
+        self.add_panel((info_x, info_y, SCREEN_WIDTH - info_x, info_height), INFO_POS, gui.draw_player_info,
+                       lambda: (tuple(gui.player_positions.items()), gui.current_player))
+        self.add_panel((*DICE_POS, DICE_SIZE, DICE_SIZE), DICE_POS, gui.draw_dice,
+                       lambda: gui.dice_value)
+        self.add_panel((*MESSAGE_POS, SCREEN_WIDTH - MESSAGE_POS[0], MESSAGE_HEIGHT), MESSAGE_POS,
+                       gui.draw_game_message,
+                       lambda: (gui.game_over, gui.winner, gui.animation_in_progress, gui.current_player))
+        # Buttons redraw themselves when their state changes
+        self.group.add(*gui.widgets.sprites(), layer=0)
+        self.token_sprites = {}
+    
+    def add_panel(self, design_rect, design_pos, draw_func, state_func):
+        """Add a panel covering design_rect whose content is drawn from design_pos."""
+        layout = self.gui.layout
+        rect = layout.rect(*design_rect)
+        x, y = layout.point(*design_pos)
+        self.group.add(PanelSprite(rect, lambda surface: draw_func(surface, x - rect.x, y - rect.y),
+                                   state_func),
+                       layer=0)
+    
+    def invalidate(self):
+        """Force the next frame to repaint the whole screen."""
+        self.needs_full_redraw = True
+    
+    def sync_tokens(self):
+        """Keep one token sprite per player, e.g. after the player count changes."""
+        players = set(self.gui.player_positions)
+        for player in list(self.token_sprites):
+            if player not in players:
+                self.token_sprites.pop(player).kill()
+        for player in players:
+            if player not in self.token_sprites:
+                sprite = TokenSprite(self.gui, player)
+                self.token_sprites[player] = sprite
+                self.group.add(sprite, layer=1)
+    
+    def rebuild_background(self):
+        """Render the static background (white fill plus board layer)."""
+        if self.background.get_size() != self.gui.screen.get_size():
+            self.background = pygame.Surface(self.gui.screen.get_size())
+        self.background.fill(WHITE)
+        screen = self.gui.screen
+        self.gui.screen = self.background
+        try:
+            self.gui.draw_board()
+        finally:
+            self.gui.screen = screen
+        self.board_cache_key = self.gui.board_cache_key
+        self.group.clear(self.gui.screen, self.background)
+    
+    def draw(self):
+        """Draw the changed sprites and push only their rects to the display."""
+        if self.gui.get_board_cache_key() != self.board_cache_key:
+            self.rebuild_background()
+            self.needs_full_redraw = True
+        
+        self.sync_tokens()
+        self.group.update()
+        
+        if self.needs_full_redraw:
+            self.needs_full_redraw = False
+            self.gui.screen.blit(self.background, (0, 0))
+            self.group.repaint_rect(self.gui.screen.get_rect())
+            self.group.draw(self.gui.screen)
+            pygame.display.flip()
+            return [self.gui.screen.get_rect()]
+        
+        rects = self.group.draw(self.gui.screen)
+        if rects:
+            pygame.display.update(rects)
+        return rects
+
+class BoardViewport:
+    """Scrollable, zoomable window onto a board that may be larger than the screen.
+    
+    Board coordinates are design pixels; view coordinates are screen pixels
+    relative to the top-left of the board area on screen. `scale` is the
+    window's screen pixels per design pixel, so zoom 1 at scale 2 shows
+    the board at zoom `scale` = 2.
+    """
+    
+    def __init__(self, world_size, width, height, scale=1.0):
+        self.world_size = world_size
+        self.scale = scale
+        self.width = min(width, round(world_size * scale))
+        self.height = min(height, round(world_size * scale))
+        self.min_zoom = max(self.width, self.height) / world_size
+        self.max_zoom = MAX_ZOOM * scale
+        self.zoom = scale
+        # Start scrolled to the bottom-left, where cell 1 is
+        self.scroll_x = 0
+        self.scroll_y = world_size - self.height
+        self.clamp()
+    
+    def state(self):
+        return (self.zoom, self.scroll_x, self.scroll_y, self.width, self.height)
+    
+    def clamp(self):
+        self.zoom = min(max(self.zoom, self.min_zoom), self.max_zoom)
+        self.scroll_x = min(max(self.scroll_x, 0), self.world_size * self.zoom - self.width)
+        self.scroll_y = min(max(self.scroll_y, 0), self.world_size * self.zoom - self.height)
+    
+    def to_view(self, x, y):
+        """Convert board coordinates to view coordinates."""
+        return (round(x * self.zoom - self.scroll_x), round(y * self.zoom - self.scroll_y))
+    
+    def contains(self, view_pos):
+        return 0 <= view_pos[0] < self.width and 0 <= view_pos[1] < self.height
+    
+    def visible_rect(self):
+        """Return the visible area in board coordinates."""
+        return pygame.Rect(self.scroll_x / self.zoom, self.scroll_y / self.zoom,
+                           math.ceil(self.width / self.zoom) + 1, math.ceil(self.height / self.zoom) + 1)
+    
+    def visible_cells(self):
+        """Return (first_col, last_col, first_row, last_row) of the visible grid cells."""
+        cells = int(self.world_size // CELL_SIZE)
+        cell_size = CELL_SIZE * self.zoom
+        first_col = int(self.scroll_x // cell_size)
+        first_row = int(self.scroll_y // cell_size)
+        last_col = min(cells - 1, int((self.scroll_x + self.width - 1) // cell_size))
+        last_row = min(cells - 1, int((self.scroll_y + self.height - 1) // cell_size))
+        return first_col, last_col, first_row, last_row
+    
+    def resize(self, width, height, scale):
+        """Fit the view to a new screen size, keeping the same part of the board in view."""
+        center_x = (self.scroll_x + self.width / 2) / self.zoom
+        center_y = (self.scroll_y + self.height / 2) / self.zoom
+        self.zoom *= scale / self.scale
+        self.scale = scale
+        self.width = min(width, round(self.world_size * scale))
+        self.height = min(height, round(self.world_size * scale))
+        self.min_zoom = max(self.width, self.height) / self.world_size
+        self.max_zoom = MAX_ZOOM * scale
+        self.clamp()
+        self.scroll_x = center_x * self.zoom - self.width / 2
+        self.scroll_y = center_y * self.zoom - self.height / 2
+        self.clamp()
+    
+    def scroll_by(self, dx, dy):
+        self.scroll_x += dx
+        self.scroll_y += dy
+        self.clamp()
+    
+    def zoom_by(self, factor):
+        """Zoom around the center of the view."""
+        center_x = (self.scroll_x + self.width / 2) / self.zoom
+        center_y = (self.scroll_y + self.height / 2) / self.zoom
+        self.zoom *= factor
+        self.clamp()
+        self.scroll_x = center_x * self.zoom - self.width / 2
+        self.scroll_y = center_y * self.zoom - self.height / 2
+        self.clamp()
+    
+    def ensure_visible(self, x, y, margin=CELL_SIZE):
+        """Scroll just enough that the board point (x, y) is inside the view."""
+        view_x, view_y = x * self.zoom - self.scroll_x, y * self.zoom - self.scroll_y
+        margin *= self.zoom
+        if view_x < margin:
+            self.scroll_x += view_x - margin
+        elif view_x > self.width - margin:
+            self.scroll_x += view_x - (self.width - margin)
+        if view_y < margin:
+            self.scroll_y += view_y - margin
+        elif view_y > self.height - margin:
+            self.scroll_y += view_y - (self.height - margin)
+        self.clamp()
+
 class SnakeAndLadderGUI:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, dirty_rects=False, rng=None, grid_size=GRID_SIZE,
+                 idle_mode=True, frame_cap=FRAME_CAP, report_cpu=False,
+                 seed=None, record_dir=None, board=None, board_path=None,
+                 profile=False, profile_dump=None, cache_dir=None, report_startup=False,
+                 rules=None, skip_animations=False, window_size=(SCREEN_WIDTH, SCREEN_HEIGHT),
+                 fullscreen=False):
+        # Milliseconds since launch at each startup step, for --report-startup
+        self.startup_times = OrderedDict(imported=elapsed_ms())
+        self.report_startup = report_startup
+        init_pygame()
+        self.windowed_size = window_size
+        self.fullscreen = fullscreen
+        self.screen = self.open_window()
         pygame.display.set_caption("Snake and Ladder Game")
+        # Everything is laid out for the window size; see apply_layout()
+        self.layout = Layout(self.screen.get_size())
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont('Arial', 20)
-        self.large_font = pygame.font.SysFont('Arial', 32)
+        self.startup_times['display'] = elapsed_ms()
+        
+        # Font paths and generated surfaces are cached on disk between launches
+        self.assets = AssetCache(cache_dir)
+        self.font_name = 'Arial'
+        self.text_cache = TextCache()
+        self.load_fonts()
+        self.startup_times['fonts'] = elapsed_ms()
+        
+        # Rules and authoritative game state live in the headless engine
+        if board_path is not None and board is None:
+            board = BoardConfig.load(board_path)
+        if board is None:
+            board = BoardConfig(board_size=grid_size * grid_size)
+        self.grid_size = math.isqrt(board.board_size)
+        if self.grid_size * self.grid_size != board.board_size:
+            raise BoardConfigError(f"the GUI needs a square board, got {board.board_size} cells")
+        self.engine = SnakeAndLadderEngine(total_players=2, rng=rng, board=board, rules=rules)
+        
+        # Poll the board file so edits show up without a restart
+        self.board_watcher = BoardWatcher(board_path) if board_path is not None else None
+        if self.board_watcher is not None:
+            pygame.time.set_timer(BOARD_RELOAD_EVENT, BOARD_POLL_MS)
         
-        # Game state
-        self.board_size = 100
-        self.total_players = 2  # Default
-        self.player_positions = {i+1: 0 for i in range(self.total_players)}
+        # Every game gets its own dice seed so it can be recorded and replayed
+        self.seed_source = random.Random(seed)
+        self.record_dir = record_dir
+        self.log_writer = None
+        self.replay_log = None
+        self.replay_turn = 0
+        
+        # Game state (display copy, synced from the engine after each animation)
+        self.board_size = self.engine.board_size
+        self.total_players = self.engine.total_players
+        self.player_positions = dict(self.engine.player_positions)
         self.current_player = 1
         self.dice_value = 1
         self.dice_rolling = False
@@ -58,272 +418,515 @@ class SnakeAndLadderGUI:
         self.animation_start_time = 0
         self.animation_from = 0
         self.animation_to = 0
+        self.animation_end = 0
         self.animation_player = 0
+        self.animation_path = None
+        self.last_turn = None
+        # Movement paths in board coordinates, per (start, landed, end) move
+        self.token_paths = OrderedDict()
+        # Fast play: moves are applied at once, without dice or token animations
+        self.skip_animations = skip_animations
         self.show_menu = True
         
-        # Define snakes (head: tail)
-        self.snakes = {
-            17: 7,
-            54: 34,
-            62: 19,
-            64: 60,
-            87: 36,
-            93: 73,
-            95: 75,
-            98: 79
-        }
-        
-        # Define ladders (bottom: top)
-        self.ladders = {
-            1: 38,
-            4: 14,
-            9: 31,
-            21: 42,
-            28: 84,
-            51: 67,
-            72: 91,
-            80: 99
-        }
+        # Snakes (head: tail) and ladders (bottom: top) are shared with the engine
+        self.snakes = self.engine.snakes
+        self.ladders = self.engine.ladders
         
         # Load images
         self.load_images()
+        self.startup_times['dice'] = elapsed_ms()
         
         # Board position
-        self.board_x = 50
-        self.board_y = 50
+        self.board_x, self.board_y = self.layout.point(*BOARD_POS)
+        
+        # Precomputed cell coordinates and the scrollable/zoomable view onto them
+        self.build_cell_table()
+        board_side = self.layout.scaled(BOARD_SIZE)
+        self.viewport = BoardViewport(self.grid_size * CELL_SIZE, board_side, board_side, self.layout.scale)
+        
+        # Cached static board layer (rebuilt only when its inputs change); the
+        # first one is also cached on disk, since it is the one every launch draws
+        self.board_surface = None
+        self.grid_surface = None
+        self.grid_cache_key = None
+        self.bake_board = True
+        self.board_cache_key = None
+        self.snake_control_points = {}
+        self.board_features = None
+        self.features_key = None
+        
+        # Main loop pacing: block on events when idle, cap the frame rate when animating
+        self.idle_mode = idle_mode
+        self.frame_cap = frame_cap
+        self.report_cpu = report_cpu
+        self.loop_stats = {phase: {'frames': 0, 'cpu': 0.0, 'wall': 0.0}
+                           for phase in ('idle', 'active')}
         
+        # Buttons with cached surfaces and a lookup for clicks
+        self.widgets = self.build_widgets()
+        
+        # Optional renderer that updates only changed screen regions
+        self.dirty_renderer = DirtyRectRenderer(self) if dirty_rects else None
+        
+        # Per-phase frame timing; F3 toggles the overlay, F4 dumps the samples
+        self.profile_dump = profile_dump
+        self.profiler = FrameProfiler(recording=profile_dump is not None, load_font=self.assets.font)
+        if profile:
+            self.profiler.toggle_overlay()
+        
+    def asset_key(self, *inputs):
+        """Return a cache key for a generated surface; editing this file invalidates every key."""
+        return content_hash(file_hash(__file__), pygame.version.ver, *inputs)
+    
+    def open_window(self):
+        """Open a resizable window, or go fullscreen at the desktop resolution."""
+        if self.fullscreen:
+            return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        return pygame.display.set_mode(self.windowed_size, pygame.RESIZABLE)
+    
+    def toggle_fullscreen(self):
+        if not self.fullscreen:
+            self.windowed_size = self.screen.get_size()
+        self.fullscreen = not self.fullscreen
+        self.open_window()
+        self.apply_layout()
+    
+    def apply_layout(self):
+        """Lay everything out again for the current window size.
+        
+        Fonts, dice faces, the board layer and the panels are re-rendered at
+        the new size here, once per resize, rather than scaled every frame.
+        """
+        self.screen = pygame.display.get_surface()
+        layout = Layout(self.screen.get_size())
+        if layout == self.layout:
+            return
+        self.layout = layout
+        self.load_fonts()
+        self.load_images()
+        self.board_x, self.board_y = layout.point(*BOARD_POS)
+        board_side = layout.scaled(BOARD_SIZE)
+        self.viewport.resize(board_side, board_side, layout.scale)
+        self.board_surface = None
+        self.grid_surface = None
+        self.widgets = self.build_widgets()
+        if self.dirty_renderer is not None:
+            self.dirty_renderer = DirtyRectRenderer(self)
+    
+    def load_fonts(self):
+        """Open the fonts at the sizes for the current layout."""
+        self.font = self.assets.font(self.font_name, self.layout.scaled(20))
+        self.large_font = self.assets.font(self.font_name, self.layout.scaled(32))
+        self.text_cache.clear()  # Rendered with the old fonts
+    
     def load_images(self):
+        """Load the six dice faces, drawing them only if they are not cached."""
+        size = self.layout.scaled(DICE_SIZE)
+        key = self.asset_key('dice', size, WHITE, BLACK)
+        strip = self.assets.surface('dice', key, lambda: self.draw_dice_faces(size))
+        self.dice_images = [strip.subsurface((i * size, 0, size, size)) for i in range(6)]
+    
+    def draw_dice_faces(self, size):
+        """Draw the six dice faces side by side on one surface."""
+        pip = max(1, round(size / 10))
+        strip = pygame.Surface((6 * size, size))
+        
         # Create dice images
-        self.dice_images = []
         for i in range(1, 7):
-            dice_img = pygame.Surface((DICE_SIZE, DICE_SIZE))
+            dice_img = pygame.Surface((size, size))
             dice_img.fill(WHITE)
-            pygame.draw.rect(dice_img, BLACK, (0, 0, DICE_SIZE, DICE_SIZE), 2)
+            pygame.draw.rect(dice_img, BLACK, (0, 0, size, size), max(1, round(size / 40)))
             
             # Draw dots based on dice value
             if i == 1:
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//2, DICE_SIZE//2), 8)
+                pygame.draw.circle(dice_img, BLACK, (size//2, size//2), pip)
             elif i == 2:
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, 3*DICE_SIZE//4), 8)
+                pygame.draw.circle(dice_img, BLACK, (size//4, size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, 3*size//4), pip)
             elif i == 3:
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//2, DICE_SIZE//2), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, 3*DICE_SIZE//4), 8)
+                pygame.draw.circle(dice_img, BLACK, (size//4, size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (size//2, size//2), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, 3*size//4), pip)
             elif i == 4:
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, 3*DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, 3*DICE_SIZE//4), 8)
+                pygame.draw.circle(dice_img, BLACK, (size//4, size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (size//4, 3*size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, 3*size//4), pip)
             elif i == 5:
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, 3*DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//2, DICE_SIZE//2), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, 3*DICE_SIZE//4), 8)
+                pygame.draw.circle(dice_img, BLACK, (size//4, size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (size//4, 3*size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (size//2, size//2), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, 3*size//4), pip)
             elif i == 6:
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, DICE_SIZE//2), 8)
-                pygame.draw.circle(dice_img, BLACK, (DICE_SIZE//4, 3*DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, DICE_SIZE//4), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, DICE_SIZE//2), 8)
-                pygame.draw.circle(dice_img, BLACK, (3*DICE_SIZE//4, 3*DICE_SIZE//4), 8)
+                pygame.draw.circle(dice_img, BLACK, (size//4, size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (size//4, size//2), pip)
+                pygame.draw.circle(dice_img, BLACK, (size//4, 3*size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, size//4), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, size//2), pip)
+                pygame.draw.circle(dice_img, BLACK, (3*size//4, 3*size//4), pip)
                 
-            self.dice_images.append(dice_img)
+            strip.blit(dice_img, ((i - 1) * size, 0))
+        return strip
     
-    def get_cell_position(self, cell_number):
-        """Convert cell number (1-100) to pixel coordinates on the board."""
+    def build_cell_table(self):
+        """Precompute the board-local center of every cell at zoom 1."""
+        grid = self.grid_size
+        self.cell_centers = [None]  # Cell 0 is off the board
+        for cell in range(1, grid * grid + 1):
+            # Calculate row and column (0-indexed)
+            row = (cell - 1) // grid
+            row = grid - 1 - row  # Invert row (bottom to top)
+            
+            # Column depends on row direction (zigzag pattern)
+            if (grid - 1 - row) % 2 == 0:  # Even rows go left to right
+                col = (cell - 1) % grid
+            else:  # Odd rows go right to left
+                col = grid - 1 - ((cell - 1) % grid)
+            
+            self.cell_centers.append((col * CELL_SIZE + CELL_SIZE // 2,
+                                      row * CELL_SIZE + CELL_SIZE // 2))
+    
+    def get_cell_offset(self, cell_number):
+        """Convert cell number to pixel coordinates relative to the viewport origin."""
         if cell_number <= 0:
             return None  # Player not on board yet
+        x, y = self.cell_centers[cell_number]
+        return self.viewport.to_view(x, y)
+    
+    def get_cell_position(self, cell_number):
+        """Convert cell number to pixel coordinates on the screen."""
+        offset = self.get_cell_offset(cell_number)
+        if offset is None:
+            return None  # Player not on board yet
+        return (self.board_x + offset[0], self.board_y + offset[1])
+    
+    def get_board_cache_key(self):
+        """Return the inputs that the cached board layer depends on."""
+        return (tuple(sorted(self.snakes.items())),
+                tuple(sorted(self.ladders.items())),
+                self.board_x, self.board_y,
+                self.screen.get_size(),
+                self.viewport.state())
+    
+    def get_snake_control_point(self, head, tail, start_pos, end_pos):
+        """Return a fixed Bezier control point for a snake so its shape never changes."""
+        # Seed from the snake itself so the same layout always draws the same snakes
+        rng = random.Random(head * 1000 + tail)
+        return (
+            (start_pos[0] + end_pos[0]) // 2 + rng.randint(-50, 50),
+            (start_pos[1] + end_pos[1]) // 2 + rng.randint(-50, 50)
+        )
+    
+    def get_board_features(self):
+        """Return ladder and snake geometry (zoom 1, board-local) with bounding boxes.
+        
+        Recomputed only when the snakes or ladders change.
+        """
+        key = (tuple(sorted(self.snakes.items())), tuple(sorted(self.ladders.items())))
+        if key == self.features_key:
+            return self.board_features
+        self.token_paths.clear()  # Jumps follow the old snakes and ladders
+        
+        ladders = []
+        for bottom, top in self.ladders.items():
+            if not (0 < bottom <= self.board_size and 0 < top <= self.board_size):
+                continue
+            start_pos = self.cell_centers[bottom]
+            end_pos = self.cell_centers[top]
+            bbox = pygame.Rect(min(start_pos[0], end_pos[0]), min(start_pos[1], end_pos[1]),
+                               abs(end_pos[0] - start_pos[0]), abs(end_pos[1] - start_pos[1])).inflate(12, 12)
+            ladders.append((start_pos, end_pos, bbox))
+        
+        snakes = []
+        self.snake_control_points = {}
+        for head, tail in self.snakes.items():
+            if not (0 < head <= self.board_size and 0 < tail <= self.board_size):
+                continue
+            start_pos = self.cell_centers[head]
+            end_pos = self.cell_centers[tail]
+            # Calculate control points for curve
+            ctrl_pt1 = self.get_snake_control_point(head, tail, start_pos, end_pos)
+            self.snake_control_points[head] = ctrl_pt1
             
-        # Calculate row and column (0-indexed)
-        row = (cell_number - 1) // GRID_SIZE
-        row = GRID_SIZE - 1 - row  # Invert row (bottom to top)
-        
-        # Column depends on row direction (zigzag pattern)
-        if (GRID_SIZE - 1 - row) % 2 == 0:  # Even rows go left to right
-            col = (cell_number - 1) % GRID_SIZE
-        else:  # Odd rows go right to left
-            col = GRID_SIZE - 1 - ((cell_number - 1) % GRID_SIZE)
-            
-        # Calculate pixel position (center of cell)
-        x = self.board_x + col * CELL_SIZE + CELL_SIZE // 2
-        y = self.board_y + row * CELL_SIZE + CELL_SIZE // 2
+            # Interpolate points along the quadratic Bezier curve
+            points = quadratic_bezier(start_pos, ctrl_pt1, end_pos)
+            xs = [x for x, _ in points]
+            ys = [y for _, y in points]
+            bbox = pygame.Rect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)).inflate(20, 20)
+            snakes.append((start_pos, end_pos, points, bbox))
         
-        return (x, y)
+        self.board_features = (ladders, snakes)
+        self.features_key = key
+        return self.board_features
     
-    def draw_board(self):
-        """Draw the game board with cells, snakes, and ladders."""
+    def get_grid_surface(self):
+        """Return the visible cells, numbers and grid lines, which every layout of this size shares.
+        
+        Cached separately from the board layer, so a new snake and ladder
+        layout only redraws its jumps over a copy of this one.
+        """
+        viewport = self.viewport
+        cache_key = (self.grid_size, self.layout.scale, viewport.state())
+        if self.grid_surface is not None and cache_key == self.grid_cache_key:
+            return self.grid_surface
+        
+        zoom = viewport.zoom
+        surface = pygame.Surface((viewport.width, viewport.height))
+        grid = self.grid_size
+        cell_size = CELL_SIZE * zoom
+        
         # Draw board background
-        pygame.draw.rect(self.screen, BOARD_COLOR, 
-                        (self.board_x, self.board_y, BOARD_SIZE, BOARD_SIZE))
+        surface.fill(BOARD_COLOR)
+        
+        # Only the cells inside the viewport are drawn
+        first_col, last_col, first_row, last_row = viewport.visible_cells()
+        
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                x, y = viewport.to_view(col * CELL_SIZE, row * CELL_SIZE)
+                
+                # Alternate cell colors for better visibility
+                if (grid - 1 - row + col) % 2 == 0:
+                    pygame.draw.rect(surface, (230, 220, 190), 
+                                    (x, y, math.ceil(cell_size), math.ceil(cell_size)))
+                
+                # Draw cell number (skipped when zoomed too far out to read)
+                if cell_size >= self.layout.scaled(20):
+                    board_row = grid - 1 - row
+                    if board_row % 2 == 0:
+                        cell = board_row * grid + col + 1
+                    else:
+                        cell = board_row * grid + (grid - 1 - col) + 1
+                    text = self.font.render(str(cell), True, BLACK)
+                    text_rect = text.get_rect(center=(x + cell_size / 2, y + cell_size / 2))
+                    surface.blit(text, text_rect)
         
         # Draw grid lines
-        for i in range(GRID_SIZE + 1):
+        grid_line = self.layout.scaled(2)
+        for i in range(first_row, last_row + 2):
             # Horizontal lines
-            pygame.draw.line(self.screen, GRID_COLOR, 
-                            (self.board_x, self.board_y + i * CELL_SIZE),
-                            (self.board_x + BOARD_SIZE, self.board_y + i * CELL_SIZE), 2)
+            y = viewport.to_view(0, i * CELL_SIZE)[1]
+            pygame.draw.line(surface, GRID_COLOR, (0, y), (viewport.width, y), grid_line)
+        for i in range(first_col, last_col + 2):
             # Vertical lines
-            pygame.draw.line(self.screen, GRID_COLOR, 
-                            (self.board_x + i * CELL_SIZE, self.board_y),
-                            (self.board_x + i * CELL_SIZE, self.board_y + BOARD_SIZE), 2)
-        
-        # Draw cell numbers
-        for cell in range(1, 101):
-            pos = self.get_cell_position(cell)
-            if pos:
-                # Alternate cell colors for better visibility
-                row = (cell - 1) // GRID_SIZE
-                col = (cell - 1) % GRID_SIZE
-                if (row + col) % 2 == 0:
-                    pygame.draw.rect(self.screen, (230, 220, 190), 
-                                    (self.board_x + col * CELL_SIZE, 
-                                     self.board_y + (GRID_SIZE - 1 - row) * CELL_SIZE, 
-                                     CELL_SIZE, CELL_SIZE))
-                
-                # Draw cell number
-                text = self.font.render(str(cell), True, BLACK)
-                text_rect = text.get_rect(center=pos)
-                self.screen.blit(text, text_rect)
+            x = viewport.to_view(i * CELL_SIZE, 0)[0]
+            pygame.draw.line(surface, GRID_COLOR, (x, 0), (x, viewport.height), grid_line)
+        
+        self.grid_surface = surface
+        self.grid_cache_key = cache_key
+        return surface
+    
+    def build_board_surface(self):
+        """Render the visible part of the board (cells, numbers, ladders, snakes) into a surface."""
+        viewport = self.viewport
+        zoom = viewport.zoom
+        surface = self.get_grid_surface().copy()
+        
+        visible = viewport.visible_rect()
+        ladders, snakes = self.get_board_features()
         
         # Draw ladders (before snakes so snakes appear on top)
-        for bottom, top in self.ladders.items():
-            start_pos = self.get_cell_position(bottom)
-            end_pos = self.get_cell_position(top)
-            if start_pos and end_pos:
-                # Draw ladder (two parallel lines with rungs)
-                offset = 5  # Offset for parallel lines
-                
-                # Calculate angle and offsets
-                dx = end_pos[0] - start_pos[0]
-                dy = end_pos[1] - start_pos[1]
-                angle = math.atan2(dy, dx)
-                
-                # Perpendicular offsets
-                perp_x = math.sin(angle) * offset
-                perp_y = -math.cos(angle) * offset
-                
-                # Draw the two sides of the ladder
-                pygame.draw.line(self.screen, LADDER_COLOR, 
-                                (start_pos[0] + perp_x, start_pos[1] + perp_y),
-                                (end_pos[0] + perp_x, end_pos[1] + perp_y), 4)
-                pygame.draw.line(self.screen, LADDER_COLOR, 
-                                (start_pos[0] - perp_x, start_pos[1] - perp_y),
-                                (end_pos[0] - perp_x, end_pos[1] - perp_y), 4)
-                
-                # Draw rungs
-                length = math.sqrt(dx*dx + dy*dy)
-                num_rungs = int(length / 20)  # One rung every 20 pixels
-                for i in range(1, num_rungs):
-                    t = i / num_rungs
-                    rung_x = start_pos[0] + dx * t
-                    rung_y = start_pos[1] + dy * t
-                    pygame.draw.line(self.screen, LADDER_COLOR, 
-                                    (rung_x + perp_x, rung_y + perp_y),
-                                    (rung_x - perp_x, rung_y - perp_y), 2)
+        for start, end, bbox in ladders:
+            if not bbox.colliderect(visible):
+                continue
+            start_pos = viewport.to_view(*start)
+            end_pos = viewport.to_view(*end)
+            
+            # Draw ladder (two parallel lines with rungs)
+            offset = 5 * zoom  # Offset for parallel lines
+            
+            # Calculate angle and offsets
+            dx = end_pos[0] - start_pos[0]
+            dy = end_pos[1] - start_pos[1]
+            angle = math.atan2(dy, dx)
+            
+            # Perpendicular offsets
+            perp_x = math.sin(angle) * offset
+            perp_y = -math.cos(angle) * offset
+            
+            # Draw the two sides of the ladder
+            pygame.draw.line(surface, LADDER_COLOR, 
+                            (start_pos[0] + perp_x, start_pos[1] + perp_y),
+                            (end_pos[0] + perp_x, end_pos[1] + perp_y), max(1, round(4 * zoom)))
+            pygame.draw.line(surface, LADDER_COLOR, 
+                            (start_pos[0] - perp_x, start_pos[1] - perp_y),
+                            (end_pos[0] - perp_x, end_pos[1] - perp_y), max(1, round(4 * zoom)))
+            
+            # Draw rungs
+            length = math.sqrt(dx*dx + dy*dy)
+            num_rungs = int(length / (20 * zoom))  # One rung every 20 pixels
+            for i in range(1, num_rungs):
+                t = i / num_rungs
+                rung_x = start_pos[0] + dx * t
+                rung_y = start_pos[1] + dy * t
+                pygame.draw.line(surface, LADDER_COLOR, 
+                                (rung_x + perp_x, rung_y + perp_y),
+                                (rung_x - perp_x, rung_y - perp_y), max(1, round(2 * zoom)))
         
         # Draw snakes
-        for head, tail in self.snakes.items():
-            start_pos = self.get_cell_position(head)
-            end_pos = self.get_cell_position(tail)
-            if start_pos and end_pos:
-                # Calculate control points for curve
-                ctrl_pt1 = (
-                    (start_pos[0] + end_pos[0]) // 2 + random.randint(-50, 50),
-                    (start_pos[1] + end_pos[1]) // 2 + random.randint(-50, 50)
-                )
-                
-                # Draw snake body (curved line)
-                points = []
-                for t in range(0, 101, 5):  # Interpolate points along curve
-                    t_float = t / 100.0
-                    # Quadratic Bezier curve
-                    x = (1-t_float)**2 * start_pos[0] + 2*(1-t_float)*t_float * ctrl_pt1[0] + t_float**2 * end_pos[0]
-                    y = (1-t_float)**2 * start_pos[1] + 2*(1-t_float)*t_float * ctrl_pt1[1] + t_float**2 * end_pos[1]
-                    points.append((int(x), int(y)))
-                
-                # Draw snake body
-                if len(points) > 1:
-                    pygame.draw.lines(self.screen, SNAKE_COLOR, False, points, 5)
-                
-                # Draw snake head
-                pygame.draw.circle(self.screen, RED, start_pos, 8)
-                
-                # Draw snake tail
-                pygame.draw.circle(self.screen, SNAKE_COLOR, end_pos, 5)
+        for start, end, body, bbox in snakes:
+            if not bbox.colliderect(visible):
+                continue
+            points = [viewport.to_view(x, y) for x, y in body]
+            
+            # Draw snake body
+            if len(points) > 1:
+                pygame.draw.lines(surface, SNAKE_COLOR, False, points, max(1, round(5 * zoom)))
+            
+            # Draw snake head
+            pygame.draw.circle(surface, RED, viewport.to_view(*start), max(2, round(8 * zoom)))
+            
+            # Draw snake tail
+            pygame.draw.circle(surface, SNAKE_COLOR, viewport.to_view(*end), max(2, round(5 * zoom)))
+        
+        return surface
+    
+    def draw_board(self):
+        """Draw the game board with cells, snakes, and ladders."""
+        # Rebuild the cached layer only if the board config, position, viewport or window changed
+        cache_key = self.get_board_cache_key()
+        if self.board_surface is None or cache_key != self.board_cache_key:
+            if self.bake_board:
+                self.bake_board = False
+                key = self.asset_key('board', cache_key, self.grid_size, CELL_SIZE,
+                                     self.assets.font_path(self.font_name))
+                self.board_surface = self.assets.surface('board', key, self.build_board_surface)
+            else:
+                self.board_surface = self.build_board_surface()
+            self.board_cache_key = cache_key
+        
+        self.screen.blit(self.board_surface, (self.board_x, self.board_y))
+    
+    def ensure_cell_visible(self, cell_number):
+        """Scroll the viewport so the given cell is on screen."""
+        if 0 < cell_number <= self.board_size:
+            self.viewport.ensure_visible(*self.cell_centers[cell_number])
+    
+    def get_token_path(self, start, landed, end):
+        """Return the cached TokenPath for a move: walk from start to landed, then jump to end."""
+        self.get_board_features()  # Drops stale paths if the board changed
+        key = (start, landed, end)
+        path = self.token_paths.get(key)
+        if path is not None:
+            self.token_paths.move_to_end(key)
+            return path
+        
+        if end <= 0:
+            jump = None  # Forfeited back off the board; the token just disappears
+            end = landed
+        elif landed in self.snake_control_points and self.snakes[landed] == end:
+            jump = quadratic_bezier(self.cell_centers[landed], self.snake_control_points[landed],
+                                    self.cell_centers[end])
+        else:
+            # Ladders and forfeited turns move in a straight line
+            jump = [self.cell_centers[landed], self.cell_centers[end]]
+        path = build_path(self.cell_centers, self.board_size, start, landed, end, jump, CELL_SIZE)
+        self.token_paths[key] = path
+        if len(self.token_paths) > TOKEN_PATH_CACHE_SIZE:
+            self.token_paths.popitem(last=False)
+        return path
+    
+    def get_token_board_point(self, player):
+        """Return a player's token center in board coordinates, or None if it is off the board."""
+        if self.animation_in_progress and player == self.animation_player:
+            elapsed = get_ticks() - self.animation_start_time - DICE_ROLL_MS
+            if elapsed < 0:
+                return self.cell_centers[self.animation_from]  # Waiting for the dice
+            return self.animation_path.point_at(elapsed)
+        position = self.player_positions.get(player, 0)
+        if position <= 0:  # Only draw if player is on the board
+            return None
+        return self.cell_centers[position]
+    
+    def get_token_position(self, player):
+        """Return the screen center of a player's token, or None if not visible."""
+        point = self.get_token_board_point(player)
+        if point is None:
+            return None
+        pos = self.viewport.to_view(*point)
+        if not self.viewport.contains(pos):
+            return None  # Culled: outside the viewport
+        pos = (self.board_x + pos[0], self.board_y + pos[1])
+        
+        # Calculate offset to avoid overlapping players
+        offset_x = round((((player - 1) % 2) * 10 - 5) * self.layout.scale)
+        offset_y = round((((player - 1) // 2) * 10 - 5) * self.layout.scale)
+        return (pos[0] + offset_x, pos[1] + offset_y)
+    
+    def draw_token(self, surface, player, center):
+        """Draw a single player token centered at the given point."""
+        # Draw player token
+        pygame.draw.circle(surface, PLAYER_COLORS[player-1], center, self.layout.scaled(10))
+        
+        # Draw player number
+        text = self.text_cache.render(self.font, str(player), WHITE)
+        text_rect = text.get_rect(center=center)
+        surface.blit(text, text_rect)
     
     def draw_players(self):
         """Draw player tokens on the board."""
-        for player, position in self.player_positions.items():
-            if position > 0:  # Only draw if player is on the board
-                pos = self.get_cell_position(position)
-                if pos:
-                    # Calculate offset to avoid overlapping players
-                    offset_x = ((player - 1) % 2) * 10 - 5
-                    offset_y = ((player - 1) // 2) * 10 - 5
-                    
-                    # Draw player token
-                    pygame.draw.circle(self.screen, PLAYER_COLORS[player-1], 
-                                      (pos[0] + offset_x, pos[1] + offset_y), 10)
-                    
-                    # Draw player number
-                    text = self.font.render(str(player), True, WHITE)
-                    text_rect = text.get_rect(center=(pos[0] + offset_x, pos[1] + offset_y))
-                    self.screen.blit(text, text_rect)
-    
-    def draw_dice(self):
-        """Draw the dice and roll button."""
-        # Dice position
-        dice_x = 600
-        dice_y = 150
-        
-        # Draw dice
-        self.screen.blit(self.dice_images[self.dice_value - 1], (dice_x, dice_y))
-        
-        # Draw roll button
-        button_x = dice_x
-        button_y = dice_y + DICE_SIZE + 20
-        pygame.draw.rect(self.screen, GREEN if not self.animation_in_progress else (150, 150, 150), 
-                        (button_x, button_y, BUTTON_WIDTH, BUTTON_HEIGHT))
-        
-        # Button text
-        button_text = self.font.render("Roll Dice", True, BLACK)
-        text_rect = button_text.get_rect(center=(button_x + BUTTON_WIDTH//2, button_y + BUTTON_HEIGHT//2))
-        self.screen.blit(button_text, text_rect)
-        
-        return pygame.Rect(button_x, button_y, BUTTON_WIDTH, BUTTON_HEIGHT)
-    
-    def draw_player_info(self):
+        for player in self.player_positions:
+            center = self.get_token_position(player)
+            if center:
+                self.draw_token(self.screen, player, center)
+    
+    def draw_dice(self, surface=None, dice_x=None, dice_y=None):
+        """Draw the dice (the roll button is a widget)."""
+        if surface is None:
+            surface = self.screen
+        if dice_x is None:
+            dice_x, dice_y = self.layout.point(*DICE_POS)
+        s = self.layout.scaled
+        dice_size = s(DICE_SIZE)
+        
+        # Draw dice; totals of several dice show as a number on a blank face
+        if self.dice_value <= len(self.dice_images):
+            surface.blit(self.dice_images[self.dice_value - 1], (dice_x, dice_y))
+        else:
+            pygame.draw.rect(surface, WHITE, (dice_x, dice_y, dice_size, dice_size))
+            pygame.draw.rect(surface, BLACK, (dice_x, dice_y, dice_size, dice_size), s(2))
+            total_text = self.text_cache.render(self.large_font, str(self.dice_value), BLACK)
+            surface.blit(total_text, total_text.get_rect(center=(dice_x + dice_size // 2,
+                                                                 dice_y + dice_size // 2)))
+    
+    def draw_player_info(self, surface=None, info_x=None, info_y=None):
         """Draw player information."""
-        info_x = 600
-        info_y = 300
+        if surface is None:
+            surface = self.screen
+        if info_x is None:
+            info_x, info_y = self.layout.point(*INFO_POS)
+        s = self.layout.scaled
+        line_height = s(INFO_LINE_HEIGHT)
         
         # Title
-        title_text = self.font.render("Player Information", True, BLACK)
-        self.screen.blit(title_text, (info_x, info_y))
+        title_text = self.text_cache.render(self.font, "Player Information", BLACK)
+        surface.blit(title_text, (info_x, info_y))
         
         # Player positions
         for player, position in self.player_positions.items():
             color = PLAYER_COLORS[player-1]
             status = "Not started" if position == 0 else f"Position: {position}"
+            line_y = info_y + line_height * player
             
             # Highlight current player
             if player == self.current_player:
-                pygame.draw.rect(self.screen, (240, 240, 200), 
-                                (info_x - 5, info_y + 30 + (player-1)*30 - 5, 200, 30))
+                pygame.draw.rect(surface, (240, 240, 200), 
+                                (info_x - s(INFO_PADDING), line_y - s(INFO_PADDING), s(200), line_height))
             
             # Player color indicator
-            pygame.draw.circle(self.screen, color, (info_x + 10, info_y + 30 + (player-1)*30 + 10), 10)
+            pygame.draw.circle(surface, color, (info_x + s(10), line_y + s(10)), s(10))
             
             # Player text
-            player_text = self.font.render(f"Player {player}: {status}", True, BLACK)
-            self.screen.blit(player_text, (info_x + 25, info_y + 30 + (player-1)*30))
+            player_text = self.text_cache.render(self.font, f"Player {player}: {status}", BLACK)
+            surface.blit(player_text, (info_x + s(25), line_y))
     
-    def draw_game_message(self):
+    def draw_game_message(self, surface=None, message_x=None, message_y=None):
         """Draw game messages."""
-        message_x = 600
-        message_y = 450
+        if surface is None:
+            surface = self.screen
+        if message_x is None:
+            message_x, message_y = self.layout.point(*MESSAGE_POS)
         
         if self.game_over:
             message = f"Player {self.winner} wins!"
@@ -335,247 +938,501 @@ class SnakeAndLadderGUI:
             message = f"Player {self.current_player}'s turn"
             color = PLAYER_COLORS[self.current_player-1]
         
-        # Draw message
-        message_text = self.font.render(message, True, color)
-        self.screen.blit(message_text, (message_x, message_y))
-        
-        # Draw restart button if game is over
-        if self.game_over:
-            button_x = message_x
-            button_y = message_y + 40
-            pygame.draw.rect(self.screen, BLUE, 
-                            (button_x, button_y, BUTTON_WIDTH, BUTTON_HEIGHT))
-            
-            # Button text
-            button_text = self.font.render("Play Again", True, WHITE)
-            text_rect = button_text.get_rect(center=(button_x + BUTTON_WIDTH//2, button_y + BUTTON_HEIGHT//2))
-            self.screen.blit(button_text, text_rect)
-            
-            return pygame.Rect(button_x, button_y, BUTTON_WIDTH, BUTTON_HEIGHT)
-        
-        return None
+        # Draw message (the restart button is a widget)
+        message_text = self.text_cache.render(self.font, message, color)
+        surface.blit(message_text, (message_x, message_y))
     
     def draw_menu(self):
-        """Draw the main menu."""
+        """Draw the main menu (its buttons are widgets)."""
+        layout = self.layout
+        center_x = SCREEN_WIDTH // 2
+        
         # Fill background
         self.screen.fill((230, 230, 250))
         
         # Title
-        title_text = self.large_font.render("Snake and Ladder Game", True, PURPLE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 100))
+        title_text = self.text_cache.render(self.large_font, "Snake and Ladder Game", PURPLE)
+        title_rect = title_text.get_rect(center=layout.point(center_x, 100))
         self.screen.blit(title_text, title_rect)
         
         # Player selection text
-        select_text = self.font.render("Select number of players:", True, BLACK)
-        select_rect = select_text.get_rect(center=(SCREEN_WIDTH//2, 200))
+        select_text = self.text_cache.render(self.font, "Select number of players:", BLACK)
+        select_rect = select_text.get_rect(center=layout.point(center_x, 200))
         self.screen.blit(select_text, select_rect)
+    
+    def build_widgets(self):
+        """Create the buttons for the current layout, with their states and click handlers."""
+        layout = self.layout
+        widgets = WidgetLayer(cell_size=layout.scaled(LOOKUP_CELL_SIZE))
+        center_x = SCREEN_WIDTH // 2
         
-        # Player number buttons
-        buttons = []
-        for i in range(4):
-            button_x = SCREEN_WIDTH//2 - 175 + i * 100
-            button_y = 250
-            button_width = 80
-            button_height = 50
-            
-            # Highlight selected player count
-            color = GREEN if i+1 == self.total_players else BLUE
-            
-            pygame.draw.rect(self.screen, color, 
-                            (button_x, button_y, button_width, button_height))
-            
-            # Button text
-            button_text = self.font.render(f"{i+1}", True, WHITE)
-            text_rect = button_text.get_rect(center=(button_x + button_width//2, button_y + button_height//2))
-            self.screen.blit(button_text, text_rect)
-            
-            buttons.append((pygame.Rect(button_x, button_y, button_width, button_height), i+1))
-        
-        # Start game button
-        start_button_x = SCREEN_WIDTH//2 - BUTTON_WIDTH//2
-        start_button_y = 350
-        pygame.draw.rect(self.screen, GREEN, 
-                        (start_button_x, start_button_y, BUTTON_WIDTH, BUTTON_HEIGHT))
-        
-        # Button text
-        start_text = self.font.render("Start Game", True, BLACK)
-        start_text_rect = start_text.get_rect(center=(start_button_x + BUTTON_WIDTH//2, start_button_y + BUTTON_HEIGHT//2))
-        self.screen.blit(start_text, start_text_rect)
+        # Menu: player count buttons and the start button
+        for count in range(1, 5):
+            widgets.add(Button(layout.rect(center_x - 175 + (count - 1) * 100, 250, 80, 50), str(count),
+                               self.font, {NORMAL: (BLUE, WHITE), SELECTED: (GREEN, WHITE)},
+                               lambda count=count: self.select_player_count(count),
+                               lambda count=count: HIDDEN if not self.show_menu else
+                               SELECTED if count == self.total_players else NORMAL))
+        widgets.add(Button(layout.rect(center_x - BUTTON_WIDTH // 2, 350, BUTTON_WIDTH, BUTTON_HEIGHT),
+                           "Start Game", self.font, {NORMAL: (GREEN, BLACK)}, self.start_game,
+                           lambda: NORMAL if self.show_menu else HIDDEN))
         
-        return buttons, pygame.Rect(start_button_x, start_button_y, BUTTON_WIDTH, BUTTON_HEIGHT)
+        # Game: the roll button is greyed out while a token moves
+        widgets.add(Button(layout.rect(DICE_POS[0], DICE_POS[1] + DICE_SIZE + 20, BUTTON_WIDTH, BUTTON_HEIGHT),
+                           "Roll Dice", self.font, {NORMAL: (GREEN, BLACK), DISABLED: ((150, 150, 150), BLACK)},
+                           self.roll_clicked,
+                           lambda: HIDDEN if self.show_menu else
+                           DISABLED if self.animation_in_progress else NORMAL))
+        widgets.add(Button(layout.rect(MESSAGE_POS[0], MESSAGE_POS[1] + MESSAGE_HEIGHT, BUTTON_WIDTH, BUTTON_HEIGHT),
+                           "Play Again", self.font, {NORMAL: (BLUE, WHITE), DISABLED: (BLUE, WHITE)},
+                           self.reset_game,
+                           lambda: HIDDEN if self.show_menu or not self.game_over else
+                           DISABLED if self.animation_in_progress else NORMAL))
+        return widgets
+    
+    def start_game(self):
+        self.show_menu = False
+        self.reset_game()
+    
+    def roll_clicked(self):
+        # Replays roll by themselves
+        if not self.game_over and self.replay_log is None:
+            self.handle_dice_roll()
     
     def roll_dice_animation(self):
         """Animate dice rolling."""
         if self.dice_rolling:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.roll_start_time > 1000:  # Roll for 1 second
+            current_time = get_ticks()
+            if current_time - self.roll_start_time > DICE_ROLL_MS or self.skip_animations:
                 self.dice_rolling = False
+                # Settle on the value the engine actually rolled
+                if self.last_turn is not None:
+                    self.dice_value = self.last_turn.dice_value
                 return True  # Finished rolling
             else:
                 # Show random dice face during animation
-                self.dice_value = random.randint(1, 6)
+                self.dice_value = random.randint(self.engine.rules.dice, self.engine.table.max_roll)
                 return False  # Still rolling
         return True  # Not rolling
     
+    def sync_from_engine(self):
+        """Copy the engine's authoritative state into the display state."""
+        self.player_positions = dict(self.engine.player_positions)
+        self.current_player = self.engine.current_player
+        self.game_over = self.engine.game_over
+        self.winner = self.engine.winner
+    
     def move_player_animation(self):
-        """Animate player movement."""
+        """Animate player movement along the move's path.
+        
+        The token's position is computed from the time since the move
+        started (see get_token_board_point), so its speed does not depend
+        on the frame rate.
+        """
         if self.animation_in_progress:
-            current_time = pygame.time.get_ticks()
-            elapsed = current_time - self.animation_start_time
-            
-            if elapsed > 1000:  # Animation duration
+            elapsed = get_ticks() - self.animation_start_time - DICE_ROLL_MS
+            if elapsed >= self.animation_path.duration or self.skip_animations:
+                # Show the result the engine already applied
                 self.animation_in_progress = False
-                
-                # Check if player landed on a snake or ladder
-                if self.animation_to in self.snakes:
-                    # Start snake animation
-                    self.animation_in_progress = True
-                    self.animation_start_time = current_time
-                    self.animation_from = self.animation_to
-                    self.animation_to = self.snakes[self.animation_to]
-                    return False
-                
-                elif self.animation_to in self.ladders:
-                    # Start ladder animation
-                    self.animation_in_progress = True
-                    self.animation_start_time = current_time
-                    self.animation_from = self.animation_to
-                    self.animation_to = self.ladders[self.animation_to]
-                    return False
-                
-                # Update player position after animation
-                self.player_positions[self.animation_player] = self.animation_to
-                
-                # Check win condition
-                if self.animation_to >= 100:
-                    self.game_over = True
-                    self.winner = self.animation_player
-                    return True
-                
-                # Move to next player if current player didn't roll a 6
-                if self.dice_value != 6:
-                    self.current_player = (self.current_player % self.total_players) + 1
-                
+                self.sync_from_engine()
                 return True  # Animation finished
             
-            # During animation, update the visual position
-            # For simplicity, we'll just update the actual position
-            # A more complex animation could interpolate between positions
-            self.player_positions[self.animation_player] = self.animation_from
-            
+            # Keep the moving token in view on boards larger than the screen
+            if elapsed >= 0:
+                self.viewport.ensure_visible(*self.animation_path.point_at(elapsed))
             return False  # Animation still in progress
         
         return True  # No animation in progress
     
-    def handle_dice_roll(self):
+    def start_move_animation(self, player, start, landed, end, start_time=None):
+        """Animate a move the engine has already applied, starting when the dice settles."""
+        self.animation_in_progress = True
+        self.animation_start_time = get_ticks() if start_time is None else start_time
+        self.animation_player = player
+        self.animation_from = start
+        self.animation_to = landed
+        self.animation_end = end
+        self.animation_path = self.get_token_path(start, landed, end)
+        self.ensure_cell_visible(start)
+    
+    def handle_dice_roll(self, dice_value=None):
         """Handle dice roll logic."""
         # Start dice rolling animation
         self.dice_rolling = True
-        self.roll_start_time = pygame.time.get_ticks()
+        self.roll_start_time = get_ticks()
         
-        # Get final dice value
-        self.dice_value = random.randint(1, 6)
+        # Let the engine roll (or use the replayed value) and apply the rules
+        result = self.engine.take_turn(dice_value)
+        if self.log_writer is not None:
+            self.log_writer.record_turn(result.dice_value, self.engine)
+        self.last_turn = result
+        self.dice_value = result.dice_value
         
-        # Handle player movement based on dice roll
-        current_pos = self.player_positions[self.current_player]
-        
-        # Player needs a 6 to start
-        if current_pos == 0 and self.dice_value != 6:
-            # Player stays at position 0
-            self.current_player = (self.current_player % self.total_players) + 1
+        # Fast play shows the outcome at once
+        if self.skip_animations:
+            self.dice_rolling = False
+            self.sync_from_engine()
             return
         
-        # Player gets to enter the board with a 6
-        if current_pos == 0 and self.dice_value == 6:
-            new_pos = 1
-        else:
-            new_pos = current_pos + self.dice_value
-            
-            # Check if player overshoots the board
-            if new_pos > 100:
-                new_pos = current_pos  # Stay in place if overshooting
+        # Player needs the entry roll to start; nothing to animate
+        if result.start == 0 and result.landed == 0:
+            self.sync_from_engine()
+            return
         
         # Start movement animation
-        self.animation_in_progress = True
-        self.animation_start_time = pygame.time.get_ticks()
-        self.animation_from = current_pos
-        self.animation_to = new_pos
-        self.animation_player = self.current_player
+        self.start_move_animation(result.player, result.start, result.landed, result.end,
+                                  self.roll_start_time)
+    
+    def capture_state(self):
+        """Return a compact GameState for the current game, including the animation."""
+        state = GameState.from_engine(self.engine)
+        state.animation_in_progress = self.animation_in_progress
+        state.dice_rolling = self.dice_rolling
+        state.animation_player = self.animation_player
+        state.animation_from = self.animation_from
+        state.animation_to = self.animation_to
+        return state
+    
+    def restore_state(self, state):
+        """Resume a game from a GameState captured with capture_state()."""
+        state.apply_to_engine(self.engine)
+        self.total_players = state.total_players
+        self.sync_from_engine()
+        self.dice_value = state.dice_value
+        self.last_turn = None
+        self.show_menu = False
+        
+        # Restart any interrupted animation from the stored move
+        now = get_ticks()
+        self.dice_rolling = state.dice_rolling
+        self.roll_start_time = now
+        self.animation_in_progress = False
+        if state.animation_in_progress:
+            # The engine already holds where the move ended
+            self.start_move_animation(state.animation_player, state.animation_from, state.animation_to,
+                                      self.engine.player_positions[state.animation_player], now)
+    
+    def apply_board(self, board):
+        """Switch to a new layout of the same size; player positions are kept."""
+        if board.board_size != self.board_size:
+            raise BoardConfigError(f"cannot change the board size from {self.board_size} "
+                                   f"to {board.board_size} while running")
+        self.engine.set_board(board)
+        self.snakes = self.engine.snakes
+        self.ladders = self.engine.ladders
+        # A log started on the old layout could not be replayed past this point
+        self.close_log()
+    
+    def reload_board(self):
+        """Apply the board file if it changed; keep the current board if it is invalid."""
+        try:
+            board = self.board_watcher.poll()
+            if board is not None:
+                self.apply_board(board)
+                print(f"Reloaded board {board.name}")
+        except BoardConfigError as e:
+            print(f"Board reload failed: {e}")
+    
+    def select_player_count(self, num_players):
+        """Change the number of players from the menu."""
+        self.total_players = num_players
+        self.engine.reset(num_players)
+        self.sync_from_engine()
     
     def reset_game(self):
         """Reset the game state."""
-        self.player_positions = {i+1: 0 for i in range(self.total_players)}
-        self.current_player = 1
+        self.engine.reset(self.total_players)
+        self.sync_from_engine()
         self.dice_value = 1
-        self.game_over = False
-        self.winner = None
         self.animation_in_progress = False
+        self.last_turn = None
+        # A new game is played, not replayed
+        self.replay_log = None
+        self.replay_turn = 0
+        
+        # Seed the new game and start its log
+        self.close_log()
+        self.engine.reseed(self.seed_source.getrandbits(63))
+        if self.record_dir is not None:
+            self.log_writer = GameLogWriter(new_log_path(self.record_dir, self.engine.seed), self.engine)
+    
+    def close_log(self):
+        """Finish the current game log, if recording."""
+        if self.log_writer is not None:
+            self.log_writer.close()
+            self.log_writer = None
+    
+    def start_replay(self, log, turn=0):
+        """Replay a recorded GameLog with animations, starting after `turn` rolls."""
+        self.close_log()
+        self.replay_log = log
+        self.total_players = log.total_players
+        self.engine = log.new_engine(self.snakes, self.ladders, self.engine.rules)
+        log.seek(self.engine, turn)
+        self.replay_turn = self.engine.turn_count
+        self.snakes = self.engine.snakes
+        self.ladders = self.engine.ladders
+        self.sync_from_engine()
+        self.dice_value = log.dice[self.replay_turn - 1] if self.replay_turn else 1
+        self.animation_in_progress = False
+        self.last_turn = None
+        self.show_menu = False
+    
+    def replay_pending(self):
+        """Return True while a replay still has rolls to play."""
+        return (self.replay_log is not None and not self.game_over
+                and self.replay_turn < len(self.replay_log))
+    
+    def advance_replay(self):
+        """Play the next logged roll once the previous one has finished animating."""
+        if self.replay_pending() and not self.dice_rolling and not self.animation_in_progress:
+            dice_value = self.replay_log.dice[self.replay_turn]
+            self.replay_turn += 1
+            self.handle_dice_roll(dice_value)
+    
+    def handle_viewport_key(self, key):
+        """Scroll with the arrow keys and zoom with +/-."""
+        step = self.layout.scaled(SCROLL_STEP)
+        if key == pygame.K_LEFT:
+            self.viewport.scroll_by(-step, 0)
+        elif key == pygame.K_RIGHT:
+            self.viewport.scroll_by(step, 0)
+        elif key == pygame.K_UP:
+            self.viewport.scroll_by(0, -step)
+        elif key == pygame.K_DOWN:
+            self.viewport.scroll_by(0, step)
+        elif key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.viewport.zoom_by(ZOOM_STEP)
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.viewport.zoom_by(1 / ZOOM_STEP)
+    
+    def handle_event(self, event):
+        """Handle one pygame event. Returns False when the game should quit."""
+        if event.type == pygame.QUIT:
+            return False
+        
+        if event.type == BOARD_RELOAD_EVENT and self.board_watcher is not None:
+            self.reload_board()
+        
+        if event.type == pygame.VIDEORESIZE:
+            self.apply_layout()
+        
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle_overlay()
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.invalidate()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            self.dump_profile()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+            self.toggle_fullscreen()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_s:
+            self.skip_animations = not self.skip_animations
+        elif event.type == pygame.KEYDOWN and not self.show_menu:
+            self.handle_viewport_key(event.key)
+        
+        if event.type == pygame.MOUSEWHEEL and not self.show_menu:
+            step = self.layout.scaled(SCROLL_STEP)
+            self.viewport.scroll_by(-event.x * step, -event.y * step)
+        
+        # Buttons 4 and 5 are the scroll wheel, handled above
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button not in (4, 5):
+            self.widgets.click(event.pos)
+        
+        return True
+    
+    def draw_frame(self):
+        """Draw the current screen and push it to the display."""
+        profiler = self.profiler
+        if self.dirty_renderer is not None and not self.show_menu and not profiler.visible:
+            # Only the changed regions are drawn and pushed to the display
+            self.dirty_renderer.draw()
+            profiler.lap('dirty_draw')
+            return
+        
+        # Clear screen
+        self.screen.fill(WHITE)
+        profiler.lap('clear')
+        
+        if self.show_menu:
+            self.draw_menu()
+            profiler.lap('draw_menu')
+        else:
+            # Draw game elements
+            self.draw_board()
+            profiler.lap('draw_board')
+            self.draw_players()
+            profiler.lap('draw_players')
+            self.draw_dice()
+            profiler.lap('draw_dice')
+            self.draw_player_info()
+            profiler.lap('draw_player_info')
+            self.draw_game_message()
+            profiler.lap('draw_game_message')
+        self.widgets.draw(self.screen)
+        profiler.lap('draw_widgets')
+        
+        if profiler.visible:
+            profiler.draw_overlay(self.screen)
+            profiler.lap('overlay')
+        
+        # Update display
+        pygame.display.flip()
+        profiler.lap('flip')
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.invalidate()
+    
+    def is_animating(self):
+        """Return True while the dice or a token is animating."""
+        return not self.show_menu and (self.dice_rolling or self.animation_in_progress
+                                       or self.replay_pending())
+    
+    def cpu_report(self):
+        """Return a summary of CPU and wall time spent idle vs animating."""
+        lines = []
+        for phase in ('idle', 'active'):
+            stats = self.loop_stats[phase]
+            share = stats['cpu'] / stats['wall'] if stats['wall'] else 0.0
+            lines.append(f"{phase.capitalize()}: {stats['frames']} frames, "
+                         f"{stats['cpu']:.2f}s CPU over {stats['wall']:.2f}s wall ({share:.1%} of a core)")
+        return "\n".join(lines)
+    
+    def process_frame(self, events):
+        """Handle the events, advance the animations and draw one frame.
+        
+        Returns False when the game should quit.
+        """
+        profiler = self.profiler
+        profiler.start_frame()
+        running = True
+        for event in events:
+            if not self.handle_event(event):
+                running = False
+        profiler.lap('events')
+        
+        if not self.show_menu:
+            self.advance_replay()
+            
+            # Update animations
+            dice_done = self.roll_dice_animation()
+            profiler.lap('roll_dice_animation')
+            move_done = self.move_player_animation()
+            profiler.lap('move_player_animation')
+        
+        self.draw_frame()
+        return running
+    
+    def dump_profile(self):
+        """Write the profiler's frame samples to a CSV file."""
+        path = self.profile_dump or f"frame-profile-{time.strftime('%Y%m%d-%H%M%S')}.csv"
+        count = self.profiler.dump(path)
+        print(f"Wrote {count} frame samples to {path}")
+    
+    def startup_report(self):
+        """Return the time from launch to the first frame, with each step's share."""
+        steps = []
+        previous = 0.0
+        for step, at in self.startup_times.items():
+            steps.append(f"{step} {at - previous:.1f}")
+            previous = at
+        return (f"First frame {previous:.1f} ms after launch ({', '.join(steps)} ms; "
+                f"asset cache {self.assets.hits} hits, {self.assets.misses} misses)")
     
     def run(self):
         """Main game loop."""
         running = True
         
+        if self.idle_mode:
+            # Pointer movement never changes what is drawn; don't wake up for it
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+        
+        # Show the first frame before possibly blocking on events
+        self.draw_frame()
+        self.startup_times['first frame'] = elapsed_ms()
+        if self.report_startup:
+            print(self.startup_report())
+        
         while running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = pygame.mouse.get_pos()
-                    
-                    if self.show_menu:
-                        # Handle menu clicks
-                        player_buttons, start_button = self.draw_menu()
-                        
-                        # Check player number buttons
-                        for button, num_players in player_buttons:
-                            if button.collidepoint(mouse_pos):
-                                self.total_players = num_players
-                                self.player_positions = {i+1: 0 for i in range(self.total_players)}
-                        
-                        # Check start button
-                        if start_button.collidepoint(mouse_pos):
-                            self.show_menu = False
-                            self.reset_game()
-                    
-                    else:
-                        # Handle game clicks
-                        if not self.animation_in_progress:
-                            # Check dice roll button
-                            roll_button = self.draw_dice()
-                            if roll_button.collidepoint(mouse_pos) and not self.game_over:
-                                self.handle_dice_roll()
-                            
-                            # Check restart button if game is over
-                            restart_button = self.draw_game_message()
-                            if restart_button and restart_button.collidepoint(mouse_pos):
-                                self.reset_game()
-            
-            # Clear screen
-            self.screen.fill(WHITE)
+            animating = self.is_animating()
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
             
-            if self.show_menu:
-                self.draw_menu()
+            # Handle events; block until one arrives when there is nothing to animate
+            if self.idle_mode and not animating:
+                events = [pygame.event.wait()] + pygame.event.get()
             else:
-                # Update animations
-                dice_done = self.roll_dice_animation()
-                move_done = self.move_player_animation()
-                
-                # Draw game elements
-                self.draw_board()
-                self.draw_players()
-                self.draw_dice()
-                self.draw_player_info()
-                self.draw_game_message()
+                events = pygame.event.get()
+            running = self.process_frame(events)
             
-            # Update display
-            pygame.display.flip()
-            self.clock.tick(60)
+            # Pace frames only while something is moving
+            if animating or not self.idle_mode:
+                self.clock.tick(self.frame_cap)
+            
+            stats = self.loop_stats['active' if animating else 'idle']
+            stats['frames'] += 1
+            stats['cpu'] += time.process_time() - cpu_start
+            stats['wall'] += time.perf_counter() - wall_start
         
+        if self.report_cpu:
+            print(self.cpu_report())
+        if self.profile_dump is not None:
+            self.dump_profile()
+        self.close_log()
         pygame.quit()
         sys.exit()
 
+def parse_args(argv=None):
+    """Parse command-line options for the GUI."""
+    parser = argparse.ArgumentParser(description="Snake and Ladder Game")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="only redraw and update the screen regions that changed")
+    parser.add_argument('--grid-size', type=int, default=GRID_SIZE,
+                        help="cells per board side (e.g. 100 for a 10,000-cell board)")
+    parser.add_argument('--board', default=None, metavar='FILE',
+                        help="load the board layout from a .json or .toml file (reloaded on change)")
+    parser.add_argument('--fps', type=int, default=FRAME_CAP,
+                        help="frame-rate cap while the dice or a token is animating")
+    parser.add_argument('--busy-loop', action='store_true',
+                        help="redraw every frame even when idle instead of waiting for events")
+    parser.add_argument('--report-cpu', action='store_true',
+                        help="print idle vs active CPU time on exit")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="master seed for the per-game dice seeds")
+    parser.add_argument('--record-dir', default=None,
+                        help="write a replayable log of every game to this directory")
+    parser.add_argument('--replay', default=None, metavar='LOG',
+                        help="replay a recorded game log with animations")
+    parser.add_argument('--replay-from', type=int, default=0, metavar='N',
+                        help="start the replay after N rolls (seeks via checkpoints)")
+    parser.add_argument('--profile', action='store_true',
+                        help="show the frame profiler overlay at startup (toggle with F3)")
+    parser.add_argument('--profile-dump', default=None, metavar='CSV',
+                        help="time every frame and write the samples to this file on exit or F4")
+    parser.add_argument('--cache-dir', default=default_cache_dir(),
+                        help="where resolved fonts and pre-rendered dice and board layers are cached")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="draw every asset at startup instead of using the cache")
+    parser.add_argument('--report-startup', action='store_true',
+                        help="print the time from launch to the first frame")
+    parser.add_argument('--window-size', type=parse_window_size, default=(SCREEN_WIDTH, SCREEN_HEIGHT),
+                        metavar='WIDTHxHEIGHT', help="initial window size; the window can be resized")
+    parser.add_argument('--fullscreen', action='store_true',
+                        help="start fullscreen at the desktop resolution (toggle with F11)")
+    parser.add_argument('--skip-animations', action='store_true',
+                        help="apply each roll at once without dice or token animations (toggle with S)")
+    add_rules_argument(parser)
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    game = SnakeAndLadderGUI()
+    args = parse_args()
+    game = SnakeAndLadderGUI(dirty_rects=args.dirty_rects, grid_size=args.grid_size,
+                             idle_mode=not args.busy_loop, frame_cap=args.fps,
+                             report_cpu=args.report_cpu, seed=args.seed,
+                             record_dir=args.record_dir, board_path=args.board,
+                             profile=args.profile, profile_dump=args.profile_dump,
+                             cache_dir=None if args.no_cache else args.cache_dir,
+                             report_startup=args.report_startup, rules=args.rules,
+                             skip_animations=args.skip_animations,
+                             window_size=args.window_size, fullscreen=args.fullscreen)
+    if args.replay:
+        game.start_replay(GameLog.load(args.replay), args.replay_from)
     game.run()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Headless Snake and Ladder rules engine.
+
+This module has no pygame dependency, no animation timers and no display,
+so games can be simulated and tested at full CPU speed. The GUI in
+snake_and_ladder_gui.py drives an instance of SnakeAndLadderEngine and only
+adds animation on top of the turn results it returns.
+
+Moves are looked up in the TransitionTable compiled from the board and the
+rule variant (see rules.py), so every variant plays at the same speed.
+"""
+import random
+from collections import namedtuple
+
+from board_config import BoardConfig, DEFAULT_BOARD_SIZE
+from rules import CLASSIC_RULES, FORFEIT, compile_rules
+
+# Outcome of a single dice roll.
+# start: position before the roll, landed: position after moving by the dice,
+# end: position after all snake/ladder jumps, hops: [end] if a jump was taken, else [].
+TurnResult = namedtuple('TurnResult', [
+    'player', 'dice_value', 'start', 'landed', 'end', 'hops',
+    'extra_turn', 'winner'
+])
+
+class SnakeAndLadderEngine:
+    """Game state and rules for one game of Snake and Ladder."""
+
+    def __init__(self, total_players=2, snakes=None, ladders=None,
+                 board_size=DEFAULT_BOARD_SIZE, rng=None, seed=None, board=None, rules=None):
+        if board is None:
+            board = BoardConfig(snakes, ladders, board_size)
+        self.rules = rules or CLASSIC_RULES
+        self.set_board(board)
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.reset(total_players)
+
+    def reseed(self, seed):
+        """Restart the dice RNG from a seed so the next game can be reproduced."""
+        self.seed = seed
+        self.rng.seed(seed)
+
+    def set_board(self, board):
+        """Switch to a (validated) BoardConfig. Player positions are kept."""
+        self.board = board
+        self.board_size = board.board_size
+        self.snakes = board.snakes
+        self.ladders = board.ladders
+        self.jump_table = board.jump_table
+        self.table = compile_rules(board, self.rules)
+    
+    def set_rules(self, rules):
+        """Switch to another rule variant. Player positions are kept."""
+        self.rules = rules
+        self.table = compile_rules(self.board, rules)
+        self.streak = 0
+
+    def reset(self, total_players=None):
+        """Reset the game state, optionally changing the number of players."""
+        if total_players is not None:
+            if not 1 <= total_players <= 4:
+                raise ValueError(f"total_players must be between 1 and 4, got {total_players}")
+            self.total_players = total_players
+        self.player_positions = {i+1: 0 for i in range(self.total_players)}
+        self.current_player = 1
+        self.dice_value = 1
+        self.game_over = False
+        self.winner = None
+        self.turn_count = 0
+        self.streak = 0  # Extra-turn rolls so far in the current turn
+        self.turn_start = 0  # Where the current player started this turn
+
+    def roll_dice(self):
+        """Roll the dice with the engine's RNG and return the total."""
+        return self.table.roll(self.rng)
+
+    def next_player(self):
+        """Pass the turn to the next player."""
+        self.current_player = (self.current_player % self.total_players) + 1
+
+    def resolve_jumps(self, position):
+        """Follow snakes and ladders one at a time from a cell, returning (final, hops).
+
+        Play uses the compiled jump_table; this is for analysis that needs
+        every intermediate jump.
+        """
+        hops = []
+        while True:
+            if position in self.snakes:
+                position = self.snakes[position]
+            elif position in self.ladders:
+                position = self.ladders[position]
+            else:
+                return position, hops
+            hops.append(position)
+
+    def build_jump_table(self):
+        """Return a list mapping every cell 0..board_size to its final cell after jumps."""
+        return list(self.jump_table)
+
+    def take_turn(self, dice_value=None):
+        """Play one dice roll for the current player and return a TurnResult.
+
+        If dice_value is None the dice is rolled with the engine's RNG.
+        """
+        if self.game_over:
+            raise RuntimeError("The game is already over")
+
+        if dice_value is None:
+            dice_value = self.roll_dice()
+        self.dice_value = dice_value
+        self.turn_count += 1
+
+        player = self.current_player
+        current_pos = self.player_positions[player]
+        if self.streak == 0:
+            self.turn_start = current_pos
+
+        # Entering, overshooting, snakes and ladders are all in the table
+        table = self.table
+        landed = table.landed[current_pos][dice_value]
+        end = table.end[current_pos][dice_value]
+        self.streak = table.streak[self.streak][dice_value]
+        if self.streak == FORFEIT:
+            # Too many extra turns in a row: the whole turn is undone
+            landed = current_pos
+            end = self.turn_start
+            self.streak = 0
+        hops = [end] if end != landed else []
+        self.player_positions[player] = end
+
+        # Check win condition
+        if end >= self.board_size:
+            self.game_over = True
+            self.winner = player
+            self.streak = 0
+            return TurnResult(player, dice_value, current_pos, landed, end, hops, False, player)
+
+        # The extra-turn roll (a 6) lets the same player roll again
+        extra_turn = self.streak != 0
+        if not extra_turn:
+            self.next_player()
+
+        return TurnResult(player, dice_value, current_pos, landed, end, hops, extra_turn, None)
+
+    def play(self, max_turns=None):
+        """Play until someone wins (or max_turns rolls have been made).
+
+        Returns the winner, or None if the turn limit was reached first.
+        """
+        while not self.game_over:
+            if max_turns is not None and self.turn_count >= max_turns:
+                return None
+            self.take_turn()
+        return self.winner
+
+if __name__ == "__main__":
+    engine = SnakeAndLadderEngine(total_players=2, rng=random.Random(0))
+    winner = engine.play()
+    print(f"Player {winner} wins after {engine.turn_count} rolls")
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""Stream simulated game statistics to chunked files with bounded memory.
+
+Games are simulated with batch_simulator in fixed-size batches, each on
+its own RNG stream derived from one master seed. Every batch writes:
+
+    games-BBBBBB.npz (or .csv)      one row per game and seat: game, seat,
+                                    won, rolls, snakes, ladders, sixes, final
+    turns-BBBBBB-PPP.npz (or .csv)  with --turn-records, one row per roll:
+                                    game, turn, seat, roll, start, landed, end
+
+and folds the batch into running aggregates: mean and variance (merged
+with Chan's parallel formula) and an exact histogram per metric, from
+which quantiles are read. All the metrics are small integers, so the
+histograms are bounded by the longest game and need no approximation.
+Memory is therefore set by the batch size, not by the number of games.
+
+After each batch the aggregates and the number of finished batches are
+written atomically to manifest.json. An interrupted run continues with
+--resume: files of the unfinished batch are discarded and that batch is
+replayed from its seed, so a resumed run produces the same files and
+statistics as an uninterrupted one.
+
+Example:
+    python stats_sink.py --games 10000000 --players 4 --seed 7 --output runs/four-players
+    python stats_sink.py --games 10000000 --players 4 --seed 7 --output runs/four-players --resume
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import re
+
+import numpy as np
+
+import batch_simulator
+from board_config import BoardConfig
+from game_log import board_hash
+from rules import CLASSIC_RULES, add_rules_argument, rules_spec
+from snake_ladder_engine import SnakeAndLadderEngine
+from tournament import stream_seed
+
+MANIFEST_VERSION = 1
+MANIFEST = 'manifest.json'
+DEFAULT_BATCH_GAMES = 100000
+DEFAULT_CHUNK_ROWS = 1000000
+FORMATS = ('npz', 'csv')
+QUANTILES = (0.5, 0.9, 0.99)
+
+GAME_COLUMNS = ('game', 'seat', 'won', 'rolls', 'snakes', 'ladders', 'sixes', 'final')
+TURN_COLUMNS = ('game', 'turn', 'seat', 'roll', 'start', 'landed', 'end')
+SEAT_METRICS = ('rolls', 'snakes', 'ladders', 'sixes')
+
+class RunningStats:
+    """Count, mean and variance, updated a batch of values at a time."""
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2  # Sum of squared deviations from the mean
+
+    def add(self, values):
+        if not values.size:
+            return
+        mean = float(values.mean())
+        self.merge(values.size, mean, float(((values - mean) ** 2).sum()))
+
+    def merge(self, count, mean, m2):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self):
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2}
+
+class IntHistogram:
+    """Exact counts of non-negative integers, for quantiles."""
+
+    def __init__(self, counts=()):
+        self.counts = np.array(counts, dtype=np.int64)
+
+    def add(self, values):
+        if not values.size:
+            return
+        counts = np.bincount(values, minlength=self.counts.size)
+        counts[:self.counts.size] += self.counts
+        self.counts = counts
+
+    def quantile(self, q):
+        """Return the smallest value with at least a fraction q of the counts at or below it."""
+        total = int(self.counts.sum())
+        if not total:
+            return None
+        return int(np.searchsorted(np.cumsum(self.counts), max(q * total, 1)))
+
+    def to_list(self):
+        return self.counts.tolist()
+
+class Metric:
+    """Running moments and a histogram of one integer metric."""
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.stats = RunningStats(**state.get('stats', {}))
+        self.histogram = IntHistogram(state.get('histogram', ()))
+
+    def add(self, values):
+        self.stats.add(values)
+        self.histogram.add(values)
+
+    def summary(self):
+        return {'mean': self.stats.mean, 'std': self.stats.variance ** 0.5,
+                'quantiles': {q: self.histogram.quantile(q) for q in QUANTILES}}
+
+    def to_dict(self):
+        return {'stats': self.stats.to_dict(), 'histogram': self.histogram.to_list()}
+
+class StreamStats:
+    """Aggregates over every game streamed so far."""
+
+    def __init__(self, total_players, state=None):
+        state = state or {}
+        self.total_players = total_players
+        self.games = state.get('games', 0)
+        self.unfinished = state.get('unfinished', 0)
+        self.wins = state.get('wins', [0] * total_players)
+        metrics = state.get('metrics', {})
+        # Rolls per finished game, and per-seat metrics over every game and seat
+        self.game_rolls = Metric(metrics.get('game_rolls'))
+        self.seat_metrics = {name: Metric(metrics.get(name)) for name in SEAT_METRICS}
+
+    def add_batch(self, result, seat_counts):
+        finished = result.winners > 0
+        self.games += int(result.turns.size)
+        self.unfinished += int((~finished).sum())
+        wins = np.bincount(result.winners[finished], minlength=self.total_players + 1)[1:]
+        self.wins = [a + int(b) for a, b in zip(self.wins, wins)]
+        self.game_rolls.add(result.turns[finished])
+        for name in SEAT_METRICS:
+            self.seat_metrics[name].add(seat_counts[name].ravel())
+
+    def to_dict(self):
+        metrics = {name: metric.to_dict() for name, metric in self.seat_metrics.items()}
+        metrics['game_rolls'] = self.game_rolls.to_dict()
+        return {'games': self.games, 'unfinished': self.unfinished, 'wins': self.wins, 'metrics': metrics}
+
+    def summary(self):
+        finished = self.games - self.unfinished
+        return {
+            'games': self.games,
+            'unfinished': self.unfinished,
+            'win_rate_by_seat': {seat + 1: (wins / finished if finished else 0.0)
+                                 for seat, wins in enumerate(self.wins)},
+            'rolls_per_game': self.game_rolls.summary(),
+            'per_player': {name: metric.summary() for name, metric in self.seat_metrics.items()},
+        }
+
+def write_atomic(path, write):
+    """Call write(file) on a temporary file and move it into place."""
+    temp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp, 'wb') as f:
+            write(f)
+        os.replace(temp, path)
+    except BaseException:
+        # A failed write leaves the old file, and no stray temporary, behind
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+
+def write_chunk(path, columns, arrays, file_format):
+    """Write equal-length column arrays as one .npz or .csv chunk."""
+    if file_format == 'npz':
+        write_atomic(path, lambda f: np.savez_compressed(f, **dict(zip(columns, arrays))))
+    else:
+        table = np.column_stack([np.asarray(a, dtype=np.int64) for a in arrays])
+        write_atomic(path, lambda f: np.savetxt(f, table, fmt='%d', delimiter=',',
+                                                header=','.join(columns), comments=''))
+
+class TurnRecorder:
+    """on_roll callback that counts per-seat events and optionally buffers per-turn rows."""
+
+    def __init__(self, board, n_games, total_players, first_game, chunk_path=None,
+                 chunk_rows=DEFAULT_CHUNK_ROWS, file_format='npz'):
+        # Per cell landed on: snakes and ladders taken, following chained jumps to the end
+        self.snakes_taken = np.zeros(board.board_size + 1, dtype=np.int32)
+        self.ladders_taken = np.zeros(board.board_size + 1, dtype=np.int32)
+        engine = SnakeAndLadderEngine(board=board)
+        for cell in set(board.snakes) | set(board.ladders):
+            _, hops = engine.resolve_jumps(cell)
+            for start in [cell] + hops[:-1]:
+                if start in board.snakes:
+                    self.snakes_taken[cell] += 1
+                else:
+                    self.ladders_taken[cell] += 1
+        self.total_players = total_players
+        self.first_game = first_game
+        # One row per metric, one column per (game, seat); see SEAT_METRICS
+        self.table = np.zeros((len(SEAT_METRICS), n_games * total_players), dtype=np.int32)
+        self.counts = {name: row.reshape(n_games, total_players) for name, row in zip(SEAT_METRICS, self.table)}
+        self.game_turns = np.zeros(n_games, dtype=np.int32)
+        self.chunk_path = chunk_path  # Format string for a part number; None records no turns
+        self.chunk_rows = chunk_rows
+        self.file_format = file_format
+        self.buffer = []
+        self.buffered_rows = 0
+        self.parts = 0
+
+    def __call__(self, games, seats, dice, sixes, start, landed, end):
+        # One roll per game here, so fancy-indexed += never sees a duplicate
+        column = games * self.total_players + seats
+        table = self.table
+        table[0, column] += 1
+        table[1, column] += self.snakes_taken[landed]
+        table[2, column] += self.ladders_taken[landed]
+        table[3, column] += sixes
+        if self.chunk_path is not None:
+            self.game_turns[games] += 1
+            self.buffer.append((games + self.first_game, self.game_turns[games], seats + 1,
+                                dice, start, landed, end))
+            self.buffered_rows += games.size
+            if self.buffered_rows >= self.chunk_rows:
+                self.flush()
+
+    def flush(self):
+        if not self.buffered_rows:
+            return
+        columns = [np.concatenate(column) for column in zip(*self.buffer)]
+        write_chunk(self.chunk_path.format(self.parts), TURN_COLUMNS, columns, self.file_format)
+        self.parts += 1
+        self.buffer = []
+        self.buffered_rows = 0
+
+def game_rows(result, counts, first_game):
+    """Return the per-game, per-seat columns for one batch."""
+    n_games, total_players = counts['rolls'].shape
+    seats = np.tile(np.arange(1, total_players + 1, dtype=np.int8), n_games)
+    games = np.repeat(np.arange(first_game, first_game + n_games, dtype=np.int64), total_players)
+    won = (np.repeat(result.winners, total_players) == seats).astype(np.int8)
+    return [games, seats, won] + [counts[name].ravel() for name in SEAT_METRICS] + [result.positions.ravel()]
+
+def load_manifest(directory):
+    """Return a run directory's manifest, or None if it has none yet."""
+    path = os.path.join(directory, MANIFEST)
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise SystemExit(f"{path} is not a version {MANIFEST_VERSION} manifest")
+    return manifest
+
+class StatsSink:
+    """A directory of chunk files plus the manifest that makes a run resumable."""
+
+    def __init__(self, directory, settings, resume=False):
+        self.directory = directory
+        self.settings = settings
+        os.makedirs(directory, exist_ok=True)
+        manifest = load_manifest(directory)
+        if manifest is not None and not resume:
+            raise SystemExit(f"{directory} already holds a run; pass --resume to continue it")
+        if manifest is not None and manifest['settings'] != settings:
+            raise SystemExit(f"{directory} holds a run with different settings: {manifest['settings']}")
+        self.batches_done = manifest['batches_done'] if manifest else 0
+        self.stats = StreamStats(settings['players'], manifest['stats'] if manifest else None)
+        self.discard_partial_batches()
+
+    def path(self, filename):
+        return os.path.join(self.directory, filename)
+
+    def discard_partial_batches(self):
+        """Remove chunks written by a batch that never made it into the manifest."""
+        for path in glob.glob(self.path('*-*.*')):
+            match = re.match(r'(?:games|turns)-(\d+)', os.path.basename(path))
+            if match and int(match.group(1)) >= self.batches_done:
+                os.remove(path)
+
+    def batch_path(self, table, batch):
+        return self.path(f"{table}-{batch:06d}.{self.settings['format']}")
+
+    def commit_batch(self, result, recorder, first_game):
+        """Write a finished batch's game rows and fold it into the aggregates and manifest."""
+        recorder.flush()
+        write_chunk(self.batch_path('games', self.batches_done), GAME_COLUMNS,
+                    game_rows(result, recorder.counts, first_game),
+                    self.settings['format'])
+        self.stats.add_batch(result, recorder.counts)
+        self.batches_done += 1
+        manifest = {'version': MANIFEST_VERSION, 'settings': self.settings,
+                    'batches_done': self.batches_done, 'stats': self.stats.to_dict()}
+        write_atomic(self.path(MANIFEST), lambda f: f.write(json.dumps(manifest, indent=1).encode()))
+
+def stream_games(n_games, directory, total_players=2, board=None, seed=None, rules=CLASSIC_RULES,
+                 batch_games=DEFAULT_BATCH_GAMES, turn_records=False, file_format='npz',
+                 chunk_rows=DEFAULT_CHUNK_ROWS, resume=False, progress=False):
+    """Simulate n_games in batches, streaming records into directory; return the StreamStats."""
+    if file_format not in FORMATS:
+        raise ValueError(f"file_format must be one of {FORMATS}, got {file_format!r}")
+    board = board or BoardConfig()
+    if seed is None:
+        # A random seed is recorded in the manifest, so a resumed run picks it up from there
+        manifest = load_manifest(directory) if resume else None
+        seed = manifest['settings']['seed'] if manifest else random.SystemRandom().getrandbits(63)
+    settings = {'games': n_games, 'players': total_players, 'seed': seed, 'rules': rules_spec(rules),
+                'board': f"{board_hash(board.snakes, board.ladders, board.board_size):016x}",
+                'batch_games': batch_games, 'turn_records': turn_records, 'format': file_format}
+    sink = StatsSink(directory, settings, resume)
+
+    n_batches = -(-n_games // batch_games)
+    for batch in range(sink.batches_done, n_batches):
+        first_game = batch * batch_games
+        size = min(batch_games, n_games - first_game)
+        turn_path = sink.path(f"turns-{batch:06d}-{{:03d}}.{file_format}") if turn_records else None
+        recorder = TurnRecorder(board, size, total_players, first_game, turn_path, chunk_rows, file_format)
+        result = batch_simulator.simulate_games(size, total_players, board.snakes, board.ladders,
+                                                board.board_size, seed=stream_seed(seed, batch),
+                                                rules=rules, on_roll=recorder)
+        sink.commit_batch(result, recorder, first_game)
+        if progress:
+            print(f"batch {batch + 1}/{n_batches}: {sink.stats.games} games")
+    return sink.stats
+
+def print_summary(summary):
+    print(f"Games: {summary['games']} (unfinished: {summary['unfinished']})")
+    for seat, rate in summary['win_rate_by_seat'].items():
+        print(f"Seat {seat} win rate: {rate:.4f}")
+    rolls = summary['rolls_per_game']
+    quantiles = ", ".join(f"P{round(q * 100)} {v}" for q, v in rolls['quantiles'].items())
+    print(f"Rolls per game: mean {rolls['mean']:.2f}, std {rolls['std']:.2f}, {quantiles}")
+    for name, metric in summary['per_player'].items():
+        quantiles = ", ".join(f"P{round(q * 100)} {v}" for q, v in metric['quantiles'].items())
+        print(f"{name.capitalize()} per player: mean {metric['mean']:.3f}, std {metric['std']:.3f}, {quantiles}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate games and stream per-game and per-turn "
+                                                 "records to chunked files")
+    parser.add_argument('--games', type=int, default=1000000, help="number of games to simulate")
+    parser.add_argument('--players', type=int, default=2, choices=range(1, 5), help="players per game")
+    parser.add_argument('--board', default=None, help="board file (default: the classic board)")
+    parser.add_argument('--seed', type=int, default=None, help="master seed for the per-batch RNG streams")
+    parser.add_argument('--output', required=True, metavar='DIR', help="directory for the chunks and manifest")
+    parser.add_argument('--batch-games', type=int, default=DEFAULT_BATCH_GAMES,
+                        help="games simulated (and held in memory) per batch")
+    parser.add_argument('--turn-records', action='store_true', help="also write one row per roll")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS,
+                        help="rows per per-turn chunk file")
+    parser.add_argument('--format', choices=FORMATS, default='npz', help="chunk file format")
+    parser.add_argument('--resume', action='store_true', help="continue an interrupted run in --output")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    add_rules_argument(parser)
+    args = parser.parse_args(argv)
+
+    board = BoardConfig.load(args.board) if args.board else BoardConfig()
+    stats = stream_games(args.games, args.output, args.players, board, args.seed, args.rules,
+                         args.batch_games, args.turn_records, args.format, args.chunk_rows,
+                         args.resume, progress=not args.json)
+    if args.json:
+        print(json.dumps(stats.summary(), indent=2))
+    else:
+        print_summary(stats.summary())
+
+if __name__ == "__main__":
+    main()
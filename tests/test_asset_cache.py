@@ -0,0 +1,24 @@
+import pytest
+
+pygame = pytest.importorskip('pygame')
+
+from asset_cache import MAX_SURFACE_VERSIONS, AssetCache
+
+def test_alternating_keys_keep_hitting(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    drawn = []
+
+    def draw(size):
+        drawn.append(size)
+        return pygame.Surface((size, size))
+
+    for size in (10, 20, 10, 20, 10):
+        cache.surface('dice', f"key{size}", lambda: draw(size))
+    assert drawn == [10, 20]
+    assert cache.hits == 3
+
+def test_old_versions_are_pruned(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    for i in range(MAX_SURFACE_VERSIONS + 3):
+        cache.surface('dice', f"key{i}", lambda: pygame.Surface((4, 4)))
+    assert len(list(tmp_path.glob('dice-*.raw'))) == MAX_SURFACE_VERSIONS
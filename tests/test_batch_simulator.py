@@ -0,0 +1,60 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import batch_simulator
+from batch_simulator import simulate_games, summarize
+from rules import parse_rules
+from tournament import run_tournament
+
+ENGINE_GAMES = 10000
+BATCH_GAMES = 200000
+
+default_rng = np.random.default_rng
+
+class RecordingGenerator:
+    def __init__(self, seed):
+        self.rng = default_rng(seed)
+        self.shapes = []
+
+    def integers(self, *args, size=None, **kwargs):
+        self.shapes.append(size)
+        return self.rng.integers(*args, size=size, **kwargs)
+
+def test_dice_blocks_are_capped(monkeypatch):
+    generators = []
+
+    def recording_rng(seed=None):
+        generators.append(RecordingGenerator(seed))
+        return generators[-1]
+
+    monkeypatch.setattr(batch_simulator, 'MAX_BLOCK_DICE', 1000)
+    monkeypatch.setattr(np.random, 'default_rng', recording_rng)
+    result = simulate_games(5000, 2, seed=3)
+    assert (result.winners > 0).all()
+    shapes = generators[0].shapes
+    # Early blocks shrink to a single roll; they grow back as games finish
+    assert max(rolls * games for rolls, games in shapes) <= 5000
+    assert shapes[0] == (1, 5000)
+    assert max(rolls for rolls, _ in shapes) == batch_simulator.DICE_BLOCK_SIZE
+
+def test_seeded_runs_repeat():
+    first = simulate_games(2000, 3, seed=9)
+    second = simulate_games(2000, 3, seed=9)
+    for a, b in zip(first, second):
+        assert np.array_equal(a, b)
+
+@pytest.mark.parametrize('spec', ['classic', 'three-sixes,bounce'])
+def test_results_match_the_engine(spec):
+    rules = parse_rules(spec)
+    engine = run_tournament(ENGINE_GAMES, 2, seed=1, workers=1, rules=rules).summary()
+    result = simulate_games(BATCH_GAMES, 2, seed=1, rules=rules)
+    stats = summarize(result, 2)
+    assert stats['unfinished'] == engine['unfinished'] == 0
+    # About five standard errors of the engine's mean game length
+    assert stats['mean_turns'] == pytest.approx(engine['mean_rolls'], abs=2.0)
+    assert stats['win_rate'] == pytest.approx(list(engine['win_rate_by_seat'].values()), abs=0.025)
+    # Winners finish on the last cell and nobody else gets there
+    seats = result.winners - 1
+    assert (result.positions[np.arange(BATCH_GAMES), seats] == 100).all()
+    assert (result.positions < 100).sum() == BATCH_GAMES
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from board_config import BoardConfig, BoardConfigError
+
+@pytest.mark.parametrize('snakes, ladders, board_size', [
+    ({}, {}, 1),
+    ({}, {}, '100'),
+    ({10: 20}, {}, 100),        # snake going up
+    ({100: 50}, {}, 100),       # snake on the last cell
+    ({10: 0}, {}, 100),         # snake off the board
+    ({}, {20: 10}, 100),        # ladder going down
+    ({}, {90: 101}, 100),       # ladder past the last cell
+    ({30: 5}, {30: 60}, 100),   # snake head and ladder bottom on one cell
+])
+def test_invalid_layouts(snakes, ladders, board_size):
+    with pytest.raises(BoardConfigError):
+        BoardConfig(snakes, ladders, board_size)
+
+def test_jump_cycle():
+    with pytest.raises(BoardConfigError, match='cycle'):
+        BoardConfig({50: 10}, {10: 50})
+
+def test_chained_jumps_are_compiled():
+    board = BoardConfig({60: 20}, {10: 60})
+    assert board.jump_table[10] == 20
+    assert board.jump_table[60] == 20
+    assert board.jump_table[11] == 11
+
+def test_load(tmp_path):
+    path = tmp_path / 'tiny.json'
+    path.write_text(json.dumps({'board_size': 36, 'snakes': {'30': 4}, 'ladders': [[3, 20]]}))
+    board = BoardConfig.load(str(path))
+    assert (board.name, board.board_size, board.snakes, board.ladders) == ('tiny', 36, {30: 4}, {3: 20})
+
+@pytest.mark.parametrize('content', [
+    '{"snakes": ',
+    '[1, 2]',
+    '{"snakes": {"ten": 5}}',
+    '{"board_size": 36, "ladders": {"3": 40}}',
+])
+def test_load_errors(tmp_path, content):
+    path = tmp_path / 'bad.json'
+    path.write_text(content)
+    with pytest.raises(BoardConfigError):
+        BoardConfig.load(str(path))
+
+def test_missing_file(tmp_path):
+    with pytest.raises(BoardConfigError):
+        BoardConfig.load(str(tmp_path / 'missing.json'))
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import board_optimizer
+from board_config import BoardConfig
+import markov_analysis
+from rules import compile_rules, parse_rules
+
+@pytest.mark.parametrize('spec', ['classic', 'three-sixes,bounce', 'no-extra-turn'])
+def test_incremental_chains_match_a_fresh_analysis(spec):
+    rules = parse_rules(spec)
+    evaluator = board_optimizer.LayoutEvaluator(30, 2, 3, rules=rules)
+    rng = random.Random(4)
+    current = BoardConfig()
+    evaluator.score(current)
+    for _ in range(40):
+        candidate = board_optimizer.neighbour(current, rng, rules)
+        metrics = evaluator.score(candidate, current)[1]
+        args = (candidate.snakes, candidate.ladders, candidate.board_size)
+        assert metrics['expected_rolls'] == pytest.approx(markov_analysis.expected_rolls(*args, rules=rules))
+        assert metrics['seat_win_rates'] == pytest.approx(
+            markov_analysis.seat_win_rates(*args, total_players=3, rules=rules), abs=1e-9)
+        if rng.random() < 0.7:
+            current = candidate
+    # Later layouts were derived from earlier ones, not solved from scratch
+    assert evaluator.rows_reused > 0
+    assert len(evaluator.chains) <= board_optimizer.CHAIN_CACHE_SIZE
+
+def test_woodbury_update_matches_inverse():
+    # Without extra turns a moved snake head only changes the six rows that can land on it
+    rules = parse_rules('no-extra-turn')
+    parent = markov_analysis.TurnChain(compile_rules(BoardConfig(), rules))
+    moved = BoardConfig({**BoardConfig().snakes, 54: 40})
+    child = markov_analysis.TurnChain(compile_rules(moved, rules), parent)
+    assert 0 < child.rebuilt_rows < child.size
+    assert child.updates == 1
+    assert np.allclose(child.fundamental, np.linalg.inv(np.eye(child.size) - child.q))
+
+def test_expected_turns_counts_turns():
+    chain = markov_analysis.TurnChain(compile_rules(BoardConfig(), parse_rules('classic')))
+    p = chain.turns_to_finish()
+    assert chain.expected_turns() == pytest.approx(np.dot(np.arange(len(p)), p))
+    assert chain.expected_rolls() > chain.expected_turns()
+
+def test_neighbour_needs_something_to_move():
+    with pytest.raises(ValueError):
+        board_optimizer.neighbour(BoardConfig({}, {}), random.Random(0))
+
+def test_main_reports_bad_boards_and_rules(tmp_path, capsys):
+    path = tmp_path / 'broken.json'
+    path.write_text('{"snakes": ')
+    with pytest.raises(SystemExit):
+        board_optimizer.main(['--board', str(path), '--iterations', '1'])
+    assert 'cannot parse' in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        board_optimizer.main(['--rules', 'dice=2', '--iterations', '1'])
+    assert 'never finish' in capsys.readouterr().err
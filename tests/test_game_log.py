@@ -0,0 +1,46 @@
+import pytest
+
+from game_log import GameLog, GameLogWriter
+from rules import parse_rules
+from snake_ladder_engine import SnakeAndLadderEngine
+
+def record(path, rules, seed=11, total_players=3, checkpoint_interval=8):
+    engine = SnakeAndLadderEngine(total_players=total_players, seed=seed, rules=rules)
+    writer = GameLogWriter(path, engine, checkpoint_interval)
+    states = [engine_state(engine)]
+    while not engine.game_over:
+        turn = engine.take_turn()
+        writer.record_turn(turn.dice_value, engine)
+        states.append(engine_state(engine))
+    writer.close()
+    return states
+
+def engine_state(engine):
+    return (dict(engine.player_positions), engine.current_player, engine.turn_count,
+            engine.streak, engine.turn_start, engine.winner)
+
+@pytest.mark.parametrize('spec', ['classic', 'three-sixes,bounce'])
+def test_seek_matches_a_fresh_replay(tmp_path, spec):
+    rules = parse_rules(spec)
+    path = str(tmp_path / 'game.sllog')
+    states = record(path, rules)
+    log = GameLog.load(path)
+    assert len(log) == len(states) - 1
+    assert log.checkpoints
+
+    for turn in range(len(states)):
+        fresh = log.seek(log.new_engine(rules=rules), turn)
+        assert engine_state(fresh) == states[turn], turn
+    # Seeking backwards and forwards on one engine
+    engine = log.new_engine(rules=rules)
+    for turn in (len(states) - 1, 3, len(states) // 2, 0):
+        assert engine_state(log.seek(engine, turn)) == states[turn], turn
+
+def test_replay_needs_the_recorded_board_and_rules(tmp_path):
+    path = str(tmp_path / 'game.sllog')
+    record(path, parse_rules('bounce'))
+    log = GameLog.load(path)
+    with pytest.raises(ValueError):
+        log.new_engine()
+    with pytest.raises(ValueError):
+        log.new_engine(snakes={}, rules=parse_rules('bounce'))
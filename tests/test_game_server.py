@@ -0,0 +1,56 @@
+import asyncio
+import random
+
+from game_server import GameServer
+from rules import parse_rules
+from snake_ladder_engine import SnakeAndLadderEngine
+
+def test_rolls_match_the_engine():
+    rules = parse_rules('bounce,three-sixes')
+    server = GameServer(rules=rules)
+    session = server.new_session(3, seed=7)
+    engine = SnakeAndLadderEngine(total_players=3, rng=random.Random(7), rules=rules)
+    while not engine.game_over:
+        turn = engine.take_turn()
+        expected = (f"TURN {turn.player} {turn.dice_value} {turn.start} {turn.landed} {turn.end} "
+                    f"{int(turn.extra_turn)} {turn.winner or 0}")
+        assert server.roll(session) == expected
+    assert list(session.positions) == [engine.player_positions[i] for i in (1, 2, 3)]
+
+def test_non_ascii_command_gets_an_error_reply():
+    async def exchange():
+        server = GameServer(seed=1)
+        listener = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            replies = []
+            for request in ("NEW 2 5", "RÖLL", "ROLL", "QUIT"):
+                writer.write(request.encode('utf-8') + b"\n")
+                replies.append((await reader.readline()).decode('ascii'))
+            writer.close()
+            return replies
+
+    new, error, roll, bye = asyncio.run(exchange())
+    assert new.startswith("OK ")
+    assert error.startswith("ERR unknown command R")
+    assert roll.startswith("TURN 1 ")
+    assert bye == "BYE\n"
+
+def test_overlong_line_gets_an_error_and_closes():
+    async def exchange():
+        server = GameServer(seed=1)
+        listener = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0, limit=1024)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b"NEW " + b"1" * 4096 + b"\n")
+            reply = await reader.readline()
+            closed = await reader.read() == b""
+            writer.close()
+            return reply, closed, server.stats.connections
+
+    reply, closed, connections = asyncio.run(exchange())
+    assert reply == b"ERR request line too long\n"
+    assert closed
+    assert connections == 0
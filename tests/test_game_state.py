@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from game_state import GameState, SnapshotArchive
+from rules import MAX_FORFEIT_AFTER, parse_rules
+from snake_ladder_engine import SnakeAndLadderEngine
+
+def test_pack_round_trip():
+    state = GameState((12, 99, 0, 100), current_player=3, dice_value=6, game_over=True, winner=4,
+                      turn_count=123456, animation_in_progress=True, dice_rolling=True,
+                      animation_player=2, animation_from=5, animation_to=11, streak=2, turn_start=7)
+    restored = GameState.unpack_from(state.pack())
+    for field in GameState.__slots__:
+        assert getattr(restored, field) == getattr(state, field), field
+
+def test_largest_streak_round_trips():
+    rules = parse_rules(f"forfeit={MAX_FORFEIT_AFTER}")
+    engine = SnakeAndLadderEngine(total_players=1, rules=rules)
+    engine.player_positions[1] = 10
+    for _ in range(MAX_FORFEIT_AFTER - 1):
+        engine.take_turn(6)
+    assert engine.streak == MAX_FORFEIT_AFTER - 1
+    assert GameState.unpack_from(GameState.from_engine(engine).pack()).streak == MAX_FORFEIT_AFTER - 1
+
+def test_engine_round_trip():
+    engine = SnakeAndLadderEngine(total_players=3, rng=random.Random(5), rules=parse_rules('three-sixes'))
+    for _ in range(40):
+        engine.take_turn()
+    restored = SnakeAndLadderEngine(total_players=1, rules=engine.rules)
+    GameState.unpack_from(GameState.from_engine(engine).pack()).apply_to_engine(restored)
+    for name in ('player_positions', 'current_player', 'dice_value', 'game_over', 'winner',
+                 'turn_count', 'streak', 'turn_start'):
+        assert getattr(restored, name) == getattr(engine, name), name
+
+def test_archive(tmp_path):
+    path = str(tmp_path / 'games.slsnap')
+    states = [GameState((i, i + 1), turn_count=i) for i in range(10)]
+    with SnapshotArchive(path) as archive:
+        archive.extend(states)
+        archive[3] = GameState((50, 60), turn_count=99)
+    with SnapshotArchive(path) as archive:
+        assert len(archive) == 10
+        assert archive[-1] == states[-1]
+        assert archive[3].positions == (50, 60)
+        with pytest.raises(IndexError):
+            archive[10]
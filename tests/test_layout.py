@@ -0,0 +1,48 @@
+import pytest
+
+pygame = pytest.importorskip('pygame')
+
+from layout import DESIGN_SIZE, Layout, parse_window_size
+
+def test_design_size_is_identity():
+    layout = Layout(DESIGN_SIZE)
+    assert layout.scale == 1
+    assert layout.point(50, 50) == (50, 50)
+    assert layout.rect(600, 150, 80, 80) == pygame.Rect(600, 150, 80, 80)
+
+def test_scales_uniformly_to_the_window():
+    layout = Layout((1600, 1200))
+    assert layout.scale == 2
+    assert layout.rect(50, 50, 500, 500) == pygame.Rect(100, 100, 1000, 1000)
+    assert layout.scaled(30) == 60
+
+def test_other_aspect_ratios_are_letterboxed():
+    wide = Layout((1600, 600))
+    assert wide.scale == 1
+    assert wide.origin == (400, 0)
+    assert wide.point(0, 0) == (400, 0)
+    assert wide.point(*DESIGN_SIZE) == (1200, 600)
+    tall = Layout((400, 600))
+    assert tall.scale == 0.5
+    assert tall.point(0, 0) == (0, 150)
+    assert tall.point(*DESIGN_SIZE) == (400, 450)
+
+def test_adjacent_rects_share_edges():
+    layout = Layout((1000, 750))
+    left, right = layout.rect(0, 0, 33, 10), layout.rect(33, 0, 33, 10)
+    assert left.right == right.left
+    assert Layout((400, 300)).scaled(1) == 1  # Lines never vanish when scaled down
+
+def test_layouts_compare_by_size():
+    assert Layout((1024, 768)) == Layout((1024, 768))
+    assert hash(Layout((1024, 768))) == hash(Layout((1024, 768)))
+    assert Layout((1024, 768)) != Layout((800, 600))
+
+@pytest.mark.parametrize('text, size', [('800x600', (800, 600)), ('1920X1080', (1920, 1080))])
+def test_parse_window_size(text, size):
+    assert parse_window_size(text) == size
+
+@pytest.mark.parametrize('text', ['800', '800x600x2', 'widex600', '200x100'])
+def test_parse_window_size_rejects(text):
+    with pytest.raises(ValueError):
+        parse_window_size(text)
@@ -0,0 +1,47 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from batch_simulator import simulate_games, summarize
+from board_config import DEFAULT_LADDERS, DEFAULT_SNAKES
+import markov_analysis
+from rules import parse_rules
+
+GAMES = 200000
+
+@pytest.mark.parametrize('spec', ['classic', 'bounce,no-entry'])
+def test_expected_rolls_match_simulation(spec):
+    rules = parse_rules(spec)
+    analysis = markov_analysis.analyze_board(DEFAULT_SNAKES, DEFAULT_LADDERS, rules=rules)
+    assert analysis.expected_rolls == pytest.approx(
+        markov_analysis.expected_rolls(DEFAULT_SNAKES, DEFAULT_LADDERS, rules=rules))
+    assert analysis.roll_distribution.sum() == pytest.approx(1.0)
+
+    result = simulate_games(GAMES, total_players=1, seed=1, rules=rules)
+    stats = summarize(result, 1)
+    assert stats['unfinished'] == 0
+    # Well over four standard errors of the simulated mean
+    assert stats['mean_turns'] == pytest.approx(analysis.expected_rolls, abs=0.5)
+
+@pytest.mark.parametrize('spec', ['classic', 'three-sixes'])
+def test_seat_win_rates_match_simulation(spec):
+    rules = parse_rules(spec)
+    rates = markov_analysis.seat_win_rates(DEFAULT_SNAKES, DEFAULT_LADDERS, total_players=3, rules=rules)
+    assert sum(rates) == pytest.approx(1.0)
+
+    stats = summarize(simulate_games(GAMES, total_players=3, seed=2, rules=rules), 3)
+    assert stats['win_rate'] == pytest.approx(rates, abs=0.01)
+
+def test_forfeit_rules_need_the_turn_chain():
+    with pytest.raises(ValueError):
+        markov_analysis.analyze_board(DEFAULT_SNAKES, DEFAULT_LADDERS, rules=parse_rules('three-sixes'))
+    assert markov_analysis.expected_rolls(DEFAULT_SNAKES, DEFAULT_LADDERS,
+                                          rules=parse_rules('three-sixes')) > 0
+
+def test_large_boards_without_scipy_fail_clearly(monkeypatch):
+    monkeypatch.setattr(markov_analysis, 'scipy', None)
+    markov_analysis.clear_cache()
+    size = markov_analysis.DENSE_MAX_CELLS + 1
+    with pytest.raises(ValueError, match='needs SciPy'):
+        markov_analysis.expected_rolls({}, {}, size)
+    markov_analysis.clear_cache()
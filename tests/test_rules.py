@@ -0,0 +1,43 @@
+import argparse
+
+import pytest
+
+from board_config import BoardConfig
+from rules import (CLASSIC_RULES, FORFEIT, MAX_FORFEIT_AFTER, RulesError, add_rules_argument,
+                   compile_rules, parse_rules, roll_probabilities, rules_spec)
+
+@pytest.mark.parametrize('spec', ['classic', 'bounce,three-sixes', 'no-entry,dice=2,bounce',
+                                  'entry=5,extra=4,forfeit=2', 'no-extra-turn'])
+def test_spec_round_trip(spec):
+    rules = parse_rules(spec)
+    assert parse_rules(rules_spec(rules)) == rules
+
+@pytest.mark.parametrize('spec', ['frob', 'dice=x', 'dice=4', 'entry=7', 'no-extra-turn,forfeit=2',
+                                  'forfeit=0', f"forfeit={MAX_FORFEIT_AFTER + 1}"])
+def test_invalid_variants(spec):
+    with pytest.raises(RulesError):
+        parse_rules(spec)
+
+def test_unfinishable_variant_is_rejected():
+    # Two dice can never roll the 1 needed from cell 99
+    with pytest.raises(RulesError):
+        compile_rules(BoardConfig(), parse_rules('dice=2'))
+
+def test_rules_option_rejects_unfinishable_variants(capsys):
+    parser = argparse.ArgumentParser()
+    add_rules_argument(parser)
+    assert parser.parse_args([]).rules == CLASSIC_RULES
+    assert parser.parse_args(['--rules', 'dice=2,bounce']).rules.dice == 2
+    with pytest.raises(SystemExit):
+        parser.parse_args(['--rules', 'dice=2'])
+    assert 'can never finish' in capsys.readouterr().err
+
+def test_streak_table_forfeits():
+    table = compile_rules(BoardConfig(), parse_rules('three-sixes'))
+    assert table.streak == [[0] * 6 + [1], [0] * 6 + [2], [0] * 6 + [FORFEIT]]
+
+def test_roll_probabilities():
+    probabilities = roll_probabilities(2)
+    assert sum(probabilities) == pytest.approx(1.0)
+    assert probabilities[7] == pytest.approx(6 / 36)
+    assert probabilities[1] == 0
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from rules import parse_rules
+from snake_ladder_engine import SnakeAndLadderEngine
+
+def make_engine(spec='classic', positions=(0, 0), current_player=1):
+    engine = SnakeAndLadderEngine(total_players=len(positions), rules=parse_rules(spec))
+    engine.player_positions = {player: cell for player, cell in enumerate(positions, 1)}
+    engine.current_player = current_player
+    return engine
+
+def test_classic_needs_a_six_to_enter():
+    engine = make_engine()
+    turn = engine.take_turn(3)
+    assert (turn.start, turn.landed, turn.end, turn.extra_turn) == (0, 0, 0, False)
+    assert engine.current_player == 2
+
+def test_classic_six_enters_takes_ladder_and_rolls_again():
+    engine = make_engine()
+    turn = engine.take_turn(6)
+    assert (turn.landed, turn.end, turn.hops, turn.extra_turn) == (1, 38, [38], True)
+    assert engine.current_player == 1
+
+def test_classic_snake():
+    turn = make_engine(positions=(16, 0)).take_turn(1)
+    assert (turn.landed, turn.end, turn.hops) == (17, 7, [7])
+
+def test_classic_overshoot_stays_put():
+    turn = make_engine(positions=(97, 0)).take_turn(5)
+    assert (turn.landed, turn.end, turn.winner) == (97, 97, None)
+
+def test_reaching_the_last_cell_wins():
+    engine = make_engine(positions=(97, 0))
+    turn = engine.take_turn(3)
+    assert (turn.end, turn.winner, turn.extra_turn) == (100, 1, False)
+    assert engine.game_over
+    with pytest.raises(RuntimeError):
+        engine.take_turn(1)
+
+def test_bounce():
+    turn = make_engine('bounce', positions=(98, 0)).take_turn(5)
+    assert (turn.landed, turn.end) == (97, 97)
+
+def test_no_entry_moves_in_by_the_roll():
+    turn = make_engine('no-entry').take_turn(3)
+    assert (turn.landed, turn.end) == (3, 3)
+
+def test_entry_roll():
+    engine = make_engine('entry=5')
+    assert engine.take_turn(6).end == 0
+    assert engine.take_turn(5).end == 38
+
+def test_no_extra_turn():
+    engine = make_engine('no-extra-turn', positions=(10, 0))
+    assert not engine.take_turn(6).extra_turn
+    assert engine.current_player == 2
+
+def test_extra_turn_roll():
+    engine = make_engine('extra=5', positions=(10, 0))
+    assert engine.take_turn(5).extra_turn
+    assert not engine.take_turn(6).extra_turn
+    assert engine.current_player == 2
+
+def test_three_sixes_forfeit_the_turn():
+    engine = make_engine('three-sixes', positions=(10, 0))
+    assert engine.take_turn(6).end == 16
+    assert engine.take_turn(6).end == 22
+    turn = engine.take_turn(6)
+    assert (turn.landed, turn.end, turn.extra_turn) == (22, 10, False)
+    assert engine.player_positions[1] == 10
+    assert engine.current_player == 2
+    assert engine.streak == 0
+
+def test_forfeit_after():
+    engine = make_engine('forfeit=1', positions=(10, 0))
+    turn = engine.take_turn(6)
+    assert (turn.end, turn.extra_turn) == (10, False)
+
+def test_two_dice():
+    engine = make_engine('dice=2,bounce', positions=(10, 0))
+    turn = engine.take_turn(12)
+    assert (turn.landed, turn.end) == (22, 22)
+    assert 2 <= engine.roll_dice() <= 12
+
+def test_seeded_games_repeat():
+    first = SnakeAndLadderEngine(rng=random.Random(3))
+    second = SnakeAndLadderEngine(rng=random.Random(3))
+    assert first.play() == second.play()
+    assert first.player_positions == second.player_positions
+    assert first.turn_count == second.turn_count
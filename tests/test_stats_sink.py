@@ -0,0 +1,74 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from board_config import BoardConfig
+import stats_sink
+from stats_sink import TurnRecorder
+
+def test_chained_jumps_are_all_counted():
+    # Ladder 3->20 ends on the snake 20->5, which ends on the ladder 5->30
+    board = BoardConfig({20: 5}, {3: 20, 5: 30}, 36)
+    recorder = TurnRecorder(board, n_games=1, total_players=2, first_game=0)
+    landed = np.array([3, 5, 20, 4])
+    for seat, cell in enumerate(landed):
+        recorder(np.array([0]), np.array([seat % 2]), np.array([1]), np.array([0]),
+                 np.array([0]), np.array([cell]), np.array([board.jump_table[cell]]))
+    # Seat 1 landed on 3 (ladder, snake, ladder) and 20 (snake, ladder); seat 2 on 5 and 4
+    assert recorder.counts['snakes'].tolist() == [[2, 0]]
+    assert recorder.counts['ladders'].tolist() == [[3, 1]]
+    assert recorder.counts['rolls'].tolist() == [[2, 2]]
+
+def read_run(directory):
+    tables = {}
+    for path in sorted(directory.glob('*-*.npz')):
+        with np.load(path) as chunk:
+            tables[path.name] = {name: chunk[name] for name in chunk.files}
+    return tables
+
+def test_resumed_run_matches_an_uninterrupted_one(tmp_path, monkeypatch):
+    settings = dict(n_games=500, total_players=3, seed=4, batch_games=100, turn_records=True, chunk_rows=300)
+    whole = stats_sink.stream_games(directory=str(tmp_path / 'whole'), **settings)
+
+    commit_batch = stats_sink.StatsSink.commit_batch
+
+    def interrupted(self, result, recorder, first_game):
+        if self.batches_done == 2:
+            recorder.flush()  # Some turn records of the third batch reach the disk first
+            raise KeyboardInterrupt
+        commit_batch(self, result, recorder, first_game)
+
+    resumed_dir = tmp_path / 'resumed'
+    monkeypatch.setattr(stats_sink.StatsSink, 'commit_batch', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        stats_sink.stream_games(directory=str(resumed_dir), **settings)
+    assert stats_sink.load_manifest(str(resumed_dir))['batches_done'] == 2
+    assert any(path.name.startswith('turns-000002') for path in resumed_dir.iterdir())
+    monkeypatch.setattr(stats_sink.StatsSink, 'commit_batch', commit_batch)
+
+    with pytest.raises(SystemExit):
+        stats_sink.stream_games(directory=str(resumed_dir), **settings)
+    with pytest.raises(SystemExit):
+        stats_sink.stream_games(directory=str(resumed_dir), resume=True, **{**settings, 'seed': 5})
+    resumed = stats_sink.stream_games(directory=str(resumed_dir), resume=True, **settings)
+
+    assert resumed.to_dict() == whole.to_dict()
+    expected, actual = read_run(tmp_path / 'whole'), read_run(resumed_dir)
+    assert expected.keys() == actual.keys()
+    for name, columns in expected.items():
+        for column, values in columns.items():
+            assert np.array_equal(actual[name][column], values), (name, column)
+    assert not list(resumed_dir.glob('*.tmp'))
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / 'manifest.json'
+    stats_sink.write_atomic(str(path), lambda f: f.write(b'old'))
+
+    def failing(f):
+        f.write(b'half of the new')
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        stats_sink.write_atomic(str(path), failing)
+    assert path.read_bytes() == b'old'
+    assert [p.name for p in tmp_path.iterdir()] == ['manifest.json']
@@ -0,0 +1,43 @@
+import pytest
+
+pygame = pytest.importorskip('pygame')
+
+from snake_and_ladder_gui import TextCache
+
+class CountingFont:
+    def __init__(self):
+        self.rendered = []
+
+    def render(self, text, antialias, color):
+        self.rendered.append(text)
+        return pygame.Surface((len(text) + 1, 10))
+
+def test_repeated_text_hits():
+    cache = TextCache()
+    font = CountingFont()
+    first = cache.render(font, 'Player 1', (0, 0, 0))
+    assert cache.render(font, 'Player 1', (0, 0, 0)) is first
+    assert font.rendered == ['Player 1']
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1}
+
+def test_colour_and_font_are_part_of_the_key():
+    cache = TextCache()
+    font, other = CountingFont(), CountingFont()
+    cache.render(font, 'Roll', (0, 0, 0))
+    cache.render(font, 'Roll', (255, 0, 0))
+    cache.render(other, 'Roll', (0, 0, 0))
+    assert cache.misses == 3
+    assert cache.hits == 0
+
+def test_least_recently_used_text_is_evicted():
+    cache = TextCache(max_size=2)
+    font = CountingFont()
+    cache.render(font, 'a', (0, 0, 0))
+    cache.render(font, 'b', (0, 0, 0))
+    cache.render(font, 'a', (0, 0, 0))
+    cache.render(font, 'c', (0, 0, 0))  # Evicts 'b', the least recently used
+    assert cache.evictions == 1
+    cache.render(font, 'a', (0, 0, 0))
+    cache.render(font, 'b', (0, 0, 0))
+    assert font.rendered == ['a', 'b', 'c', 'b']
+    assert cache.stats()['size'] == 2
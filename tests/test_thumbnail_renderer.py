@@ -0,0 +1,33 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+pytest.importorskip('pygame')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_render_all_with_two_workers_exits(tmp_path):
+    # Run in a child process so a pool that never shuts down fails the test instead of hanging it
+    script = textwrap.dedent(f"""
+        from board_config import BoardConfig
+        from thumbnail_renderer import chunked, render_all
+
+        board = BoardConfig()
+        frames = [((cell, 1), {str(tmp_path)!r} + f"/frame-{{cell:03d}}.png") for cell in range(1, 9)]
+        print(render_all(chunked(board, frames, size=2), size=32, supersample=1, workers=2))
+    """)
+    child = subprocess.Popen([sys.executable, '-c', script], cwd=ROOT, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, text=True, start_new_session=True)
+    try:
+        stdout, stderr = child.communicate(timeout=60)
+    except subprocess.TimeoutExpired:
+        os.killpg(child.pid, signal.SIGKILL)
+        child.communicate()
+        pytest.fail("render_all did not return after all the thumbnails were written")
+    assert child.returncode == 0, stderr
+    assert stdout.split()[-1] == '8'
+    assert len(list(tmp_path.glob('frame-*.png'))) == 8
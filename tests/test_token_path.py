@@ -0,0 +1,46 @@
+import pytest
+
+from token_path import (MAX_JUMP_MS, MIN_JUMP_MS, STEP_MS, build_path, quadratic_bezier,
+                        walk_cells)
+
+CELL_SIZE = 10
+# Cells on a straight line, CELL_SIZE apart
+CENTERS = {cell: (cell * CELL_SIZE, 0.0) for cell in range(101)}
+
+def test_walk_cells():
+    assert walk_cells(0, 6, 100) == [1, 2, 3, 4, 5, 6]
+    assert walk_cells(97, 99, 100) == [97, 98, 99]
+    # A bounce goes up to the last cell and back
+    assert walk_cells(98, 97, 100) == [98, 99, 100, 99, 98, 97]
+
+def test_each_cell_takes_one_step():
+    path = build_path(CENTERS, 100, 10, 14, 14, None, CELL_SIZE)
+    assert path.duration == 4 * STEP_MS
+    for step, cell in enumerate(range(10, 15)):
+        assert path.point_at(step * STEP_MS) == pytest.approx(CENTERS[cell])
+    # Eased legs: a quarter of the way through a step is less than a quarter of a cell
+    assert CENTERS[10][0] < path.point_at(STEP_MS / 4)[0] < CENTERS[10][0] + CELL_SIZE / 4
+    assert path.point_at(STEP_MS / 2) == pytest.approx((CENTERS[10][0] + CELL_SIZE / 2, 0.0))
+
+def test_position_depends_only_on_elapsed_time():
+    path = build_path(CENTERS, 100, 3, 8, 8, None, CELL_SIZE)
+    fine = [path.point_at(t) for t in range(0, path.duration + 1, 7)]
+    coarse = [path.point_at(t) for t in range(0, path.duration + 1, 7 * 5)]
+    # A lower frame rate samples the same curve, it doesn't slow the token down
+    assert fine[::5] == coarse
+    assert path.point_at(-50) == CENTERS[3]
+    assert path.point_at(path.duration) == path.point_at(path.duration * 10) == CENTERS[8]
+
+def test_jump_time_grows_with_distance_within_limits():
+    def jump_ms(landed, end):
+        jump = quadratic_bezier(CENTERS[landed], (CENTERS[landed][0], 50.0), CENTERS[end])
+        return build_path(CENTERS, 100, landed - 1, landed, end, jump, CELL_SIZE).duration - STEP_MS
+
+    assert jump_ms(10, 12) == MIN_JUMP_MS
+    assert MIN_JUMP_MS < jump_ms(10, 30) < jump_ms(10, 40) < MAX_JUMP_MS
+    assert jump_ms(2, 99) == MAX_JUMP_MS
+
+def test_staying_put_is_a_still_path():
+    path = build_path(CENTERS, 100, 97, 97, 97, None, CELL_SIZE)
+    assert path.duration == 1
+    assert path.point_at(0) == path.point_at(1) == CENTERS[97]
@@ -0,0 +1,24 @@
+from rules import parse_rules
+from tournament import TournamentStats, play_chunk, run_tournament, stream_seed
+
+def test_streams_differ():
+    seeds = {stream_seed(7, index) for index in range(100)}
+    assert len(seeds) == 100
+    assert stream_seed(7, 0) == stream_seed(7, 0)
+    assert stream_seed(7, 0) != stream_seed(8, 0)
+
+def test_fixed_seed_repeats_whatever_the_worker_count():
+    rules = parse_rules('three-sixes')
+    serial = run_tournament(600, 3, seed=11, workers=1, chunk_size=100, rules=rules).summary()
+    assert run_tournament(600, 3, seed=11, workers=1, chunk_size=100, rules=rules).summary() == serial
+    assert run_tournament(600, 3, seed=11, workers=2, chunk_size=100, rules=rules).summary() == serial
+    assert run_tournament(600, 3, seed=12, workers=1, chunk_size=100, rules=rules).summary() != serial
+
+def test_chunks_merge_into_the_whole():
+    tasks = [(5, index, 50, 2, 100000, parse_rules('classic')) for index in range(3)]
+    merged = TournamentStats(2)
+    for task in tasks:
+        merged.merge(play_chunk(task))
+    assert merged.summary() == run_tournament(150, 2, seed=5, workers=1, chunk_size=50).summary()
+    assert merged.games == 150
+    assert sum(merged.wins) + merged.unfinished == 150
@@ -0,0 +1,63 @@
+import pytest
+
+pygame = pytest.importorskip('pygame')
+
+from widgets import DISABLED, HIDDEN, LOOKUP_CELL_SIZE, NORMAL, Button, WidgetLayer
+
+COLORS = {NORMAL: ((0, 0, 255), (255, 255, 255)), DISABLED: ((128, 128, 128), (0, 0, 0))}
+
+class Font:
+    def __init__(self):
+        self.rendered = 0
+
+    def render(self, text, antialias, color):
+        self.rendered += 1
+        return pygame.Surface((len(text), 8))
+
+def make_button(rect, clicks, name, state=None, font=None):
+    return Button(rect, name, font or Font(), COLORS, lambda: clicks.append(name), state)
+
+def test_hit_testing_covers_the_whole_rect_across_grid_cells():
+    layer = WidgetLayer()
+    clicks = []
+    # Straddles several lookup cells
+    button = layer.add(make_button((LOOKUP_CELL_SIZE - 10, 30, 150, 50), clicks, 'roll'))
+    rect = button.rect
+    for pos in (rect.topleft, (rect.right - 1, rect.bottom - 1),
+                (2 * LOOKUP_CELL_SIZE, 60), (LOOKUP_CELL_SIZE, 79)):
+        assert layer.widget_at(pos) is button, pos
+    # Right and bottom edges are outside, as in pygame.Rect
+    for pos in ((rect.right, 40), (rect.left, rect.bottom), (rect.left - 1, 40), (500, 500)):
+        assert layer.widget_at(pos) is None, pos
+    assert layer.click(rect.center)
+    assert clicks == ['roll']
+
+def test_topmost_shown_widget_wins():
+    layer = WidgetLayer()
+    clicks = []
+    shown = {'top': NORMAL}
+    bottom = layer.add(make_button((0, 0, 100, 100), clicks, 'bottom'))
+    top = layer.add(make_button((50, 50, 100, 100), clicks, 'top', lambda: shown['top']))
+    assert layer.widget_at((75, 75)) is top
+    assert layer.widget_at((25, 25)) is bottom
+    shown['top'] = HIDDEN
+    assert layer.widget_at((75, 75)) is bottom
+    assert layer.widget_at((125, 125)) is None
+    layer.click((75, 75))
+    assert clicks == ['bottom']
+
+def test_disabled_widgets_swallow_clicks():
+    layer = WidgetLayer()
+    clicks = []
+    button = layer.add(make_button((10, 10, 40, 20), clicks, 'reset', lambda: DISABLED))
+    assert layer.widget_at((20, 20)) is button
+    assert not layer.click((20, 20))
+    assert clicks == []
+
+def test_images_are_rendered_once_per_state():
+    font = Font()
+    button = make_button((0, 0, 40, 20), [], 'roll', font=font)
+    assert button.image(NORMAL) is button.image(NORMAL)
+    assert button.image(DISABLED) is not button.image(NORMAL)
+    assert font.rendered == 2
+    assert button.image(NORMAL).get_size() == (40, 20)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Render PNG thumbnails of board layouts and recorded game states in parallel.
+
+Uses the GUI's own draw_board/draw_players under SDL's dummy video
+driver, so previews look exactly like the game, without a display. Work
+is split across a process pool. Each worker keeps one off-screen GUI per
+board size for its whole life, so fonts, the dice, the token path cache
+and the canvas and thumbnail surfaces are created once per worker, not
+per image. Static layers are cached at two levels:
+
+- the cell grid, with its numbers, is shared by every layout of a size
+- the board layer (the grid plus snakes and ladders) is reused for every
+  snapshot of one game; snapshots are sent to workers in runs of
+  FRAMES_PER_TASK on the same board, so this layer is drawn once per run
+
+Each image is drawn at SUPERSAMPLE times the thumbnail size and smoothly
+scaled down, so thin ladders and snakes stay legible.
+
+Example:
+    python thumbnail_renderer.py boards/*.json --output previews
+    python thumbnail_renderer.py --log game.sllog --every 10 --output previews
+    python thumbnail_renderer.py --snapshots saved.slsnap --board boards/classic.json --output previews
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import time
+
+# Must be set before pygame creates a window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+# SDL's own SIGTERM handler would keep pool workers alive when the pool is torn down
+os.environ['SDL_NO_SIGNAL_HANDLERS'] = '1'
+
+import pygame
+
+from board_config import BoardConfig, BoardConfigError
+from game_log import GameLog
+from game_state import SnapshotArchive
+from rules import CLASSIC_RULES, RulesError, add_rules_argument, compile_rules
+from snake_and_ladder_gui import BOARD_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH, SnakeAndLadderGUI
+
+DEFAULT_SIZE = 256
+SUPERSAMPLE = 2
+FRAMES_PER_TASK = 50
+
+class ThumbnailRenderer:
+    """Draws boards off screen and saves them as PNG files, reusing every surface it can."""
+
+    def __init__(self, size=DEFAULT_SIZE, supersample=SUPERSAMPLE, rules=CLASSIC_RULES):
+        self.size = size
+        self.supersample = supersample
+        self.rules = rules
+        self.guis = {}  # board size -> GUI drawing into an off-screen canvas
+        self.thumbnail = None
+
+    def gui_for(self, board):
+        """Return the GUI for the board's size, switched to the board's layout."""
+        gui = self.guis.get(board.board_size)
+        if gui is None:
+            # A window just big enough that the board is drawn at the supersampled size
+            scale = self.size * self.supersample / BOARD_SIZE
+            window_size = (math.ceil(SCREEN_WIDTH * scale), math.ceil(SCREEN_HEIGHT * scale))
+            # No disk cache: its dice and board entries are sized for the real window
+            gui = SnakeAndLadderGUI(board=board, window_size=window_size, rules=self.rules, seed=0)
+            gui.show_menu = False
+            gui.bake_board = False
+            # Zoom out to the whole board, however many cells it has
+            viewport = gui.viewport
+            viewport.zoom = viewport.min_zoom
+            viewport.clamp()
+            # Draw into a canvas the size of the board instead of the window
+            gui.screen = pygame.Surface((viewport.width, viewport.height))
+            gui.board_x = gui.board_y = 0
+            self.guis[board.board_size] = gui
+        elif gui.snakes != board.snakes or gui.ladders != board.ladders:
+            gui.apply_board(board)
+        if self.thumbnail is None:
+            self.thumbnail = pygame.Surface((self.size, self.size), 0, gui.screen)
+        return gui
+
+    def render(self, board, positions=None):
+        """Draw a board, with tokens at positions (cell per player) if given; return the thumbnail."""
+        gui = self.gui_for(board)
+        gui.player_positions = {player: cell for player, cell in enumerate(positions or (), 1)}
+        gui.draw_board()
+        gui.draw_players()
+        pygame.transform.smoothscale(gui.screen, (self.size, self.size), self.thumbnail)
+        return self.thumbnail
+
+    def save(self, board, positions, path):
+        """Render and write a PNG atomically, so an interrupted run never leaves a partial image."""
+        surface = self.render(board, positions)
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, 'wb') as f:
+            pygame.image.save(surface, f, 'png')
+        os.replace(temp, path)
+
+_renderer = None
+
+def init_worker(size, supersample, rules):
+    """Pool initializer: one renderer per worker process, kept for all its tasks."""
+    global _renderer
+    _renderer = ThumbnailRenderer(size, supersample, rules)
+
+def render_task(task):
+    """Render a run of frames on one board; return how many were written."""
+    board, frames = task
+    for positions, path in frames:
+        _renderer.save(board, positions, path)
+    return len(frames)
+
+def log_frames(path, board, rules, every, output):
+    """Return (positions, png path) after every `every` rolls of a game log, and at its end."""
+    log = GameLog.load(path)
+    engine = log.new_engine(board.snakes, board.ladders, rules)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    frames = []
+    for turn in range(len(log) + 1):
+        if turn % every == 0 or turn == len(log):
+            positions = tuple(engine.player_positions[i + 1] for i in range(engine.total_players))
+            frames.append((positions, os.path.join(output, f"{stem}-{turn:05d}.png")))
+        if turn < len(log):
+            engine.take_turn(log.dice[turn])
+    return frames
+
+def archive_frames(path, board, every, output):
+    """Return (positions, png path) for every `every`-th state of a snapshot archive."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    frames = []
+    with SnapshotArchive(path) as archive:
+        for index in range(0, len(archive), every):
+            positions = archive[index].positions
+            if max(positions) > board.board_size:
+                raise ValueError(f"state {index} has a token beyond cell {board.board_size}; "
+                                 f"was it saved on another board?")
+            frames.append((positions, os.path.join(output, f"{stem}-{index:06d}.png")))
+    return frames
+
+def chunked(board, frames, size=FRAMES_PER_TASK):
+    return [(board, frames[start:start + size]) for start in range(0, len(frames), size)]
+
+def render_all(tasks, size=DEFAULT_SIZE, supersample=SUPERSAMPLE, workers=None, rules=CLASSIC_RULES):
+    """Render every task across a process pool and return the number of images written."""
+    if workers == 1:
+        init_worker(size, supersample, rules)
+        return sum(render_task(task) for task in tasks)
+
+    written = 0
+    with multiprocessing.Pool(processes=workers, initializer=init_worker,
+                              initargs=(size, supersample, rules)) as pool:
+        for count in pool.imap_unordered(render_task, tasks):
+            written += count
+        # Let the workers exit on their own rather than terminate() them on leaving the block
+        pool.close()
+        pool.join()
+    return written
+
+def load_board(path, rules):
+    """Load a board file (None for the classic board) and check it is playable under the rules."""
+    try:
+        board = BoardConfig.load(path) if path else BoardConfig(name='classic')
+        compile_rules(board, rules)
+    except (BoardConfigError, RulesError) as e:
+        raise SystemExit(f"{path or 'classic board'}: {e}")
+    if math.isqrt(board.board_size) ** 2 != board.board_size:
+        raise SystemExit(f"{path or 'classic board'}: thumbnails need a square board, "
+                         f"got {board.board_size} cells")
+    return board
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render PNG thumbnails of board layouts and recorded "
+                                                 "game states")
+    parser.add_argument('layouts', nargs='*', metavar='BOARD', help="board files to render")
+    parser.add_argument('--log', action='append', default=[], metavar='LOG',
+                        help="render snapshots of a recorded game log (repeatable)")
+    parser.add_argument('--snapshots', action='append', default=[], metavar='ARCHIVE',
+                        help="render the states in a snapshot archive (repeatable)")
+    parser.add_argument('--board', default=None,
+                        help="board the logs and snapshots were played on (default: the classic board)")
+    parser.add_argument('--every', type=int, default=1, metavar='N',
+                        help="render every Nth roll of a log or state of an archive")
+    parser.add_argument('--output', required=True, metavar='DIR', help="directory for the PNG files")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE, help="thumbnail width and height in pixels")
+    parser.add_argument('--supersample', type=int, default=SUPERSAMPLE,
+                        help="draw at this multiple of --size, then scale down")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    add_rules_argument(parser)
+    args = parser.parse_args(argv)
+    if not (args.layouts or args.log or args.snapshots):
+        parser.error("give board files, --log or --snapshots to render")
+    if args.every < 1 or args.size < 1 or args.supersample < 1:
+        parser.error("--every, --size and --supersample must be at least 1")
+
+    os.makedirs(args.output, exist_ok=True)
+    tasks = []
+    for path in args.layouts:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        tasks.append((load_board(path, args.rules), [(None, os.path.join(args.output, f"{stem}.png"))]))
+    if args.log or args.snapshots:
+        board = load_board(args.board, args.rules)
+        for path in args.log:
+            try:
+                frames = log_frames(path, board, args.rules, args.every, args.output)
+            except (OSError, ValueError) as e:
+                raise SystemExit(f"{path}: {e}")
+            tasks.extend(chunked(board, frames))
+        for path in args.snapshots:
+            try:
+                frames = archive_frames(path, board, args.every, args.output)
+            except (OSError, ValueError) as e:
+                raise SystemExit(f"{path}: {e}")
+            tasks.extend(chunked(board, frames))
+
+    started = time.perf_counter()
+    written = render_all(tasks, args.size, args.supersample, args.workers, args.rules)
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {written} thumbnails to {args.output} in {elapsed:.2f} s "
+          f"({written / elapsed:.1f} per second, {args.workers} workers)")
+
+if __name__ == "__main__":
+    main()
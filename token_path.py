@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Timed movement paths for animating a token through one move.
+
+A move is a walk from the start cell to the cell the roll landed on, one
+cell at a time along the zigzag (up to the last cell and back when the
+rules bounce), followed by the jump to the final cell: along the snake's
+curve, up the ladder, or straight back for a forfeited turn.
+
+A TokenPath is built once per move from board coordinates and answers
+point_at(elapsed_ms) with a couple of bisections, so the GUI places the
+token from the time since the move started rather than by stepping it
+each frame: the token moves at the same speed at any frame rate, and a
+dropped frame only skips ahead.
+"""
+import bisect
+import math
+
+STEP_MS = 140  # Time to walk one cell
+JUMP_MS_PER_CELL = 25  # Snake and ladder jumps take longer the further they go
+MIN_JUMP_MS = 350
+MAX_JUMP_MS = 1200
+BEZIER_STEPS = 20
+
+def quadratic_bezier(start, control, end, steps=BEZIER_STEPS):
+    """Return steps + 1 points along a quadratic Bezier curve."""
+    points = []
+    for i in range(steps + 1):
+        t = i / steps
+        x = (1 - t) ** 2 * start[0] + 2 * (1 - t) * t * control[0] + t ** 2 * end[0]
+        y = (1 - t) ** 2 * start[1] + 2 * (1 - t) * t * control[1] + t ** 2 * end[1]
+        points.append((x, y))
+    return points
+
+def walk_cells(start, landed, board_size):
+    """Return the cells a token steps through from start to landed (cell 0 is off the board)."""
+    if landed >= start:
+        return list(range(max(start, 1), landed + 1))
+    # Only a bounce lands behind the start: up to the last cell, then back
+    return list(range(max(start, 1), board_size + 1)) + list(range(board_size - 1, landed - 1, -1))
+
+def ease_in_out(t):
+    return t * t * (3 - 2 * t)
+
+class TokenPath:
+    """A move as consecutive legs, each a polyline traversed in a fixed time."""
+
+    def __init__(self, legs):
+        # legs: [(points, duration_ms)]; each leg is eased, so the token
+        # settles briefly on every cell it passes
+        self.starts = []
+        self.legs = []
+        self.duration = 0
+        for points, duration in legs:
+            lengths = [0.0]
+            for (x0, y0), (x1, y1) in zip(points, points[1:]):
+                lengths.append(lengths[-1] + math.hypot(x1 - x0, y1 - y0))
+            self.starts.append(self.duration)
+            self.legs.append((points, lengths, duration))
+            self.duration += duration
+        self.end_point = self.legs[-1][0][-1]
+
+    def point_at(self, elapsed_ms):
+        """Return the (x, y) board position elapsed_ms after the move started."""
+        if elapsed_ms >= self.duration:
+            return self.end_point
+        elapsed_ms = max(elapsed_ms, 0)
+        index = bisect.bisect_right(self.starts, elapsed_ms) - 1
+        points, lengths, duration = self.legs[index]
+        distance = ease_in_out((elapsed_ms - self.starts[index]) / duration) * lengths[-1]
+        segment = min(max(bisect.bisect_right(lengths, distance) - 1, 0), len(points) - 2)
+        span = lengths[segment + 1] - lengths[segment]
+        t = (distance - lengths[segment]) / span if span else 0.0
+        (x0, y0), (x1, y1) = points[segment], points[segment + 1]
+        return (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t)
+
+def build_path(cell_centers, board_size, start, landed, end, jump_points, cell_size):
+    """Return the TokenPath for a move; jump_points is the landed -> end route when end != landed."""
+    cells = walk_cells(start, landed, board_size)
+    legs = [([cell_centers[a], cell_centers[b]], STEP_MS) for a, b in zip(cells, cells[1:])]
+    if end != landed:
+        (x0, y0), (x1, y1) = jump_points[0], jump_points[-1]
+        cells_jumped = math.hypot(x1 - x0, y1 - y0) / cell_size
+        legs.append((jump_points, min(max(JUMP_MS_PER_CELL * cells_jumped, MIN_JUMP_MS), MAX_JUMP_MS)))
+    if not legs:
+        # Nothing to walk (e.g. an overshoot that stays put)
+        legs.append(([cell_centers[cells[0]]] * 2, 1))
+    return TokenPath(legs)
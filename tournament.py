@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Multi-core tournament runner for Snake and Ladder.
+
+Plays large numbers of simulated games with the headless engine across a
+process pool. Games are split into fixed-size chunks and every chunk gets
+its own RNG stream derived from a single master seed, so a run is
+reproducible for a given seed and chunk size no matter how many worker
+processes are used. Per-chunk results are merged into win rate by seat,
+game length percentiles and extra-turn frequency.
+
+Example:
+    python tournament.py --games 1000000 --players 4 --seed 42
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+from collections import Counter
+
+from rules import CLASSIC_RULES, add_rules_argument
+from snake_ladder_engine import SnakeAndLadderEngine
+
+DEFAULT_CHUNK_SIZE = 10000
+PERCENTILES = (50, 90, 95, 99)
+
+def stream_seed(master_seed, stream_index):
+    """Derive an independent, reproducible seed for one RNG stream."""
+    digest = hashlib.sha256(f"{master_seed}:{stream_index}".encode()).digest()
+    return int.from_bytes(digest[:16], 'big')
+
+class TournamentStats:
+    """Mergeable aggregate statistics for a batch of games."""
+
+    def __init__(self, total_players):
+        self.total_players = total_players
+        self.games = 0
+        self.unfinished = 0
+        self.wins = [0] * total_players
+        self.length_counts = Counter()  # rolls per game -> number of games
+        self.rolls = 0
+        self.extra_turns = 0
+
+    def add_game(self, engine, extra_turns):
+        self.games += 1
+        self.rolls += engine.turn_count
+        self.extra_turns += extra_turns
+        if engine.winner is None:
+            self.unfinished += 1
+            return
+        self.wins[engine.winner - 1] += 1
+        self.length_counts[engine.turn_count] += 1
+
+    def merge(self, other):
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.length_counts.update(other.length_counts)
+        self.rolls += other.rolls
+        self.extra_turns += other.extra_turns
+        return self
+
+    def percentile(self, pct):
+        """Return the game length (in rolls) at the given percentile."""
+        finished = sum(self.length_counts.values())
+        if not finished:
+            return None
+        target = pct / 100 * finished
+        seen = 0
+        for length in sorted(self.length_counts):
+            seen += self.length_counts[length]
+            if seen >= target:
+                return length
+        return max(self.length_counts)
+
+    def summary(self):
+        finished = self.games - self.unfinished
+        return {
+            'games': self.games,
+            'unfinished': self.unfinished,
+            'win_rate_by_seat': {seat + 1: (wins / finished if finished else 0.0)
+                                 for seat, wins in enumerate(self.wins)},
+            'mean_rolls': (sum(k * v for k, v in self.length_counts.items()) / finished
+                           if finished else None),
+            'length_percentiles': {pct: self.percentile(pct) for pct in PERCENTILES},
+            'extra_turns_per_game': self.extra_turns / self.games if self.games else 0.0,
+            'extra_turn_frequency': self.extra_turns / self.rolls if self.rolls else 0.0,
+        }
+
+def play_chunk(task):
+    """Play one chunk of games on its own RNG stream and return its stats."""
+    master_seed, stream_index, n_games, total_players, max_turns, rules = task
+    rng = random.Random(stream_seed(master_seed, stream_index))
+    engine = SnakeAndLadderEngine(total_players=total_players, rng=rng, rules=rules)
+    stats = TournamentStats(total_players)
+    for _ in range(n_games):
+        engine.reset()
+        extra_turns = 0
+        while not engine.game_over and engine.turn_count < max_turns:
+            if engine.take_turn().extra_turn:
+                extra_turns += 1
+        stats.add_game(engine, extra_turns)
+    return stats
+
+def run_tournament(n_games, total_players=2, seed=0, workers=None,
+                   chunk_size=DEFAULT_CHUNK_SIZE, max_turns=100000, rules=CLASSIC_RULES):
+    """Run n_games across a process pool and return the merged TournamentStats."""
+    tasks = []
+    for stream_index, start in enumerate(range(0, n_games, chunk_size)):
+        tasks.append((seed, stream_index, min(chunk_size, n_games - start),
+                      total_players, max_turns, rules))
+
+    stats = TournamentStats(total_players)
+    if workers == 1:
+        for task in tasks:
+            stats.merge(play_chunk(task))
+        return stats
+
+    with multiprocessing.Pool(processes=workers) as pool:
+        for chunk_stats in pool.imap_unordered(play_chunk, tasks):
+            stats.merge(chunk_stats)
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a simulated Snake and Ladder tournament on all cores")
+    parser.add_argument('--games', type=int, default=100000, help="number of games to play")
+    parser.add_argument('--players', type=int, default=2, choices=range(1, 5), help="players per game")
+    parser.add_argument('--seed', type=int, default=0, help="master seed for all RNG streams")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="games per RNG stream / task")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    add_rules_argument(parser)
+    args = parser.parse_args(argv)
+
+    stats = run_tournament(args.games, args.players, args.seed, args.workers, args.chunk_size,
+                           rules=args.rules)
+    summary = stats.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(f"Games: {summary['games']} (unfinished: {summary['unfinished']})")
+    for seat, rate in summary['win_rate_by_seat'].items():
+        print(f"Seat {seat} win rate: {rate:.4f}")
+    print(f"Mean rolls per game: {summary['mean_rolls']:.2f}")
+    for pct, length in summary['length_percentiles'].items():
+        print(f"P{pct} game length: {length} rolls")
+    print(f"Extra turns per game: {summary['extra_turns_per_game']:.2f}")
+    print(f"Extra-turn frequency: {summary['extra_turn_frequency']:.4f} per roll")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Retained UI widgets: buttons rendered once per state, found by position.
+
+Each Button knows its rectangle, its label and a state function that says
+how it should look right now (or None while hidden). Its surface is
+rendered the first time a state is seen and reused after that, so drawing
+a button is one blit and a state change (e.g. the roll button greying out
+while a token moves) costs one render, once.
+
+A WidgetLayer keeps the buttons of the whole GUI in a coarse grid of
+screen cells, so a click looks at the few buttons in its cell instead of
+every button, and never needs anything to be drawn first.
+
+The GUI rebuilds its layer when the layout changes; button rectangles and
+surfaces are fixed in between.
+"""
+import pygame
+
+HIDDEN = None
+NORMAL = 'normal'
+DISABLED = 'disabled'  # Drawn, but clicks are ignored
+SELECTED = 'selected'
+LOOKUP_CELL_SIZE = 64
+
+class Button:
+    """A labelled rectangle with a cached surface for each of its states."""
+
+    def __init__(self, rect, label, font, colors, on_click, state=None):
+        self.rect = pygame.Rect(rect)
+        self.label = label
+        self.font = font
+        self.colors = colors  # {state: (fill color, text color)}
+        self.on_click = on_click
+        self.state = state or (lambda: NORMAL)
+        self.images = {}
+
+    def image(self, state):
+        """Return the button's surface for a state, rendering it the first time."""
+        image = self.images.get(state)
+        if image is None:
+            fill, text_color = self.colors[state]
+            image = pygame.Surface(self.rect.size)
+            image.fill(fill)
+            text = self.font.render(self.label, True, text_color)
+            image.blit(text, text.get_rect(center=image.get_rect().center))
+            self.images[state] = image
+        return image
+
+class WidgetSprite(pygame.sprite.DirtySprite):
+    """Dirty sprite showing a widget, marked dirty only when the widget's state changes."""
+
+    def __init__(self, widget):
+        super().__init__()
+        self.widget = widget
+        self.rect = widget.rect
+        self.image = pygame.Surface(widget.rect.size)
+        self.shown_state = HIDDEN
+        self.visible = 0
+        self.dirty = 0
+
+    def update(self):
+        state = self.widget.state()
+        if state == self.shown_state:
+            return
+        self.shown_state = state
+        if state is HIDDEN:
+            self.visible = 0
+        else:
+            self.visible = 1
+            self.image = self.widget.image(state)
+        self.dirty = 1
+
+class WidgetLayer:
+    """The GUI's widgets with a grid index of their rectangles for click lookup."""
+
+    def __init__(self, cell_size=LOOKUP_CELL_SIZE):
+        self.cell_size = cell_size
+        self.widgets = []
+        self.cells = {}  # (column, row) -> widgets overlapping that grid cell
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        rect = widget.rect
+        for column in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1):
+            for row in range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1):
+                self.cells.setdefault((column, row), []).append(widget)
+        return widget
+
+    def widget_at(self, pos):
+        """Return the topmost shown widget under pos, or None."""
+        candidates = self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size), ())
+        for widget in reversed(candidates):
+            if widget.rect.collidepoint(pos) and widget.state() is not HIDDEN:
+                return widget
+        return None
+
+    def click(self, pos):
+        """Run the click handler of the enabled widget under pos; return True if there was one."""
+        widget = self.widget_at(pos)
+        if widget is None or widget.state() == DISABLED:
+            return False
+        widget.on_click()
+        return True
+
+    def draw(self, surface):
+        """Blit every shown widget in its current state."""
+        for widget in self.widgets:
+            state = widget.state()
+            if state is not HIDDEN:
+                surface.blit(widget.image(state), widget.rect)
+
+    def sprites(self):
+        """Return a dirty sprite per widget for the dirty-rect renderer."""
+        return [WidgetSprite(widget) for widget in self.widgets]